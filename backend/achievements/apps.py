@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AchievementsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'achievements'
+
+    def ready(self):
+        from backend.caching import register_catalogue
+        Skill = self.get_model('Skill')
+        Badge = self.get_model('Badge')
+        # Badge.skill is SET_NULL on Skill delete, which sends no Badge signals
+        register_catalogue(Skill, dependents=[Badge])
+        register_catalogue(Badge)
@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from achievements.models import Skill, Badge
+from backend.caching import VERSION_KEY
+
+User = get_user_model()
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CatalogueCacheTestCase(TestCase):
+    def setUp(self):
+        """Create a student and a small skills catalogue."""
+        cache.clear()
+        self.client = APIClient()
+        self.student = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+        self.skill = Skill.objects.create(name='Python')
+        Badge.objects.create(name='Coder', skill=self.skill)
+        self.client.force_authenticate(user=self.student)
+
+    def test_second_list_is_served_from_cache(self):
+        """Test that a repeated list request is a cache hit with no queries."""
+        first = self.client.get('/api/achievements/skills/')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/achievements/skills/')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+
+    def test_save_invalidates(self):
+        """Test that saving a skill bumps the version and refreshes the list."""
+        self.client.get('/api/achievements/skills/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='SQL')
+        response = self.client.get('/api/achievements/skills/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual([s['name'] for s in response.data], ['Python', 'SQL'])
+
+    def test_skill_delete_invalidates_badges(self):
+        """Test that deleting a skill invalidates badges that referenced it."""
+        response = self.client.get('/api/achievements/badges/')
+        self.assertEqual(response.data[0]['skill'], self.skill.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.skill.delete()
+        response = self.client.get('/api/achievements/badges/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIsNone(response.data[0]['skill'])
+
+    def test_version_is_bumped_after_commit(self):
+        """Test that a write does not invalidate the cache before its transaction commits."""
+        self.client.get('/api/achievements/skills/')
+        with self.captureOnCommitCallbacks() as callbacks:
+            Skill.objects.create(name='SQL')
+            self.assertEqual(self.client.get('/api/achievements/skills/')['X-Cache'], 'HIT')
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.client.get('/api/achievements/skills/')['X-Cache'], 'MISS')
+
+    def test_evicted_version_does_not_revive_old_entries(self):
+        """Test that a version key dropped by the cache does not restart at an old version."""
+        self.client.get('/api/achievements/skills/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='SQL')
+        cache.delete(VERSION_KEY.format(label='achievements.skill'))
+        response = self.client.get('/api/achievements/skills/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual([s['name'] for s in response.data], ['Python', 'SQL'])
+
+    def test_retrieve_is_cached_per_object(self):
+        """Test that detail responses are cached separately from lists."""
+        url = f'/api/achievements/skills/{self.skill.id}/'
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response.data['name'], 'Python')
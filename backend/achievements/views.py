@@ -1,14 +1,15 @@
 from rest_framework import viewsets
+from backend.caching import CatalogueCacheMixin
 from .models import Skill, Badge, Certificate
 from .serializers import SkillSerializer, BadgeSerializer, CertificateSerializer
 
 
-class SkillViewSet(viewsets.ModelViewSet):
+class SkillViewSet(CatalogueCacheMixin, viewsets.ModelViewSet):
     queryset = Skill.objects.all().order_by('name')
     serializer_class = SkillSerializer
 
 
-class BadgeViewSet(viewsets.ModelViewSet):
+class BadgeViewSet(CatalogueCacheMixin, viewsets.ModelViewSet):
     queryset = Badge.objects.all().order_by('name')
     serializer_class = BadgeSerializer
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='engagementlog',
+            index=models.Index(fields=['user', 'timestamp'], name='engagement_user_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='engagementlog',
+            index=models.Index(fields=['timestamp', 'id'], name='engagement_ts_idx'),
+        ),
+    ]
@@ -21,6 +21,12 @@ class EngagementLog(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
     metadata = models.JSONField(default=dict, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'timestamp'], name='engagement_user_ts_idx'),
+            models.Index(fields=['timestamp', 'id'], name='engagement_ts_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.email} {self.action_type} @ {self.timestamp}"
 
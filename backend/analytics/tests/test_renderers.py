@@ -0,0 +1,74 @@
+import io
+import json
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework import status
+from analytics.models import EngagementLog
+from backend import parsers, renderers
+from backend.parsers import FastJSONParser
+from backend.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+
+class FastJSONTestCase(TestCase):
+    def setUp(self):
+        """Create a user with an engagement log carrying nested metadata."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+        EngagementLog.objects.create(
+            user=self.user, action_type='view_project', metadata={'path': '/projects/1/', 'tags': ['a', 'b']}
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_encodes_decimal_datetime_and_uuid(self):
+        """Test that rich types render the same as the stdlib renderer."""
+        data = {
+            'progress_percent': Decimal('42.50'),
+            'last_updated': datetime(2025, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc),
+            'id': uuid.UUID(int=1),
+            'note': 'line break',
+        }
+        fast = FastJSONRenderer().render(data)
+        self.assertEqual(json.loads(fast), json.loads(JSONRenderer().render(data)))
+        self.assertIn(b'\\u2028', fast)
+
+    def test_falls_back_without_orjson(self):
+        """Test that rendering and parsing still work when orjson is unavailable."""
+        with mock.patch.object(renderers, 'orjson', None), mock.patch.object(parsers, 'orjson', None):
+            body = FastJSONRenderer().render({'amount': Decimal('9.99')})
+            self.assertEqual(json.loads(body), {'amount': 9.99})
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(b'{"a": [1, 2]}')), {'a': [1, 2]})
+
+    def test_invalid_json_is_a_parse_error(self):
+        """Test that malformed or non-strict JSON bodies raise ParseError."""
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"a": NaN}'))
+
+    def test_api_round_trip(self):
+        """Test that the API parses JSON bodies and renders list responses with the fast classes."""
+        response = self.client.post(
+            '/api/analytics/engagement-logs/',
+            {'user': self.user.id, 'action_type': 'login', 'metadata': {'client': {'platform': 'web'}}},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.get('/api/analytics/engagement-logs/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        body = json.loads(response.content)
+        self.assertEqual(len(body), 2)
+        self.assertEqual(body[0]['metadata'], {'client': {'platform': 'web'}})
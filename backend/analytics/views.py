@@ -1,16 +1,20 @@
 from rest_framework import viewsets
+from backend.conditional import ConditionalGetMixin
 from .models import ProgressTracker, EngagementLog, ImpactReport
 from .serializers import ProgressTrackerSerializer, EngagementLogSerializer, ImpactReportSerializer
 
 
-class ProgressTrackerViewSet(viewsets.ModelViewSet):
+class ProgressTrackerViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = ProgressTracker.objects.all().order_by('-last_updated')
     serializer_class = ProgressTrackerSerializer
+    last_modified_field = 'last_updated'
 
 
 class EngagementLogViewSet(viewsets.ModelViewSet):
     queryset = EngagementLog.objects.all().order_by('-timestamp')
     serializer_class = EngagementLogSerializer
+    page_size = 100
+    max_page_size = 1000
 
 
 class ImpactReportViewSet(viewsets.ModelViewSet):
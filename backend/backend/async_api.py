@@ -0,0 +1,98 @@
+"""
+Helpers for the async read endpoints served under ASGI.
+
+DRF's APIView is sync-only, so the async endpoints are plain Django async
+views. They reuse the project's JWT settings, serializers and keyset
+paginator, and query through Django's async ORM so a slow query never blocks
+the worker's event loop.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from users.models import User
+
+from .pagination import KeysetPagination
+from .renderers import FastJSONRenderer
+
+_jwt = JWTAuthentication()
+_renderer = FastJSONRenderer()
+
+
+def render(data, status=200):
+    return HttpResponse(_renderer.render(data), status=status, content_type='application/json')
+
+
+def request_data(request):
+    """
+    The request body parsed with the API's default parsers (JSON, form,
+    multipart). Raises DRF's ``ParseError``/``UnsupportedMediaType``.
+    """
+    return Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES]).data
+
+
+async def authenticate(request):
+    """
+    Same checks as ``JWTAuthentication.authenticate``, with the user row
+    loaded through the async ORM. Returns ``None`` without credentials.
+    """
+    header = _jwt.get_header(request)
+    if header is None:
+        return None
+    raw_token = _jwt.get_raw_token(header)
+    if raw_token is None:
+        return None
+    token = _jwt.get_validated_token(raw_token)
+    try:
+        user_id = token[jwt_settings.USER_ID_CLAIM]
+    except KeyError:
+        raise AuthenticationFailed('Token contained no recognizable user identification')
+    user = await User.objects.filter(**{jwt_settings.USER_ID_FIELD: user_id}).afirst()
+    if user is None:
+        raise AuthenticationFailed('User not found')
+    if not user.is_active:
+        raise AuthenticationFailed('User is inactive')
+    return user
+
+
+def async_api_view(view):
+    """
+    Allow GET/HEAD only and require an authenticated user, mirroring the
+    ``IsAuthenticated`` default of the sync API.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return render({'detail': f'Method "{request.method}" not allowed.'}, status=405)
+        try:
+            user = await authenticate(request)
+        except AuthenticationFailed as exc:
+            return render({'detail': exc.detail}, status=401)
+        if user is None:
+            return render({'detail': 'Authentication credentials were not provided.'}, status=401)
+        request.user = user
+        return await view(request, *args, **kwargs)
+
+    wrapper.profile_name = f'{view.__module__.split(".")[0]}.{view.__name__}.async'
+    return wrapper
+
+
+async def list_response(request, queryset, serializer_class, view=None):
+    """
+    Serialize ``queryset`` as a list, using the keyset paginator when the
+    client asks for a page. ``view`` supplies ``page_size``/``max_page_size``.
+    """
+    paginator = KeysetPagination()
+    drf_request = Request(request)
+    if paginator.is_requested(drf_request):
+        page = await sync_to_async(paginator.paginate_queryset)(queryset, drf_request, view)
+        data = serializer_class(page, many=True).data
+        return render(paginator.get_paginated_response(data).data)
+    rows = [obj async for obj in queryset]
+    return render(serializer_class(rows, many=True).data)
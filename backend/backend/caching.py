@@ -0,0 +1,162 @@
+"""
+Versioned read-through cache for small, rarely changing catalogue endpoints.
+
+Every registered model has a version number stored in the shared cache.
+Cached ``list``/``retrieve`` responses are keyed by that version, so bumping
+it (from ``post_save``, ``post_delete`` or ``m2m_changed``) invalidates every
+cached response for the model at once without having to find the keys.
+The bump runs once the writing transaction commits: bumping earlier would let
+a concurrent request cache the old rows under the new version, and a rolled
+back write would leave its uncommitted rows cached.
+Because the version lives in the shared cache backend, every gunicorn worker
+sees a bump made by any other worker or by a management command. A version
+key the cache has evicted restarts at the current time in nanoseconds rather
+than at 1, so it never matches entries cached under an earlier version.
+
+Hit/miss counters are kept per worker process and served to admins at
+``/api/_cache/``.
+"""
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+VERSION_KEY = 'catalogue:version:{label}'
+ENTRY_KEY = 'catalogue:{label}:v{version}:{action}:{pk}:{query}'
+
+_dependents = {}
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[getattr(settings, 'CATALOGUE_CACHE_ALIAS', 'default')]
+
+
+def read_version(key, cache=None):
+    """
+    The version number stored under ``key``. A missing one (never set, or
+    culled by the cache) starts at the current time in nanoseconds, so it
+    cannot come back to a number already used for cached entries.
+    """
+    cache = cache or get_cache()
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        cache.add(key, version, timeout=None)
+        version = cache.get(key, version)
+    return version
+
+
+def increment_version(key, cache=None):
+    """Move the version under ``key`` past every value it has had."""
+    cache = cache or get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def get_version(model):
+    return read_version(VERSION_KEY.format(label=model._meta.label_lower))
+
+
+def bump_version(model):
+    """Invalidate every cached response for ``model`` and the models that embed it."""
+    for target in [model, *_dependents.get(model, ())]:
+        increment_version(VERSION_KEY.format(label=target._meta.label_lower))
+
+
+def register_catalogue(model, dependents=()):
+    """
+    Bump ``model``'s version whenever it (or one of its M2M relations)
+    changes, after the change commits. ``dependents`` are models whose cached output also changes,
+    e.g. ``Badge`` rows lose their ``skill`` when a ``Skill`` is deleted.
+    """
+    _dependents[model] = tuple(dependents)
+
+    def invalidate(sender, **kwargs):
+        transaction.on_commit(lambda: bump_version(model))
+
+    uid = f'catalogue-cache:{model._meta.label_lower}'
+    post_save.connect(invalidate, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(invalidate, sender=model, weak=False, dispatch_uid=uid)
+    for field in model._meta.many_to_many:
+        m2m_changed.connect(invalidate, sender=field.remote_field.through, weak=False, dispatch_uid=uid)
+
+
+def _count(model, outcome):
+    with _stats_lock:
+        _stats[(model._meta.label_lower, outcome)] += 1
+
+
+class CatalogueCacheMixin:
+    """
+    Serve ``list`` and ``retrieve`` from the cache. Permissions and
+    throttles still run on every request; only the queryset and
+    serializer work is skipped on a hit.
+    """
+    catalogue_cache_timeout = None
+
+    def _cached(self, action, handler, request, *args, **kwargs):
+        model = self.get_queryset().model
+        cache = get_cache()
+        query = hashlib.md5(request.META.get('QUERY_STRING', '').encode('utf-8')).hexdigest()
+        key = ENTRY_KEY.format(
+            label=model._meta.label_lower,
+            version=get_version(model),
+            action=action,
+            pk=kwargs.get(self.lookup_url_kwarg or self.lookup_field, ''),
+            query=query,
+        )
+        data = cache.get(key)
+        if data is not None:
+            _count(model, 'hits')
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        _count(model, 'misses')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            timeout = self.catalogue_cache_timeout or getattr(settings, 'CATALOGUE_CACHE_TIMEOUT', 3600)
+            cache.set(key, response.data, timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached('list', super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached('retrieve', super().retrieve, request, *args, **kwargs)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    """
+    Catalogue cache hit/miss counters for this worker and the current
+    shared version of each catalogue.
+    """
+    with _stats_lock:
+        counters = dict(_stats)
+    catalogues = {}
+    for model in _dependents:
+        label = model._meta.label_lower
+        hits = counters.get((label, 'hits'), 0)
+        misses = counters.get((label, 'misses'), 0)
+        catalogues[label] = {
+            'version': get_version(model),
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / (hits + misses), 3) if hits + misses else None,
+        }
+    return Response({'catalogues': catalogues})
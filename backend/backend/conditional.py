@@ -0,0 +1,118 @@
+"""
+ETag / Last-Modified support for viewsets whose model carries a
+modification timestamp.
+
+Validators are computed without serializing anything:
+
+* list: an ETag from the model's version number in the shared cache (see
+  ``backend/caching.py``), the caller and the query string, so a list costs
+  no query at all. ``track_changes`` bumps the version after every commit
+  that saves or deletes a row or changes one of its M2M relations, so
+  inserts, updates, deletes and relation edits all move it. Lists send no
+  ``Last-Modified``: no timestamp can reflect a delete.
+* retrieve: the object's own timestamp, read after the usual object
+  permission checks. M2M changes move the timestamp of the rows they touch.
+
+When ``If-None-Match`` or ``If-Modified-Since`` matches, a ``304 Not
+Modified`` is returned before the serializer runs. Bulk ``update()`` and
+``delete()`` calls send no signals; call ``changed(model)`` after them.
+"""
+import hashlib
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .caching import bump_version, get_version
+
+
+def changed(model):
+    """Move the list validators of ``model`` once the current transaction commits."""
+    transaction.on_commit(lambda: bump_version(model))
+
+
+def track_changes(model, last_modified_field):
+    """
+    Keep the validators of ``model`` current: bump its version on save,
+    delete and M2M change, and set ``last_modified_field`` to now on the rows
+    whose M2M relations change.
+    """
+    def on_change(sender, **kwargs):
+        changed(model)
+
+    def on_relation(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ('post_add', 'post_remove', 'pre_clear'):
+            return
+        if not reverse:
+            ids = [instance.pk]
+        elif pk_set:
+            ids = pk_set
+        else:
+            ids = list(getattr(instance, accessors[sender]).values_list('pk', flat=True))
+        model._default_manager.filter(pk__in=ids).update(**{last_modified_field: timezone.now()})
+        changed(model)
+
+    uid = f'conditional-get:{model._meta.label_lower}'
+    post_save.connect(on_change, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_change, sender=model, weak=False, dispatch_uid=uid)
+    # Through model -> name of the relation on the other side
+    accessors = {}
+    for field in model._meta.many_to_many:
+        accessors[field.remote_field.through] = field.remote_field.get_accessor_name()
+        m2m_changed.connect(on_relation, sender=field.remote_field.through, weak=False, dispatch_uid=uid)
+
+
+class ConditionalGetMixin:
+    #: Name of an ``auto_now`` field on the model, e.g. ``'updated_at'``.
+    #: The model must also be registered with ``track_changes``.
+    last_modified_field = None
+
+    def list(self, request, *args, **kwargs):
+        if self.last_modified_field is None:
+            return super().list(request, *args, **kwargs)
+
+        etag = self._make_etag(
+            request, 'list', get_version(self.get_queryset().model), request.META.get('QUERY_STRING', ''),
+        )
+        not_modified = self._not_modified(request, etag, None)
+        if not_modified is not None:
+            return not_modified
+        return self._with_validators(super().list(request, *args, **kwargs), etag, None)
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.last_modified_field is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        instance = self.get_object()
+        last_modified = getattr(instance, self.last_modified_field)
+        etag = self._make_etag(request, 'retrieve', last_modified, instance.pk)
+        not_modified = self._not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(instance)
+        return self._with_validators(Response(serializer.data), etag, last_modified)
+
+    def _make_etag(self, request, action, *parts):
+        # The caller is part of the tag because list querysets are scoped per user
+        raw = ':'.join(str(part) for part in (
+            self.get_queryset().model._meta.label_lower, action, request.user.pk, *parts,
+        ))
+        return f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+    def _not_modified(self, request, etag, last_modified):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            return None
+        return self._with_validators(response, etag, last_modified)
+
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        patch_vary_headers(response, ['Authorization'])
+        return response
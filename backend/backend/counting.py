@@ -0,0 +1,53 @@
+"""
+Row counts that stay cheap on large tables.
+
+``estimated_count(queryset)`` asks PostgreSQL's planner for the number of
+rows instead of running ``COUNT(*)``, which has to visit every matching row:
+
+* an unfiltered queryset reads ``pg_class.reltuples``, kept up to date by
+  ``ANALYZE``/autovacuum;
+* a filtered one reads the top-level row estimate of ``EXPLAIN``.
+
+Small results are still counted exactly, since a few rows are cheap to count
+and an estimate is most visibly wrong there. Other backends always count
+exactly.
+"""
+import json
+
+from django.db import connections
+
+#: Estimates below this are replaced by an exact ``COUNT(*)``.
+EXACT_COUNT_BELOW = 1000
+
+
+def estimated_count(queryset, exact_below=EXACT_COUNT_BELOW):
+    """Return ``(count, is_estimate)`` for ``queryset``."""
+    if queryset.query.is_empty():
+        return 0, False
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count(), False
+
+    estimate = _planner_estimate(queryset.order_by(), connection)
+    if estimate is None or estimate < exact_below:
+        return queryset.count(), False
+    return estimate, True
+
+
+def _planner_estimate(queryset, connection):
+    with connection.cursor() as cursor:
+        if not queryset.query.where and not queryset.query.distinct:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed
+            if row is not None and row[0] >= 0:
+                return int(row[0])
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
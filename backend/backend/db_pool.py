@@ -0,0 +1,36 @@
+"""
+Connection pool metrics for the psycopg pool configured in settings.
+
+Counters come from ``psycopg_pool.ConnectionPool.get_stats()`` and are per
+worker process, accumulated since the pool was opened.
+"""
+from django.db import connections
+
+
+def pool_stats():
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        if pool is None:
+            continue
+        raw = pool.get_stats()
+        requests = raw.get('requests_num', 0)
+        stats[alias] = {
+            'size': raw.get('pool_size', 0),
+            'available': raw.get('pool_available', 0),
+            'min_size': raw.get('pool_min'),
+            'max_size': raw.get('pool_max'),
+            'checkouts': requests,
+            # Checkout wait: time requests spent waiting for a free connection
+            'checkout_wait_ms_total': raw.get('requests_wait_ms', 0),
+            'checkout_wait_ms_avg': round(raw.get('requests_wait_ms', 0) / requests, 3) if requests else 0,
+            # Exhaustion: checkouts that found the pool empty, and those that timed out
+            'exhausted_checkouts': raw.get('requests_queued', 0),
+            'checkout_timeouts': raw.get('requests_errors', 0),
+            'waiting_now': raw.get('requests_waiting', 0),
+            'connections_opened': raw.get('connections_num', 0),
+            'connection_errors': raw.get('connections_errors', 0),
+            'connections_lost': raw.get('connections_lost', 0),
+            'bad_returns': raw.get('returns_bad', 0),
+        }
+    return stats
@@ -0,0 +1,58 @@
+"""
+Optional nested expansion of many-to-many relations: ``?expand=a,b``.
+
+The viewset lists its expandable relations in ``expandable_prefetches``
+(name -> queryset of the related model) and prefetches every one of them, so
+a list costs one query per relation however many rows it has. Expanded
+relations are loaded as full rows and rendered by the serializer class named
+in the serializer's ``expandable_fields``; the others are loaded as ids only
+and stay primary keys. Expansion only applies to safe methods, so writes
+keep accepting ids.
+"""
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+
+class ExpandMixin:
+    #: Relation name -> queryset used to load it when expanded.
+    expandable_prefetches = {}
+
+    def get_expand(self):
+        """The relations named in ``?expand=``, validated once per request."""
+        if not hasattr(self, '_expand'):
+            request = getattr(self, 'request', None)
+            raw = request.query_params.get('expand', '') if request and request.method in SAFE_METHODS else ''
+            names = {name.strip() for name in raw.split(',') if name.strip()}
+            unknown = names - set(self.expandable_prefetches)
+            if unknown:
+                raise ValidationError({'expand': [
+                    f'Cannot expand {", ".join(sorted(unknown))}; '
+                    f'expandable: {", ".join(sorted(self.expandable_prefetches))}.'
+                ]})
+            self._expand = frozenset(names)
+        return self._expand
+
+    def prefetch_expandable(self, queryset):
+        expand = self.get_expand()
+        return queryset.prefetch_related(*(
+            Prefetch(name, queryset=related if name in expand else related.only('pk'))
+            for name, related in self.expandable_prefetches.items()
+        ))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = self.get_expand()
+        return context
+
+
+class ExpandableFieldsMixin:
+    #: Field name -> serializer class rendering the field when expanded.
+    expandable_fields = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for name in self.context.get('expand', ()):
+            if name in self.expandable_fields:
+                fields[name] = self.expandable_fields[name](many=True, read_only=True)
+        return fields
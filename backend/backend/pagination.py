@@ -0,0 +1,294 @@
+"""
+Keyset (cursor) pagination shared by every router-registered viewset.
+
+Pages are addressed by the ordering values of the last row that was served,
+so the database only ever runs ``WHERE (a, id) < (x, y) ORDER BY a, id LIMIT n``.
+There is no OFFSET scan and no COUNT(*), and rows inserted while a client is
+paging do not shift the pages it has not fetched yet.
+
+Pagination is opt-in per request: a list is paginated when the client sends
+``?page_size=`` or ``?cursor=``. Requests without either parameter keep
+receiving the plain JSON array the frontend already consumes.
+
+Nullable ordering fields sort NULLs as greater than every value on every
+backend (last ascending, first descending), as PostgreSQL does by default, and
+cursors positioned on a NULL continue with ``IS NULL`` / ``IS NOT NULL``.
+
+Viewsets can tune the page size with ``page_size`` and ``max_page_size``
+class attributes. Subclasses that set ``always`` paginate every request;
+``CountedKeysetPagination`` is one, and adds the total of the filtered
+queryset, estimated on large PostgreSQL tables.
+"""
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from collections import OrderedDict
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from .counting import estimated_count
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 500
+    invalid_cursor_message = 'Invalid cursor'
+    #: Paginate every request, not only those asking for it.
+    always = False
+
+    def is_requested(self, request):
+        if self.always:
+            return True
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request, view)
+        self.ordering = self.get_ordering(queryset)
+        self.fields = [self._resolve_field(queryset.model, name.lstrip('-')) for name in self.ordering]
+        self.nullable = {
+            name.lstrip('-') for name in self.ordering if self._is_nullable(queryset.model, name.lstrip('-'))
+        }
+
+        reverse, position = self.decode_cursor(request)
+        ordering = self._flip(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*self._order_by(ordering))
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        if reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return rows
+
+    def get_page_size(self, request, view):
+        page_size = getattr(view, 'page_size', self.page_size)
+        max_page_size = getattr(view, 'max_page_size', self.max_page_size)
+        requested = request.query_params.get(self.page_size_query_param)
+        if requested:
+            try:
+                page_size = int(requested)
+            except ValueError:
+                pass
+        return max(1, min(page_size, max_page_size))
+
+    def get_ordering(self, queryset):
+        """
+        The queryset's own ordering, with the primary key appended as a
+        tie-breaker so that every cursor position is unique.
+        """
+        ordering = [
+            field for field in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(field, str) and field != '?'
+        ]
+        if not ordering:
+            return ['id']
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            ordering.append('-id' if ordering[-1].startswith('-') else 'id')
+        return [field.replace('pk', 'id') if field.lstrip('-') == 'pk' else field for field in ordering]
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque pagination cursor taken from a previous page.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results per page. Enables pagination when present.',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            reverse = bool(payload['r'])
+            values = payload['p']
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [field.to_python(value) for field, value in zip(self.fields, values)]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return reverse, position
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'r': int(reverse), 'p': values}, default=_encode_value, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _link(self, obj, reverse):
+        values = [self._value(obj, name.lstrip('-')) for name in self.ordering]
+        return self.encode_cursor(values, reverse)
+
+    @staticmethod
+    def _flip(ordering):
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+    def _order_by(self, ordering):
+        """``ordering`` with NULLs placed above every value in nullable fields."""
+        return [
+            field if field.lstrip('-') not in self.nullable
+            else F(field[1:]).desc(nulls_first=True) if field.startswith('-')
+            else F(field).asc(nulls_last=True)
+            for field in ordering
+        ]
+
+    def _after(self, ordering, position):
+        """
+        Row-value comparison ``(a, b, id) > (x, y, z)`` expanded into the
+        equivalent OR-of-ANDs so it works on every backend and can use a
+        composite index on the ordering columns. NULL counts as greater than
+        any value, matching ``_order_by``.
+        """
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            value = position[index]
+            if value is None:
+                # Only non-NULL values are below NULL; nothing is above it
+                if not field.startswith('-'):
+                    continue
+                branch = Q(**{f'{name}__isnull': False})
+            else:
+                lookup = 'lt' if field.startswith('-') else 'gt'
+                branch = Q(**{f'{name}__{lookup}': value})
+                if name in self.nullable and not field.startswith('-'):
+                    branch |= Q(**{f'{name}__isnull': True})
+            for previous, previous_value in zip(ordering[:index], position[:index]):
+                previous = previous.lstrip('-')
+                branch &= Q(**{f'{previous}__isnull': True} if previous_value is None else {previous: previous_value})
+            condition |= branch
+        return condition
+
+    @staticmethod
+    def _is_nullable(model, path):
+        """Whether ``path`` can be NULL, through a nullable field or relation on the way."""
+        for part in path.split('__'):
+            field = model._meta.get_field(part)
+            if field.null or (field.is_relation and not field.concrete):
+                return True
+            if field.is_relation and field.related_model is not None:
+                model = field.related_model
+        return False
+
+    @staticmethod
+    def _resolve_field(model, path):
+        field = None
+        for part in path.split('__'):
+            field = model._meta.get_field(part)
+            if field.is_relation and field.related_model is not None:
+                model = field.related_model
+        if field.is_relation:
+            field = field.target_field
+        return field
+
+    @staticmethod
+    def _value(obj, path):
+        parts = path.split('__')
+        for part in parts[:-1]:
+            obj = getattr(obj, part)
+            if obj is None:
+                return None
+        field = obj._meta.get_field(parts[-1])
+        return getattr(obj, field.attname)
+
+
+class CountedKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination that is always on and reports ``count`` (and whether it
+    is a planner estimate) for the filtered queryset.
+    """
+    always = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count, self.count_is_estimate = estimated_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('count_is_estimate', self.count_is_estimate),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties'] = {
+            'count': {'type': 'integer'},
+            'count_is_estimate': {'type': 'boolean'},
+            **response_schema['properties'],
+        }
+        return response_schema
+
+
+def _encode_value(value):
+    # Full microsecond precision: DjangoJSONEncoder truncates datetimes to
+    # milliseconds, which would make the cursor skip or repeat rows.
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor')
@@ -0,0 +1,306 @@
+"""
+Per-request SQL / latency profiler for DRF endpoints.
+
+``QueryProfilerMiddleware`` records, for every request that resolves to a DRF
+view, the number of SQL queries, time spent in the database, time spent in
+serializers and total wall time. Queries are grouped by their SQL template
+(parameters are never part of the template), and any template that repeats
+``N_PLUS_ONE_THRESHOLD`` times or more within one request is flagged as an
+N+1 candidate.
+
+Rolling per-endpoint statistics are kept in memory (per worker process) and
+served to admins at ``/api/_perf/``. When ``LOG_FILE`` is set, every profiled
+request is also appended to that file as one JSON line, which aggregates
+across gunicorn workers.
+
+Configured through ``settings.PERF_PROFILER``; off unless enabled there (the
+project settings enable it when ``DEBUG`` is on).
+"""
+import contextvars
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .db_pool import pool_stats
+
+DEFAULTS = {
+    'ENABLED': False,
+    'LOG_FILE': None,
+    'N_PLUS_ONE_THRESHOLD': 5,
+    'WINDOW': 500,
+}
+
+_PLACEHOLDER_LIST = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+_current = contextvars.ContextVar('perf_profile', default=None)
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'PERF_PROFILER', {})}
+
+
+def query_shape(sql):
+    """SQL template with ``IN (%s, %s, ...)`` lists collapsed to one placeholder."""
+    return _WHITESPACE.sub(' ', _PLACEHOLDER_LIST.sub('(%s...)', sql)).strip()
+
+
+class RequestProfile:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            self.shapes[query_shape(sql)] += 1
+
+    def repeated_shapes(self, threshold):
+        return [
+            {'sql': sql, 'count': count}
+            for sql, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+class EndpointStats:
+    def __init__(self, window):
+        self.count = 0
+        self.errors = 0
+        self.n_plus_one = 0
+        self.totals = Counter()
+        self.max_wall_ms = 0.0
+        self.wall_samples = deque(maxlen=window)
+        self.last_repeated = []
+
+    def add(self, record):
+        self.count += 1
+        if record['status'] >= 500:
+            self.errors += 1
+        for key in ('queries', 'db_ms', 'serializer_ms', 'wall_ms'):
+            self.totals[key] += record[key]
+        self.max_wall_ms = max(self.max_wall_ms, record['wall_ms'])
+        self.wall_samples.append(record['wall_ms'])
+        if record['repeated_queries']:
+            self.n_plus_one += 1
+            self.last_repeated = record['repeated_queries']
+
+    def as_dict(self):
+        samples = sorted(self.wall_samples)
+
+        def percentile(p):
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))], 2) if samples else None
+
+        return {
+            'requests': self.count,
+            'errors': self.errors,
+            'avg_queries': round(self.totals['queries'] / self.count, 2),
+            'avg_db_ms': round(self.totals['db_ms'] / self.count, 2),
+            'avg_serializer_ms': round(self.totals['serializer_ms'] / self.count, 2),
+            'avg_wall_ms': round(self.totals['wall_ms'] / self.count, 2),
+            'p50_wall_ms': percentile(0.50),
+            'p95_wall_ms': percentile(0.95),
+            'max_wall_ms': round(self.max_wall_ms, 2),
+            'total_db_ms': round(self.totals['db_ms'], 2),
+            'n_plus_one_requests': self.n_plus_one,
+            'last_repeated_queries': self.last_repeated,
+        }
+
+
+class StatsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, record, window):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats(window)
+            stats.add(record)
+
+    def snapshot(self):
+        with self._lock:
+            data = {endpoint: stats.as_dict() for endpoint, stats in self._endpoints.items()}
+        # Most expensive endpoints first
+        return dict(sorted(data.items(), key=lambda item: item[1]['total_db_ms'], reverse=True))
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+registry = StatsRegistry()
+_log_lock = threading.Lock()
+_serializer_patched = False
+
+
+def _patch_serializer_timing():
+    """
+    Time the outermost ``serializer.data`` access of a profiled request.
+    Nested serializers run inside it and are not counted twice.
+    """
+    global _serializer_patched
+    if _serializer_patched:
+        return
+    _serializer_patched = True
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        original = cls.data
+
+        def timed(self, _original=original):
+            profile = _current.get()
+            if profile is None:
+                return _original.fget(self)
+            profile.serializer_depth += 1
+            start = time.perf_counter()
+            try:
+                return _original.fget(self)
+            finally:
+                profile.serializer_depth -= 1
+                if profile.serializer_depth == 0:
+                    profile.serializer_time += time.perf_counter() - start
+
+        cls.data = property(timed)
+
+
+def _endpoint_name(view_func, method):
+    """``app.ViewSet.action`` for viewsets, ``app.function.method`` for ``@api_view``."""
+    if getattr(view_func, 'profile_name', None):
+        return view_func.profile_name
+    cls = getattr(view_func, 'cls', None)
+    if cls is None or not issubclass(cls, APIView):
+        return None
+    actions = getattr(view_func, 'actions', None) or {}
+    action = actions.get(method.lower(), method.lower())
+    return f'{cls.__module__.split(".")[0]}.{cls.__name__}.{action}'
+
+
+def _profile_execute(execute, sql, params, many, context):
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    return profile(execute, sql, params, many, context)
+
+
+def _install_execute_wrapper(sender=None, connection=None, **kwargs):
+    """
+    Attach the profiler to a connection for its whole lifetime. The active
+    profile is looked up from a context variable, which also follows async
+    views into the threads that run their ORM queries.
+    """
+    if _profile_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_profile_execute)
+
+
+class QueryProfilerMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.config = get_config()
+        if not self.config['ENABLED']:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        _patch_serializer_timing()
+        connection_created.connect(_install_execute_wrapper, dispatch_uid='perf-profiler')
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        for connection in connections.all(initialized_only=True):
+            _install_execute_wrapper(connection=connection)
+        profile, token, start = self._begin(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, profile, start)
+
+    async def __acall__(self, request):
+        profile, token, start = self._begin(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, profile, start)
+
+    def _begin(self, request):
+        request._perf_endpoint = None
+        profile = RequestProfile()
+        return profile, _current.set(profile), time.perf_counter()
+
+    def _finish(self, request, response, profile, start):
+        wall = time.perf_counter() - start
+        endpoint = request._perf_endpoint
+        if endpoint is not None:
+            self._record(endpoint, request, response, profile, wall)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if getattr(view_func, 'skip_profiling', False):
+            return None
+        request._perf_endpoint = _endpoint_name(view_func, request.method)
+        return None
+
+    def _record(self, endpoint, request, response, profile, wall):
+        record = {
+            'ts': time.time(),
+            'endpoint': endpoint,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': profile.queries,
+            'db_ms': round(profile.db_time * 1000, 3),
+            'serializer_ms': round(profile.serializer_time * 1000, 3),
+            'wall_ms': round(wall * 1000, 3),
+            'repeated_queries': profile.repeated_shapes(self.config['N_PLUS_ONE_THRESHOLD']),
+        }
+        registry.record(endpoint, record, self.config['WINDOW'])
+        if self.config['LOG_FILE']:
+            line = json.dumps(record) + '\n'
+            with _log_lock, open(self.config['LOG_FILE'], 'a', encoding='utf-8') as handle:
+                handle.write(line)
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def perf_stats(request):
+    """
+    Rolling per-endpoint query and latency statistics and database pool
+    metrics for this worker. DELETE resets the endpoint statistics.
+    """
+    if request.method == 'DELETE':
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    return Response({
+        'config': {key: value for key, value in get_config().items() if key != 'LOG_FILE'},
+        'endpoints': registry.snapshot(),
+        'db_pool': pool_stats(),
+    })
+
+
+perf_stats.skip_profiling = True
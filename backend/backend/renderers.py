@@ -0,0 +1,37 @@
+"""
+JSON renderer backed by orjson, with DRF's stdlib renderer as the fallback.
+
+orjson encodes datetime, date, time and UUID natively; everything else it
+cannot encode (Decimal, lazy strings, querysets...) goes through DRF's own
+``JSONEncoder.default`` so the output matches ``JSONRenderer``. Pretty-printed
+responses (browsable API, ``; indent=N``) and payloads orjson rejects, such as
+integers beyond 64 bits, are rendered by the stdlib renderer.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+_default = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    # Same datetime format as DRF's DateTimeField: ISO 8601 with a Z suffix for UTC
+    options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_default, option=self.options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Keep the output a strict JavaScript subset, like JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -54,11 +54,13 @@ INSTALLED_APPS = [
     'analytics',
     'payments',
     'achievements',
+    'search',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # Add WhiteNoise for static files
+    'backend.profiling.QueryProfilerMiddleware',  # Per-endpoint SQL/latency stats at /api/_perf/
+    'backend.middleware.WhiteNoiseMiddleware',  # WhiteNoise for static files (async-capable wrapper)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -94,8 +96,39 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Use PostgreSQL in production (Render), SQLite in development
 if os.environ.get('DATABASE_URL'):
     DATABASES = {
-        'default': dj_database_url.parse(os.environ.get('DATABASE_URL'))
+        'default': dj_database_url.parse(os.environ.get('DATABASE_URL'), conn_health_checks=True)
     }
+    # The pool option only exists on the PostgreSQL backend
+    if (
+        os.environ.get('DB_POOL', 'True') == 'True'
+        and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql'
+    ):
+        # psycopg connection pool, one per gunicorn worker process; all workers
+        # together must stay under the server's connection limit. A WSGI worker
+        # thread holds at most one connection. Under ASGI (see gunicorn.conf.py)
+        # every in-flight request runs its sync code on a thread of its own, so
+        # a worker may need as many connections as it has requests: it gets
+        # its whole share of the limit.
+        GUNICORN_WORKERS = int(os.environ.get('WEB_CONCURRENCY', '2'))
+        DB_MAX_CONNECTIONS = int(os.environ.get('DB_MAX_CONNECTIONS', '90'))
+        DB_POOL_MAX_SIZE = DB_MAX_CONNECTIONS // GUNICORN_WORKERS
+        if os.environ.get('GUNICORN_ASGI', 'True') != 'True':
+            DB_POOL_MAX_SIZE = min(int(os.environ.get('GUNICORN_THREADS', '4')), DB_POOL_MAX_SIZE)
+        DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', max(1, DB_POOL_MAX_SIZE)))
+        DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+            'name': 'default',
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', min(2, DB_POOL_MAX_SIZE))),
+            'max_size': DB_POOL_MAX_SIZE,
+            # Recycle connections after this many seconds
+            'max_lifetime': float(os.environ.get('DB_POOL_MAX_LIFETIME', '1800')),
+            # Close idle connections above min_size after this many seconds
+            'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', '300')),
+            # Seconds a request waits for a free connection before failing
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', '10')),
+        }
+        # Health checks (conn_health_checks above) run on every checkout
+    else:
+        DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('CONN_MAX_AGE', '0'))
 else:
     DATABASES = {
         'default': {
@@ -105,6 +138,27 @@ else:
     }
 
 
+# Cache
+# File-based by default so that every gunicorn worker on the instance shares
+# the catalogue version keys; set CACHE_BACKEND=locmem for a single process.
+if os.environ.get('CACHE_BACKEND', 'file') == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', '/tmp/aa_educates_cache'),
+        }
+    }
+
+# Seconds a cached catalogue response (skills, badges, modules, workbooks) is kept
+CATALOGUE_CACHE_TIMEOUT = int(os.environ.get('CATALOGUE_CACHE_TIMEOUT', '3600'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -123,6 +177,29 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing (see users/hashing.py). PBKDF2 work factor; existing hashes
+# are upgraded to it on the next successful login.
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', '1000000'))
+PASSWORD_HASHERS = [
+    'users.hashing.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_POOL = {
+    # Processes per worker hashing bulk onboarding uploads, shared by all its requests (1: inline)
+    'WORKERS': int(os.environ.get('PASSWORD_HASH_WORKERS', '2')),
+}
+PASSWORD_VERIFY = {
+    # Login password checks hashing at once in each worker process (0: inline)
+    'WORKERS': int(os.environ.get('PASSWORD_VERIFY_WORKERS', '2')),
+    # Logins allowed to wait for a hashing thread before getting a 503
+    'QUEUE_SIZE': int(os.environ.get('PASSWORD_VERIFY_QUEUE_SIZE', '64')),
+    # Retry-After seconds sent with that 503
+    'RETRY_AFTER': int(os.environ.get('PASSWORD_VERIFY_RETRY_AFTER', '1')),
+}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -156,15 +233,55 @@ AUTH_USER_MODEL = 'users.User'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Builds request.user from token claims instead of querying the users table
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.StatelessJWTAuthentication',
     ],
     # Require authentication for all API endpoints by default
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Keyset pagination, enabled per request with ?page_size= or ?cursor=
+    'DEFAULT_PAGINATION_CLASS': 'backend.pagination.KeysetPagination',
+    'PAGE_SIZE': 50,
+    # orjson-backed JSON, falling back to the stdlib when orjson is missing
+    'DEFAULT_RENDERER_CLASSES': [
+        'backend.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'backend.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Request profiler (see backend/profiling.py)
+PERF_PROFILER = {
+    # Off unless DEBUG: it wraps every query and serializer call
+    'ENABLED': os.environ.get('PERF_PROFILER_ENABLED', str(DEBUG)) == 'True',
+    # Optional JSON-lines file with one record per profiled request
+    'LOG_FILE': os.environ.get('PERF_PROFILER_LOG_FILE') or None,
+    # Identical query shapes repeated this many times in one request are flagged as N+1
+    'N_PLUS_ONE_THRESHOLD': int(os.environ.get('PERF_PROFILER_N_PLUS_ONE_THRESHOLD', '5')),
+    # Number of recent requests per endpoint used for latency percentiles
+    'WINDOW': 500,
+}
+
+# Per-process cache of full User rows behind stateless JWT authentication
+# (see users/user_cache.py). TTL bounds staleness across gunicorn workers.
+USER_CACHE = {
+    'TTL': int(os.environ.get('USER_CACHE_TTL', '300')),
+    'MAX_SIZE': int(os.environ.get('USER_CACHE_MAX_SIZE', '10000')),
+}
+
+# Parent dashboard: overrides of the per-child section sizes and the lifetime
+# of the per-parent cached response, whose defaults are in users/dashboard.py.
+# Child data changes invalidate the cached response earlier.
+PARENT_DASHBOARD = {}
+if os.environ.get('PARENT_DASHBOARD_CACHE_TIMEOUT'):
+    PARENT_DASHBOARD['CACHE_TIMEOUT'] = int(os.environ['PARENT_DASHBOARD_CACHE_TIMEOUT'])
+
 # drf-spectacular settings
 SPECTACULAR_SETTINGS = {
     'TITLE': 'AA Educates API',
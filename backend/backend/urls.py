@@ -17,6 +17,8 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from .caching import cache_stats
+from .profiling import perf_stats
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -24,6 +26,10 @@ urlpatterns = [
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    # Per-endpoint query/latency stats (admin only)
+    path('api/_perf/', perf_stats, name='perf-stats'),
+    # Catalogue cache hit/miss counters (admin only)
+    path('api/_cache/', cache_stats, name='cache-stats'),
     # App URLs
     path('api/users/', include('users.urls')),
     path('api/projects/', include('projects.urls')),
@@ -33,4 +39,5 @@ urlpatterns = [
     path('api/analytics/', include('analytics.urls')),
     path('api/payments/', include('payments.urls')),
     path('api/achievements/', include('achievements.urls')),
+    path('api/search/', include('search.urls')),
 ]
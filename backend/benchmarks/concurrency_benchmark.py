@@ -0,0 +1,139 @@
+"""
+Requests/sec of the sync WSGI deployment versus the async ASGI deployment.
+
+Starts gunicorn twice from backend/ (GUNICORN_ASGI=False, then True) and
+drives the hot read endpoints at each concurrency level with a small asyncio
+HTTP/1.1 keep-alive client. WSGI is measured on the DRF endpoints, ASGI on
+their async counterparts:
+
+    /api/users/users/me/          vs  /api/users/async/me/
+    /api/community/messages/      vs  /api/community/async/messages/
+    /api/projects/projects/       vs  /api/projects/async/projects/
+
+Both servers use the database configured for the project (DATABASE_URL or
+the local SQLite file). A benchmark user is created if missing.
+
+Usage (from backend/):
+    python benchmarks/concurrency_benchmark.py
+    python benchmarks/concurrency_benchmark.py --levels 50,200,1000 --duration 15 --workers 4 --json bench_asgi.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+import django
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, BACKEND_DIR)
+django.setup()
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.models import User
+
+from http_client import Connection, summarize
+
+ENDPOINTS = {
+    'me': ('/api/users/users/me/', '/api/users/async/me/'),
+    'messages': ('/api/community/messages/?page_size=50', '/api/community/async/messages/?page_size=50'),
+    'projects': ('/api/projects/projects/?page_size=50', '/api/projects/async/projects/?page_size=50'),
+}
+
+
+def bench_token():
+    user, created = User.objects.get_or_create(
+        email='bench@test.com',
+        defaults={'username': 'bench_user', 'role': User.STUDENT},
+    )
+    if created:
+        user.set_unusable_password()
+        user.save()
+    return str(RefreshToken.for_user(user).access_token)
+
+
+async def client(host, port, path, token, deadline, latencies, errors):
+    connection = Connection(host, port)
+    headers = {'Authorization': f'Bearer {token}'}
+    while time.perf_counter() < deadline:
+        try:
+            status, _, elapsed = await connection.request('GET', path, headers)
+        except OSError:
+            errors.append('connection error')
+            await asyncio.sleep(0.01)
+            continue
+        if status == 200:
+            latencies.append(elapsed)
+        else:
+            errors.append(status)
+    connection.close()
+
+
+async def drive(host, port, path, token, concurrency, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        client(host, port, path, token, deadline, latencies, errors) for _ in range(concurrency)
+    ))
+    return summarize(latencies, len(errors), duration)
+
+
+def start_server(asgi, port, workers):
+    env = dict(os.environ, GUNICORN_ASGI='True' if asgi else 'False', WEB_CONCURRENCY=str(workers),
+               DEBUG='False', ALLOWED_HOSTS='127.0.0.1,localhost', PERF_PROFILER_ENABLED='False')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env,
+    )
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/api/users/async/me/', timeout=1)
+            return process
+        except OSError as exc:
+            if getattr(exc, 'code', None):
+                return process
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError('gunicorn did not start')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--levels', default='50,200,1000', help='Comma-separated concurrency levels')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per measurement (default: 10)')
+    parser.add_argument('--workers', type=int, default=2, help='Gunicorn workers for both servers (default: 2)')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.levels.split(',')]
+    token = bench_token()
+    results = {}
+    for mode, asgi in (('wsgi', False), ('asgi', True)):
+        server = start_server(asgi, args.port, args.workers)
+        try:
+            for name, paths in ENDPOINTS.items():
+                path = paths[1] if asgi else paths[0]
+                for level in levels:
+                    result = asyncio.run(drive('127.0.0.1', args.port, path, token, level, args.duration))
+                    results.setdefault(name, {}).setdefault(str(level), {})[mode] = result
+                    print(f'{mode:<5} {name:<9} c={level:<5} {result["throughput_rps"]:>9} req/s  '
+                          f'p50 {result["p50_ms"]} ms  p99 {result["p99_ms"]} ms  errors {result["error_rate"]:.2%}')
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
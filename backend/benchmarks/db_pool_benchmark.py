@@ -0,0 +1,127 @@
+"""
+Request latency with and without the database connection pool.
+
+Runs the same workload twice in fresh processes, once with DB_POOL=True and
+once with DB_POOL=False (a new connection per request, as before pooling).
+Each simulated request goes through Django's request_started /
+request_finished signals, so connections are opened, checked out, returned
+or closed exactly as they would be under gunicorn.
+
+Needs a PostgreSQL database (pooling is PostgreSQL-only). Use a local server
+to see the handshake cost; a remote one with TLS shows a larger gap.
+
+Usage (from backend/):
+    DATABASE_URL=postgres://localhost/aa_educates python benchmarks/db_pool_benchmark.py
+    DATABASE_URL=... python benchmarks/db_pool_benchmark.py --threads 8 --requests 500 --json bench_pool.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def run_worker(threads, requests):
+    """Workload executed inside a child process configured through env vars."""
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    sys.path.insert(0, BACKEND_DIR)
+    django.setup()
+
+    from django.core.signals import request_finished, request_started
+    from django.db import connection
+
+    from users.models import User
+
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        local = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            request_started.send(sender=None)
+            try:
+                User.objects.filter(pk=1).exists()
+            finally:
+                request_finished.send(sender=None)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=client) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    pool = getattr(connection, 'pool', None)
+    result = {
+        'requests': len(latencies),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'mean_ms': round(statistics.mean(latencies), 3),
+        'pool': pool.get_stats() if pool is not None else None,
+    }
+    print(json.dumps(result))
+
+
+def run_mode(pooled, threads, requests):
+    env = dict(os.environ, DB_POOL='True' if pooled else 'False', WEB_CONCURRENCY='1',
+               GUNICORN_THREADS=str(threads), CONN_MAX_AGE='0', PERF_PROFILER_ENABLED='False')
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', '--threads', str(threads), '--requests', str(requests)],
+        env=env, cwd=BACKEND_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=4, help='Concurrent request threads (default: 4)')
+    parser.add_argument('--requests', type=int, default=1000, help='Requests per thread (default: 1000)')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.threads, args.requests)
+        return
+
+    if not os.environ.get('DATABASE_URL', '').startswith(('postgres://', 'postgresql://')):
+        parser.error('set DATABASE_URL to a PostgreSQL database')
+
+    results = {
+        'no_pool': run_mode(False, args.threads, args.requests),
+        'pool': run_mode(True, args.threads, args.requests),
+    }
+    print(f'{"mode":<10} {"req/s":>10} {"p50 ms":>10} {"p99 ms":>10}')
+    for mode, result in results.items():
+        print(f'{mode:<10} {result["throughput_rps"]:>10} {result["p50_ms"]:>10} {result["p99_ms"]:>10}')
+    pool = results['pool']['pool'] or {}
+    print(f'pool: {pool.get("connections_num", 0)} connections opened, '
+          f'{pool.get("requests_queued", 0)} checkouts waited, {pool.get("requests_wait_ms", 0)} ms total wait')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Minimal asyncio HTTP/1.1 keep-alive client shared by the benchmark scripts,
+so they need nothing beyond the project's own requirements.
+"""
+
+import asyncio
+import json
+import time
+
+
+class Connection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, headers=None, body=None):
+        """
+        Send one request and return ``(status, body_bytes, elapsed_ms)``.
+        ``body`` is JSON-encoded when it is not already bytes.
+        Raises ``OSError`` on connection failures; the next call reconnects.
+        """
+        if body is not None and not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        lines = [f'{method} {path} HTTP/1.1', f'Host: {self.host}', 'Connection: keep-alive']
+        for name, value in (headers or {}).items():
+            lines.append(f'{name}: {value}')
+        if body is not None:
+            lines.append('Content-Type: application/json')
+            lines.append(f'Content-Length: {len(body)}')
+        payload = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        start = time.perf_counter()
+        try:
+            self.writer.write(payload)
+            await self.writer.drain()
+            status_line = await self.reader.readline()
+            if not status_line:
+                raise ConnectionResetError('server closed the connection')
+            status = int(status_line.split()[1])
+            length = 0
+            close = False
+            while True:
+                line = await self.reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                name = name.strip().lower()
+                if name == 'content-length':
+                    length = int(value)
+                elif name == 'connection' and value.strip().lower() == 'close':
+                    close = True
+            data = await self.reader.readexactly(length) if length else b''
+        except (asyncio.IncompleteReadError, ValueError, IndexError) as exc:
+            self.close()
+            raise ConnectionResetError(str(exc)) from exc
+        except OSError:
+            self.close()
+            raise
+        elapsed = (time.perf_counter() - start) * 1000
+        if close:
+            self.close()
+        return status, data, elapsed
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def summarize(latencies, errors, duration):
+    """Throughput, latency percentiles and error rate for one endpoint."""
+    ordered = sorted(latencies)
+    total = len(latencies) + errors
+
+    def percentile(p):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 2) if ordered else None
+
+    return {
+        'requests': total,
+        'throughput_rps': round(total / duration, 2) if duration else None,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'error_rate': round(errors / total, 4) if total else 0.0,
+    }
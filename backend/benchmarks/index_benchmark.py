@@ -0,0 +1,252 @@
+"""
+Benchmark for the composite indexes on hot list orderings and FK filters.
+
+Seeds every indexed table with ``--rows`` rows, then for each hot query prints
+the EXPLAIN plan and the median latency twice: once with the indexes dropped
+and once with them restored. The indexes are always re-created at the end,
+so the schema matches the migrations afterwards.
+
+This writes millions of rows: run it against a throwaway database only.
+
+Usage (from backend/):
+    DATABASE_URL=postgres://localhost/aa_bench python benchmarks/index_benchmark.py --rows 1000000 --yes
+    python benchmarks/index_benchmark.py --rows 200000 --yes --json bench_indexes.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+django.setup()
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.utils import timezone
+
+from analytics.models import EngagementLog
+from community.models import Comment, GroupChat, Message, Post
+from learning.models import Workbook, WorkbookPurchase
+from mentorship.models import MentorProfile, Session
+from payments.models import PaymentTransaction
+from projects.models import Project, StudentProjectSubmission
+from users.management.commands.seed_scale import explicit_timestamps
+from users.models import AdminProfile, CorporatePartnerProfile, ParentProfile, StudentProfile, User
+
+INDEXED_MODELS = [
+    Message, Post, Comment, EngagementLog, Session,
+    StudentProjectSubmission, Project, PaymentTransaction, WorkbookPurchase, User,
+]
+BATCH = 5000
+
+
+def bulk(model, objects):
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) >= BATCH:
+            model.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch)
+
+
+def seed(rows, rng):
+    now = timezone.now()
+
+    def moment():
+        return now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+
+    n_users = max(100, rows // 200)
+    n_projects = max(50, rows // 1000)
+    prefix = f'bench{int(time.time())}'
+    print(f'Seeding {n_users} users, {n_projects} projects and {rows} rows per hot table...')
+
+    bulk(User, (
+        User(username=f'{prefix}_{i}', email=f'{prefix}_{i}@bench.test', password='!', role=User.STUDENT)
+        for i in range(n_users)
+    ))
+    users = list(User.objects.filter(username__startswith=f'{prefix}_').values_list('id', flat=True))
+    bulk(StudentProfile, (StudentProfile(user_id=user_id) for user_id in users))
+    students = list(StudentProfile.objects.filter(user_id__in=users).values_list('id', flat=True))
+
+    staff = User.objects.create(username=f'{prefix}_staff', email=f'{prefix}_staff@bench.test', role=User.ADMIN)
+    admin = AdminProfile.objects.create(user=staff)
+    partner_user = User.objects.create(username=f'{prefix}_corp', email=f'{prefix}_corp@bench.test', role=User.CORPORATE_PARTNER)
+    partner = CorporatePartnerProfile.objects.create(user=partner_user, company_name='Bench Ltd')
+    parent_user = User.objects.create(username=f'{prefix}_parent', email=f'{prefix}_parent@bench.test', role=User.PARENT)
+    parent = ParentProfile.objects.create(user=parent_user)
+
+    bulk(GroupChat, (GroupChat(name=f'{prefix} chat {i}') for i in range(200)))
+    chats = list(GroupChat.objects.filter(name__startswith=prefix).values_list('id', flat=True))
+    bulk(MentorProfile, (MentorProfile(user=partner, bio=prefix) for _ in range(100)))
+    mentors = list(MentorProfile.objects.filter(bio=prefix).values_list('id', flat=True))
+    workbook = Workbook.objects.create(title=f'{prefix} workbook', pdf_file='workbooks/bench.pdf', created_by=admin)
+    statuses = [choice for choice, _ in Project.STATUS_CHOICES]
+
+    with explicit_timestamps(*INDEXED_MODELS):
+        bulk(Project, (
+            Project(title=f'{prefix} project {i}', created_by=partner, status=rng.choice(statuses),
+                    created_at=moment(), updated_at=now)
+            for i in range(n_projects)
+        ))
+        projects = list(Project.objects.filter(title__startswith=prefix).values_list('id', flat=True))
+        student_ct = ContentType.objects.get_for_model(StudentProfile)
+        parent_ct = ContentType.objects.get_for_model(ParentProfile)
+
+        bulk(Message, (
+            Message(chat_id=rng.choice(chats), sender_id=rng.choice(users), content='hello', timestamp=moment())
+            for _ in range(rows)
+        ))
+        bulk(EngagementLog, (
+            EngagementLog(user_id=rng.choice(users), action_type='view', timestamp=moment())
+            for _ in range(rows)
+        ))
+        bulk(Session, (
+            Session(mentor_id=rng.choice(mentors), student_id=rng.choice(students),
+                    date_time=moment() + timedelta(days=180), duration=30)
+            for _ in range(rows)
+        ))
+        # (student, project) is unique: walk the cross product instead of sampling
+        submission_statuses = [choice for choice, _ in StudentProjectSubmission.STATUS_CHOICES]
+        bulk(StudentProjectSubmission, (
+            StudentProjectSubmission(
+                student_id=students[i % len(students)],
+                project_id=projects[(i // len(students)) % len(projects)],
+                status=rng.choice(submission_statuses), submitted_at=moment(), updated_at=now,
+            )
+            for i in range(min(rows, len(students) * len(projects)))
+        ))
+        bulk(Post, (
+            Post(author_content_type=student_ct, author_object_id=rng.choice(students), content='post', created_at=moment())
+            for _ in range(rows)
+        ))
+        posts = list(Post.objects.order_by('-id').values_list('id', flat=True)[:10000])
+        bulk(Comment, (
+            Comment(post_id=rng.choice(posts), author_content_type=student_ct,
+                    author_object_id=rng.choice(students), text='comment', created_at=moment())
+            for _ in range(rows)
+        ))
+        payment_statuses = [choice for choice, _ in PaymentTransaction.STATUS_CHOICES]
+        bulk(PaymentTransaction, (
+            PaymentTransaction(user_id=rng.choice(users), amount='9.99', provider=PaymentTransaction.STRIPE,
+                               transaction_id=f'{prefix}_{i}', status=rng.choice(payment_statuses), created_at=moment())
+            for i in range(rows)
+        ))
+        bulk(WorkbookPurchase, (
+            WorkbookPurchase(workbook=workbook, purchaser_content_type=parent_ct,
+                             purchaser_object_id=rng.randrange(1, n_users), date=moment())
+            for _ in range(rows)
+        ))
+
+    return {
+        'chat': rng.choice(chats), 'user': rng.choice(users), 'mentor': rng.choice(mentors),
+        'student': rng.choice(students), 'project': rng.choice(projects), 'post': rng.choice(posts),
+        'student_ct': student_ct, 'parent_ct': parent_ct, 'parent': parent.id, 'now': now,
+    }
+
+
+def hot_queries(ids):
+    return {
+        'message: chat timeline': Message.objects.filter(chat_id=ids['chat']).order_by('-timestamp')[:50],
+        'message: global list': Message.objects.order_by('-timestamp', '-id')[:50],
+        'engagement: user timeline': EngagementLog.objects.filter(user_id=ids['user']).order_by('-timestamp')[:50],
+        'engagement: global list': EngagementLog.objects.order_by('-timestamp', '-id')[:50],
+        'session: mentor upcoming': Session.objects.filter(mentor_id=ids['mentor'], date_time__gte=ids['now']).order_by('date_time')[:50],
+        'session: student upcoming': Session.objects.filter(student_id=ids['student'], date_time__gte=ids['now']).order_by('date_time')[:50],
+        'submission: project queue': StudentProjectSubmission.objects.filter(
+            project_id=ids['project'], status=StudentProjectSubmission.SUBMITTED).order_by('-submitted_at')[:50],
+        'project: open list': Project.objects.filter(status=Project.OPEN).order_by('-created_at')[:50],
+        'user: directory': User.objects.order_by('-date_joined', '-id')[:50],
+        'user: directory by role': User.objects.filter(role=User.STUDENT).order_by('-date_joined', '-id')[:50],
+        'post: feed': Post.objects.order_by('-created_at', '-id')[:20],
+        'post: by author': Post.objects.filter(author_content_type=ids['student_ct'], author_object_id=ids['student'])[:50],
+        'comment: by author': Comment.objects.filter(author_content_type=ids['student_ct'], author_object_id=ids['student'])[:50],
+        'payment: user history': PaymentTransaction.objects.filter(user_id=ids['user']).order_by('-created_at')[:50],
+        'payment: pending queue': PaymentTransaction.objects.filter(status=PaymentTransaction.PENDING).order_by('-created_at')[:50],
+        'purchase: by purchaser': WorkbookPurchase.objects.filter(
+            purchaser_content_type=ids['parent_ct'], purchaser_object_id=ids['parent'])[:50],
+    }
+
+
+def analyze():
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            for model in INDEXED_MODELS:
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+        elif connection.vendor == 'sqlite':
+            cursor.execute('ANALYZE')
+
+
+def measure(queries, repeats):
+    results = {}
+    for name, queryset in queries.items():
+        list(queryset)  # warm the cache
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {'median_ms': round(statistics.median(timings), 3), 'plan': queryset.explain()}
+    return results
+
+
+def set_indexes(enabled):
+    with connection.schema_editor() as editor:
+        for model in INDEXED_MODELS:
+            for index in model._meta.indexes:
+                if enabled:
+                    editor.add_index(model, index)
+                else:
+                    editor.remove_index(model, index)
+    analyze()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows per hot table (default: 1,000,000)')
+    parser.add_argument('--repeats', type=int, default=20, help='Timed runs per query (default: 20)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the generated data')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    parser.add_argument('--yes', action='store_true', help='Confirm that the target database is disposable')
+    args = parser.parse_args()
+
+    if not args.yes:
+        parser.error(f'refusing to seed {connection.settings_dict["NAME"]} without --yes')
+
+    ids = seed(args.rows, random.Random(args.seed))
+    queries = hot_queries(ids)
+
+    set_indexes(False)
+    try:
+        before = measure(queries, args.repeats)
+    finally:
+        set_indexes(True)
+    after = measure(queries, args.repeats)
+
+    report = {}
+    for name in queries:
+        report[name] = {'before': before[name], 'after': after[name]}
+        print('=' * 78)
+        print(f'{name}: {before[name]["median_ms"]:.3f} ms -> {after[name]["median_ms"]:.3f} ms')
+        print('-- before --')
+        print(before[name]['plan'])
+        print('-- after --')
+        print(after[name]['plan'])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump({'vendor': connection.vendor, 'rows': args.rows, 'queries': report}, handle, indent=2)
+        print(f'\nWrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+JSON serialization throughput: DRF's stdlib JSONRenderer/JSONParser versus
+the orjson-backed FastJSONRenderer/FastJSONParser.
+
+Payloads mirror the API's heavy list responses:
+
+    engagement_logs    unpaginated EngagementLog list with nested metadata
+    progress_trackers  rows carrying Decimal, datetime and UUID values
+    projects           projects with nested skills and long descriptions
+
+Usage (from backend/):
+    python benchmarks/json_benchmark.py
+    python benchmarks/json_benchmark.py --rows 20000 --repeats 20 --json bench_json.json
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+django.setup()
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from backend.parsers import FastJSONParser
+from backend.renderers import FastJSONRenderer, orjson
+
+
+def payloads(rows, rng):
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def moment():
+        return now - timedelta(seconds=rng.randrange(365 * 24 * 3600), microseconds=rng.randrange(10 ** 6))
+
+    actions = ['login', 'view_project', 'view_module', 'submit_project', 'send_message']
+    return {
+        'engagement_logs': [
+            {
+                'id': i, 'user': rng.randrange(1, 100000), 'action_type': rng.choice(actions),
+                'timestamp': moment().isoformat().replace('+00:00', 'Z'),
+                'metadata': {
+                    'path': f'/api/projects/projects/{rng.randrange(1, 5000)}/', 'duration_ms': rng.random() * 500,
+                    'client': {'platform': rng.choice(['web', 'ios', 'android']), 'version': '2.4.1'},
+                    'tags': rng.sample(actions, 2),
+                },
+            }
+            for i in range(rows)
+        ],
+        'progress_trackers': [
+            {
+                'id': i, 'student': rng.randrange(1, 100000), 'module': rng.randrange(1, 100),
+                'progress_percent': Decimal(rng.randrange(0, 10000)) / 100, 'last_updated': moment(),
+                'request_id': uuid.UUID(int=rng.getrandbits(128)), 'amount': Decimal('19.99'),
+            }
+            for i in range(rows)
+        ],
+        'projects': [
+            {
+                'id': i, 'title': f'Project {i}', 'description': 'Build and present a prototype. ' * 20,
+                'status': 'OPEN', 'start_date': now.date(), 'created_at': moment(), 'updated_at': moment(),
+                'skills_required': [
+                    {'id': s, 'name': f'Skill {s}', 'category': 'Technology'} for s in rng.sample(range(200), 5)
+                ],
+            }
+            for i in range(max(1, rows // 10))
+        ],
+    }
+
+
+def timed(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000, help='Rows per list payload (default: 5000)')
+    parser.add_argument('--repeats', type=int, default=10, help='Timed runs per measurement (default: 10)')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    if orjson is None:
+        print('orjson is not installed: FastJSONRenderer falls back to the stdlib, expect no speed-up.')
+
+    results = {}
+    print(f'{"payload":<20} {"op":<7} {"stdlib ms":>10} {"fast ms":>10} {"MB/s fast":>10} {"speed-up":>9}')
+    for name, data in payloads(args.rows, random.Random(7)).items():
+        stdlib_render, stdlib_bytes = timed(lambda: JSONRenderer().render(data), args.repeats)
+        fast_render, fast_bytes = timed(lambda: FastJSONRenderer().render(data), args.repeats)
+        stdlib_parse, _ = timed(lambda: JSONParser().parse(io.BytesIO(stdlib_bytes)), args.repeats)
+        fast_parse, _ = timed(lambda: FastJSONParser().parse(io.BytesIO(stdlib_bytes)), args.repeats)
+        size_mb = len(stdlib_bytes) / 1e6
+        results[name] = {
+            'bytes': len(stdlib_bytes),
+            'render': {'stdlib_ms': stdlib_render * 1000, 'fast_ms': fast_render * 1000},
+            'parse': {'stdlib_ms': stdlib_parse * 1000, 'fast_ms': fast_parse * 1000},
+        }
+        for op, stdlib, fast in (('render', stdlib_render, fast_render), ('parse', stdlib_parse, fast_parse)):
+            print(f'{name:<20} {op:<7} {stdlib * 1000:>10.2f} {fast * 1000:>10.2f} '
+                  f'{size_mb / fast:>10.1f} {stdlib / fast:>8.1f}x')
+        # Same document either way, apart from sub-millisecond datetime digits
+        assert len(json.loads(fast_bytes)) == len(json.loads(stdlib_bytes))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
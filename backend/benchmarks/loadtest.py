@@ -0,0 +1,445 @@
+"""
+Role-mix load test covering the API routes each kind of user hits.
+
+Two steps:
+
+    seed  Create a realistic dataset for every role directly in the project
+          database (same DATABASE_URL as the server under test) and write the
+          account list to a manifest file. Safe to re-run; existing loadtest
+          data is reused unless --reset is given.
+
+    run   Log every virtual user in through /api/users/auth/login/, then drive
+          a weighted traffic mix against a running server for --duration
+          seconds: students browse projects, modules and chat, parents view
+          their children, partners review submissions, schools view their
+          roster and admins browse the directories. Only the HTTP API is used
+          in this step, so the server can be remote.
+
+The run step writes per-endpoint throughput, p50/p95/p99 latency and error
+rate to a JSON report so releases can be compared.
+
+Usage (from backend/):
+    python benchmarks/loadtest.py seed --students 500
+    python benchmarks/loadtest.py run --base-url http://127.0.0.1:8000 --users 100 --duration 60 --output loadtest.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+from http_client import Connection, summarize
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PREFIX = 'loadtest'
+PASSWORD = 'loadtest-pass-123'
+
+# Share of virtual users per role
+ROLE_MIX = {
+    'STUDENT': 0.60,
+    'PARENT': 0.15,
+    'CORPORATE_PARTNER': 0.15,
+    'SCHOOL': 0.05,
+    'ADMIN': 0.05,
+}
+
+
+def setup_django():
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    sys.path.insert(0, BACKEND_DIR)
+    django.setup()
+
+
+def seed(args):
+    setup_django()
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+    from django.utils import timezone
+
+    from achievements.models import Certificate, Skill
+    from analytics.models import ProgressTracker
+    from community.models import GroupChat, Message
+    from learning.models import Module
+    from mentorship.models import MentorProfile, Session
+    from projects.models import Project, StudentProjectSubmission
+    from users.models import (
+        AdminProfile, CorporatePartnerProfile, ParentProfile, SchoolProfile, StudentProfile, User,
+    )
+
+    rng = random.Random(args.seed)
+    existing = User.objects.filter(username__startswith=f'{PREFIX}_')
+    if existing.exists():
+        if not args.reset:
+            print('Loadtest data already present, reusing it (pass --reset to recreate).')
+            write_manifest(args.manifest, User)
+            return
+        existing.delete()
+        GroupChat.objects.filter(name__startswith=PREFIX).delete()
+        Skill.objects.filter(name__startswith=PREFIX).delete()
+
+    counts = {
+        User.STUDENT: args.students,
+        User.PARENT: max(1, args.students // 4),
+        User.SCHOOL: max(1, args.students // 100),
+        User.CORPORATE_PARTNER: max(1, args.students // 50),
+        User.ADMIN: 2,
+    }
+    # One hash for every account: hashing each password would dominate seeding
+    password = make_password(PASSWORD)
+    now = timezone.now()
+
+    with transaction.atomic():
+        User.objects.bulk_create([
+            User(
+                username=f'{PREFIX}_{role.lower()}_{i}', email=f'{PREFIX}_{role.lower()}_{i}@loadtest.test',
+                password=password, role=role, is_verified=True, is_staff=(role == User.ADMIN),
+                first_name=role.title(), last_name=str(i),
+            )
+            for role, count in counts.items() for i in range(count)
+        ], batch_size=1000)
+        users = {
+            role: list(User.objects.filter(username__startswith=f'{PREFIX}_{role.lower()}_').order_by('id'))
+            for role in counts
+        }
+
+        AdminProfile.objects.bulk_create([AdminProfile(user=user) for user in users[User.ADMIN]])
+        admin = AdminProfile.objects.filter(user__in=users[User.ADMIN]).first()
+        SchoolProfile.objects.bulk_create([
+            SchoolProfile(user=user, name=f'Loadtest School {i}') for i, user in enumerate(users[User.SCHOOL])
+        ])
+        schools = list(SchoolProfile.objects.filter(user__in=users[User.SCHOOL]))
+        StudentProfile.objects.bulk_create([
+            StudentProfile(user=user, school=rng.choice(schools), bio='Loadtest student')
+            for user in users[User.STUDENT]
+        ], batch_size=1000)
+        students = list(StudentProfile.objects.filter(user__in=users[User.STUDENT]))
+        CorporatePartnerProfile.objects.bulk_create([
+            CorporatePartnerProfile(user=user, company_name=f'Loadtest Partner {i}', industry='Technology')
+            for i, user in enumerate(users[User.CORPORATE_PARTNER])
+        ])
+        partners = list(CorporatePartnerProfile.objects.filter(user__in=users[User.CORPORATE_PARTNER]))
+        ParentProfile.objects.bulk_create([ParentProfile(user=user) for user in users[User.PARENT]])
+        Links = ParentProfile.students.through
+        Links.objects.bulk_create([
+            Links(parentprofile_id=parent.id, studentprofile_id=student.id)
+            for parent in ParentProfile.objects.filter(user__in=users[User.PARENT])
+            for student in rng.sample(students, min(len(students), rng.randint(1, 3)))
+        ], ignore_conflicts=True)
+
+        Skill.objects.bulk_create([Skill(name=f'{PREFIX} skill {i}', category='Loadtest') for i in range(30)])
+        skills = list(Skill.objects.filter(name__startswith=PREFIX))
+        Project.objects.bulk_create([
+            Project(title=f'Loadtest project {p.id}-{i}', description='Realistic enough project brief.',
+                    created_by=p, status=rng.choice([Project.OPEN, Project.OPEN, Project.DRAFT, Project.CLOSED]),
+                    start_date=date.today(), end_date=date.today() + timedelta(days=60))
+            for p in partners for i in range(10)
+        ])
+        projects = list(Project.objects.filter(created_by__in=partners))
+        Project.skills_required.through.objects.bulk_create([
+            Project.skills_required.through(project_id=project.id, skill_id=skill.id)
+            for project in projects for skill in rng.sample(skills, 3)
+        ])
+        Module.objects.bulk_create([
+            Module(title=f'Loadtest module {i}', description='Module body', created_by=admin, is_published=True)
+            for i in range(20)
+        ])
+        StudentProjectSubmission.objects.bulk_create([
+            StudentProjectSubmission(student=student, project=project, submission_link='https://example.com/work')
+            for student in students for project in rng.sample(projects, min(3, len(projects)))
+        ], batch_size=1000)
+        ProgressTracker.objects.bulk_create([
+            ProgressTracker(student=student, project=rng.choice(projects), progress_percent=rng.randint(0, 100))
+            for student in students for _ in range(2)
+        ], batch_size=1000)
+        Certificate.objects.bulk_create([
+            Certificate(title='Loadtest certificate', issued_to=student, issue_date=date.today())
+            for student in rng.sample(students, len(students) // 3)
+        ], batch_size=1000)
+        mentors = MentorProfile.objects.bulk_create([MentorProfile(user=p, bio='Loadtest mentor') for p in partners])
+        Session.objects.bulk_create([
+            Session(mentor=rng.choice(mentors), student=student, date_time=now + timedelta(days=rng.randint(1, 30)),
+                    duration=45)
+            for student in students
+        ], batch_size=1000)
+
+        chats = GroupChat.objects.bulk_create([GroupChat(name=f'{PREFIX} chat {i}') for i in range(10)])
+        Members = GroupChat.members.through
+        Members.objects.bulk_create([
+            Members(groupchat_id=chat.id, user_id=user.id)
+            for user in users[User.STUDENT] for chat in rng.sample(chats, 2)
+        ], batch_size=1000)
+        Message.objects.bulk_create([
+            Message(chat=rng.choice(chats), sender=rng.choice(users[User.STUDENT]), content='Hello from load test')
+            for _ in range(args.students * 10)
+        ], batch_size=1000)
+
+    print('Seeded: ' + ', '.join(f'{count} {role.lower()}' for role, count in counts.items()))
+    write_manifest(args.manifest, User)
+
+
+def write_manifest(path, User):
+    accounts = {}
+    for role in ROLE_MIX:
+        accounts[role] = list(
+            User.objects.filter(username__startswith=f'{PREFIX}_{role.lower()}_').order_by('id')
+            .values_list('email', flat=True)
+        )
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump({'password': PASSWORD, 'accounts': accounts}, handle, indent=2)
+    print(f'Wrote {path}')
+
+
+class VirtualUser:
+    """One logged-in client with its own keep-alive connection and role behaviour."""
+
+    def __init__(self, role, email, password, host, port, rng, recorder):
+        self.role = role
+        self.email = email
+        self.password = password
+        self.connection = Connection(host, port)
+        self.rng = rng
+        self.record = recorder
+        self.headers = {}
+        self.user = {}
+        self.project_ids = []
+        self.submission_ids = []
+        self.chat_ids = []
+
+    async def call(self, label, method, path, body=None):
+        try:
+            status, data, elapsed = await self.connection.request(method, path, self.headers, body)
+        except OSError:
+            self.record(label, None, False)
+            return None
+        ok = 200 <= status < 300 or status == 304
+        self.record(label, elapsed, ok)
+        if ok and data:
+            try:
+                return json.loads(data)
+            except ValueError:
+                return None
+        return None
+
+    async def login(self):
+        data = await self.call('POST /api/users/auth/login/', 'POST', '/api/users/auth/login/',
+                               {'email': self.email, 'password': self.password})
+        if not data:
+            return False
+        self.headers = {'Authorization': f'Bearer {data["access"]}'}
+        self.user = data['user']
+        return True
+
+    @staticmethod
+    def _results(data):
+        if isinstance(data, dict):
+            return data.get('results', [])
+        return data or []
+
+    # Student behaviour
+    async def browse_projects(self):
+        data = await self.call('GET /api/projects/projects/', 'GET', '/api/projects/projects/?page_size=20')
+        self.project_ids = [project['id'] for project in self._results(data)] or self.project_ids
+
+    async def view_project(self):
+        if not self.project_ids:
+            return await self.browse_projects()
+        project_id = self.rng.choice(self.project_ids)
+        await self.call('GET /api/projects/projects/{id}/', 'GET', f'/api/projects/projects/{project_id}/')
+
+    async def browse_modules(self):
+        await self.call('GET /api/learning/modules/', 'GET', '/api/learning/modules/')
+
+    async def browse_skills(self):
+        await self.call('GET /api/achievements/skills/', 'GET', '/api/achievements/skills/')
+
+    async def me(self):
+        await self.call('GET /api/users/users/me/', 'GET', '/api/users/users/me/')
+
+    async def read_chat(self):
+        await self.call('GET /api/community/messages/', 'GET', '/api/community/messages/?page_size=50')
+
+    async def send_message(self):
+        if not self.chat_ids:
+            data = await self.call('GET /api/community/group-chats/', 'GET', '/api/community/group-chats/?page_size=20')
+            self.chat_ids = [chat['id'] for chat in self._results(data)]
+            if not self.chat_ids:
+                return
+        await self.call('POST /api/community/messages/', 'POST', '/api/community/messages/', {
+            'chat': self.rng.choice(self.chat_ids), 'sender': self.user['id'], 'content': 'Load test message',
+        })
+
+    # Parent behaviour
+    async def view_parent_profile(self):
+        await self.call('GET /api/users/parents/', 'GET', '/api/users/parents/')
+
+    async def view_children(self):
+        await self.call('GET /api/users/students/', 'GET', '/api/users/students/')
+
+    async def view_progress(self):
+        await self.call('GET /api/analytics/progress-trackers/', 'GET', '/api/analytics/progress-trackers/?page_size=20')
+
+    async def view_certificates(self):
+        await self.call('GET /api/achievements/certificates/', 'GET', '/api/achievements/certificates/?page_size=20')
+
+    async def view_sessions(self):
+        await self.call('GET /api/mentorship/mentorship-sessions/', 'GET',
+                        '/api/mentorship/mentorship-sessions/?page_size=20')
+
+    # Corporate partner behaviour
+    async def list_submissions(self):
+        data = await self.call('GET /api/projects/student-submissions/', 'GET',
+                               '/api/projects/student-submissions/?page_size=50')
+        self.submission_ids = [submission['id'] for submission in self._results(data)] or self.submission_ids
+
+    async def review_submission(self):
+        if not self.submission_ids:
+            return await self.list_submissions()
+        submission_id = self.rng.choice(self.submission_ids)
+        await self.call('PATCH /api/projects/student-submissions/{id}/', 'PATCH',
+                        f'/api/projects/student-submissions/{submission_id}/',
+                        {'status': 'REVIEWED', 'feedback': 'Reviewed during load test'})
+
+    # School and admin behaviour
+    async def view_roster(self):
+        await self.call('GET /api/users/students/', 'GET', '/api/users/students/?page_size=50')
+
+    async def view_school(self):
+        await self.call('GET /api/users/schools/', 'GET', '/api/users/schools/')
+
+    async def user_directory(self):
+        await self.call('GET /api/users/users/', 'GET', '/api/users/users/?page_size=50')
+
+    async def payments(self):
+        await self.call('GET /api/payments/payment-transactions/', 'GET',
+                        '/api/payments/payment-transactions/?page_size=50')
+
+    def actions(self):
+        """Weighted behaviour for this user's role."""
+        return {
+            'STUDENT': [
+                (self.browse_projects, 4), (self.view_project, 2), (self.browse_modules, 3), (self.browse_skills, 1),
+                (self.me, 1), (self.read_chat, 3), (self.send_message, 1),
+            ],
+            'PARENT': [
+                (self.view_parent_profile, 1), (self.view_children, 3), (self.view_progress, 2),
+                (self.view_certificates, 1), (self.view_sessions, 1),
+            ],
+            'CORPORATE_PARTNER': [
+                (self.browse_projects, 2), (self.list_submissions, 3), (self.review_submission, 1),
+            ],
+            'SCHOOL': [(self.view_roster, 3), (self.view_school, 1)],
+            'ADMIN': [(self.user_directory, 2), (self.browse_projects, 1), (self.payments, 1)],
+        }[self.role]
+
+    async def run(self, deadline, think):
+        actions, weights = zip(*self.actions())
+        while time.perf_counter() < deadline:
+            await self.rng.choices(actions, weights)[0]()
+            if think:
+                await asyncio.sleep(self.rng.expovariate(1 / think))
+        self.connection.close()
+
+
+async def run_load(args, manifest):
+    parts = urlsplit(args.base_url)
+    host, port = parts.hostname, parts.port or 80
+    rng = random.Random(args.seed)
+    samples = {}
+
+    def record(label, elapsed, ok):
+        entry = samples.setdefault(label, {'latencies': [], 'errors': 0})
+        if ok:
+            entry['latencies'].append(elapsed)
+        else:
+            entry['errors'] += 1
+
+    users = []
+    for role, share in ROLE_MIX.items():
+        accounts = manifest['accounts'].get(role, [])
+        wanted = round(args.users * share)
+        for i in range(min(wanted, len(accounts)) if accounts else 0):
+            users.append(VirtualUser(role, accounts[i], manifest['password'], host, port,
+                                     random.Random(rng.random()), record))
+
+    login_started = time.perf_counter()
+    logged_in = await asyncio.gather(*(user.login() for user in users))
+    login_elapsed = time.perf_counter() - login_started
+    # Logins happen in a burst before the timed window, so report them apart
+    login = samples.pop('POST /api/users/auth/login/', {'latencies': [], 'errors': 0})
+    users = [user for user, ok in zip(users, logged_in) if ok]
+    print(f'{len(users)} virtual users logged in')
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(user.run(deadline, args.think_ms / 1000) for user in users))
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [value for entry in samples.values() for value in entry['latencies']]
+    return {
+        'base_url': args.base_url,
+        'duration_s': round(elapsed, 2),
+        'virtual_users': len(users),
+        'role_mix': {role: sum(1 for user in users if user.role == role) for role in ROLE_MIX},
+        'login': summarize(login['latencies'], login['errors'], login_elapsed),
+        'totals': summarize(all_latencies, sum(entry['errors'] for entry in samples.values()), elapsed),
+        'endpoints': {
+            label: summarize(entry['latencies'], entry['errors'], elapsed)
+            for label, entry in sorted(samples.items())
+        },
+    }
+
+
+def run(args):
+    with open(args.manifest, encoding='utf-8') as handle:
+        manifest = json.load(handle)
+    report = asyncio.run(run_load(args, manifest))
+    login = report['login']
+    print(f'login burst: {login["requests"]} requests, p50 {login["p50_ms"]} ms, p99 {login["p99_ms"]} ms, '
+          f'errors {login["error_rate"]:.2%}')
+
+    print(f'{"endpoint":<52} {"req/s":>8} {"p50":>8} {"p95":>8} {"p99":>8} {"errors":>7}')
+    for label, stats in report['endpoints'].items():
+        print(f'{label:<52} {stats["throughput_rps"]:>8} {stats["p50_ms"]!s:>8} {stats["p95_ms"]!s:>8} '
+              f'{stats["p99_ms"]!s:>8} {stats["error_rate"]:>7.2%}')
+    totals = report['totals']
+    print(f'{"TOTAL":<52} {totals["throughput_rps"]:>8} {totals["p50_ms"]!s:>8} {totals["p95_ms"]!s:>8} '
+          f'{totals["p99_ms"]!s:>8} {totals["error_rate"]:>7.2%}')
+
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+    print(f'Wrote {args.output}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--manifest', default='loadtest_accounts.json', help='Account manifest written by seed')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed for data and traffic')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = commands.add_parser('seed', help='Create loadtest data in the project database')
+    seed_parser.add_argument('--students', type=int, default=500, help='Student accounts; other roles scale from it')
+    seed_parser.add_argument('--reset', action='store_true', help='Delete and recreate existing loadtest data')
+
+    run_parser = commands.add_parser('run', help='Drive traffic against a running server')
+    run_parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    run_parser.add_argument('--users', type=int, default=50, help='Concurrent virtual users (default: 50)')
+    run_parser.add_argument('--duration', type=float, default=60, help='Seconds of traffic (default: 60)')
+    run_parser.add_argument('--think-ms', type=float, default=0, help='Mean pause between a user\'s requests')
+    run_parser.add_argument('--output', default='loadtest_report.json', help='JSON report path')
+
+    args = parser.parse_args()
+    if args.command == 'seed':
+        seed(args)
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
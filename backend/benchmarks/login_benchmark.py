@@ -0,0 +1,222 @@
+"""
+Login throughput before and after the single-query profile resolution.
+
+    before   the previous DRF login view: ``User.objects.get(email=...)``,
+             then a second ``*Profile.objects.get(user=user)`` picked by a
+             role if-chain, and plain ``RefreshToken.for_user``
+    after    the current ``users.auth_views.login``: one joined query and
+             profile claims in the JWT, with the password checked inline
+             (``PASSWORD_VERIFY['WORKERS'] = 0``) as "before" does
+    pool     the same view with the password checked on the bounded
+             verifier thread pool, as configured by ``PASSWORD_VERIFY``
+
+The current view is async, so "after" and "pool" run on one event loop, as
+under an ASGI worker, and their sync work (queries, hashing inline) hops to
+Django's sync thread. To report that overhead separately, "before-async" runs
+the previous view through ``sync_to_async`` on the same loop:
+
+    before-async vs before   the async hand-off alone
+    after vs before-async    the current view: one query fewer and the
+                             profile claims, but several sync hand-offs
+    pool vs after            the verifier pool hand-off
+
+All run in-process, one login at a time, with the same requests and users.
+The pool only pays off under concurrent logins; see login_load_benchmark.py.
+
+Password hashing normally dominates a login, so by default the users are
+created with Django's fast MD5 hasher to expose the database and token cost.
+Pass --real-hasher to time against the configured PASSWORD_HASHERS instead.
+
+Creates --users accounts spread over every role and deletes them at the end;
+run it against a development or throwaway database.
+
+Usage (from backend/):
+    python benchmarks/login_benchmark.py --yes
+    DATABASE_URL=postgres://localhost/aa_bench python benchmarks/login_benchmark.py --yes --logins 5000 --json bench_login.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+import django
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+django.setup()
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, reset_queries
+from django.test.utils import override_settings
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users import hashing
+from users.auth_views import login
+from users.models import (
+    AdminProfile, CorporatePartnerProfile, ParentProfile, SchoolProfile, StudentProfile, User,
+)
+
+PASSWORD = 'bench-password'
+LEGACY_PROFILES = {
+    User.STUDENT: StudentProfile,
+    User.CORPORATE_PARTNER: CorporatePartnerProfile,
+    User.PARENT: ParentProfile,
+    User.ADMIN: AdminProfile,
+}
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def legacy_login(request):
+    """The login view as it was before profile resolution was joined."""
+    try:
+        user = User.objects.get(email=request.data.get('email'))
+    except User.DoesNotExist:
+        return Response({'error': 'Invalid email or password'}, status=status.HTTP_401_UNAUTHORIZED)
+    if not user.check_password(request.data.get('password')) or not user.is_active:
+        return Response({'error': 'Invalid email or password'}, status=status.HTTP_401_UNAUTHORIZED)
+    refresh = RefreshToken.for_user(user)
+    profile_id = None
+    model = LEGACY_PROFILES.get(user.role)
+    if model is not None:
+        try:
+            profile_id = model.objects.get(user=user).id
+        except model.DoesNotExist:
+            pass
+    return Response({
+        'access': str(refresh.access_token), 'refresh': str(refresh),
+        'user': {'id': user.id, 'email': user.email, 'role': user.role, 'profile_id': profile_id},
+    })
+
+
+def seed(count, hasher):
+    prefix = f'loginbench{int(time.time())}'
+    password = make_password(PASSWORD, hasher=hasher)
+    roles = [User.STUDENT, User.PARENT, User.SCHOOL, User.CORPORATE_PARTNER, User.ADMIN]
+    User.objects.bulk_create(
+        User(username=f'{prefix}_{i}', email=f'{prefix}_{i}@bench.test', password=password, role=roles[i % len(roles)])
+        for i in range(count)
+    )
+    users = list(User.objects.filter(username__startswith=f'{prefix}_'))
+    by_role = {role: [user for user in users if user.role == role] for role in roles}
+    StudentProfile.objects.bulk_create(StudentProfile(user=user) for user in by_role[User.STUDENT])
+    ParentProfile.objects.bulk_create(ParentProfile(user=user) for user in by_role[User.PARENT])
+    SchoolProfile.objects.bulk_create(SchoolProfile(user=user, name=user.username) for user in by_role[User.SCHOOL])
+    CorporatePartnerProfile.objects.bulk_create(
+        CorporatePartnerProfile(user=user, company_name=user.username) for user in by_role[User.CORPORATE_PARTNER]
+    )
+    AdminProfile.objects.bulk_create(AdminProfile(user=user) for user in by_role[User.ADMIN])
+    return prefix, [user.email for user in users]
+
+
+@contextmanager
+def verifier(workers=None):
+    """Check login passwords on ``workers`` threads (0: inline); None keeps the configured pool."""
+    saved = hashing._verifier
+    if workers is not None:
+        hashing._verifier = hashing.PasswordVerifier(workers, 0)
+    try:
+        yield
+    finally:
+        hashing._verifier = saved
+
+
+def run(view, emails, logins, rng):
+    factory = APIRequestFactory()
+    requests = [
+        factory.post('/api/users/auth/login/', {'email': rng.choice(emails), 'password': PASSWORD}, format='json')
+        for _ in range(logins)
+    ]
+    latencies = []
+    queries = 0
+
+    def timed(response, start, end):
+        nonlocal queries
+        latencies.append((end - start) * 1000)
+        queries += len(connection.queries)
+        assert response.status_code == 200, response.content
+
+    async def run_async():
+        # One event loop for every request, as under a running ASGI worker.
+        # The view's queries run on the thread-sensitive sync thread, so the
+        # query log is reset and read there too.
+        for request in requests:
+            await sync_to_async(reset_queries)()
+            start = time.perf_counter()
+            response = await view(request)
+            await sync_to_async(timed)(response, start, time.perf_counter())
+
+    started = time.perf_counter()
+    with override_settings(DEBUG=True):
+        if iscoroutinefunction(view):
+            async_to_sync(run_async)()
+        else:
+            for request in requests:
+                reset_queries()
+                start = time.perf_counter()
+                response = view(request)
+                timed(response, start, time.perf_counter())
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'logins_per_s': round(logins / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies), 3),
+        'p99_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3),
+        'queries_per_login': round(queries / logins, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=5000, help='Accounts to create, spread over all roles (default: 5000)')
+    parser.add_argument('--logins', type=int, default=2000, help='Timed logins per variant (default: 2000)')
+    parser.add_argument('--real-hasher', action='store_true', help='Hash passwords with the configured hasher')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    parser.add_argument('--yes', action='store_true', help='Confirm that benchmark users may be written to the database')
+    args = parser.parse_args()
+
+    if not args.yes:
+        parser.error(f'refusing to write benchmark users to {connection.settings_dict["NAME"]} without --yes')
+
+    hasher = 'default' if args.real_hasher else 'md5'
+    hashers = {} if args.real_hasher else {'PASSWORD_HASHERS': ['django.contrib.auth.hashers.MD5PasswordHasher']}
+    with override_settings(**hashers):
+        prefix, emails = seed(args.users, hasher)
+        try:
+            run(login, emails, min(50, args.logins), random.Random(0))  # warm-up
+            results = {
+                'before': run(legacy_login, emails, args.logins, random.Random(1)),
+                'before-async': run(sync_to_async(legacy_login), emails, args.logins, random.Random(1)),
+            }
+            with verifier(0):
+                results['after'] = run(login, emails, args.logins, random.Random(1))
+            with verifier():
+                results['pool'] = run(login, emails, args.logins, random.Random(1))
+        finally:
+            User.objects.filter(username__startswith=f'{prefix}_').delete()
+
+    print(f'{connection.vendor}, {args.users} users, {args.logins} logins, {hasher} hasher')
+    print(f'{"variant":<12} {"logins/s":>10} {"p50 ms":>9} {"p99 ms":>9} {"queries":>8}')
+    for name, result in results.items():
+        print(f'{name:<12} {result["logins_per_s"]:>10} {result["p50_ms"]:>9} {result["p99_ms"]:>9} '
+              f'{result["queries_per_login"]:>8}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump({'vendor': connection.vendor, 'hasher': hasher, 'results': results}, handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Login burst throughput and its effect on concurrent non-login traffic.
+
+Starts gunicorn (ASGI, as deployed) twice from backend/:
+
+    inline   PASSWORD_VERIFY_WORKERS=0: PBKDF2 runs on Django's sync thread,
+             as the DRF login view did
+    pool     the bounded verifier pool (PASSWORD_VERIFY_* from the environment)
+
+For each, GET /api/users/users/me/ is measured alone, then again while
+--logins clients POST to /api/users/auth/login/ as fast as they can. The
+report gives logins/s, login latency, how many logins were refused with 503,
+and the me/ latency with and without the login burst.
+
+Uses the configured PASSWORD_HASH_ITERATIONS, so the numbers reflect the real
+hashing cost. A benchmark user is created if missing.
+
+Usage (from backend/):
+    python benchmarks/login_load_benchmark.py
+    python benchmarks/login_load_benchmark.py --logins 100 --readers 50 --duration 15 --workers 2 --json bench_login_load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+import django
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, BACKEND_DIR)
+django.setup()
+
+from users.models import StudentProfile, User
+from users.tokens import ProfileRefreshToken
+
+from http_client import Connection, summarize
+
+EMAIL = 'loginbench@test.com'
+PASSWORD = 'loginbench-password'
+ME_PATH = '/api/users/users/me/'
+LOGIN_PATH = '/api/users/auth/login/'
+
+
+def bench_user():
+    user, created = User.objects.get_or_create(
+        email=EMAIL, defaults={'username': 'loginbench_user', 'role': User.STUDENT},
+    )
+    if created or not user.check_password(PASSWORD):
+        user.set_password(PASSWORD)
+        user.save()
+    profile, _ = StudentProfile.objects.get_or_create(user=user)
+    return str(ProfileRefreshToken.for_user(user, profile_id=profile.id).access_token)
+
+
+async def client(host, port, method, path, headers, body, deadline, latencies, statuses):
+    connection = Connection(host, port)
+    while time.perf_counter() < deadline:
+        try:
+            status, _, elapsed = await connection.request(method, path, headers, body)
+        except OSError:
+            statuses.append('connection error')
+            await asyncio.sleep(0.01)
+            continue
+        if status == 200:
+            latencies.append(elapsed)
+        else:
+            statuses.append(status)
+    connection.close()
+
+
+async def drive(host, port, token, readers, logins, duration):
+    deadline = time.perf_counter() + duration
+    me_latencies, me_errors, login_latencies, login_errors = [], [], [], []
+    await asyncio.gather(
+        *(client(host, port, 'GET', ME_PATH, {'Authorization': f'Bearer {token}'}, None,
+                 deadline, me_latencies, me_errors) for _ in range(readers)),
+        *(client(host, port, 'POST', LOGIN_PATH, {}, {'email': EMAIL, 'password': PASSWORD},
+                 deadline, login_latencies, login_errors) for _ in range(logins)),
+    )
+    result = {'me': summarize(me_latencies, len(me_errors), duration)}
+    if logins:
+        result['login'] = summarize(login_latencies, len(login_errors), duration)
+        result['login']['logins_per_s'] = round(len(login_latencies) / duration, 2)
+        result['login']['refused_503'] = login_errors.count(503)
+    return result
+
+
+def start_server(port, workers, env_overrides):
+    env = dict(os.environ, GUNICORN_ASGI='True', WEB_CONCURRENCY=str(workers), DEBUG='False',
+               ALLOWED_HOSTS='127.0.0.1,localhost', PERF_PROFILER_ENABLED='False', **env_overrides)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env,
+    )
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}{ME_PATH}', timeout=1)
+            return process
+        except OSError as exc:
+            if getattr(exc, 'code', None):
+                return process
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError('gunicorn did not start')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--logins', type=int, default=50, help='Concurrent login clients (default: 50)')
+    parser.add_argument('--readers', type=int, default=20, help='Concurrent me/ clients (default: 20)')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per measurement (default: 10)')
+    parser.add_argument('--workers', type=int, default=2, help='Gunicorn workers (default: 2)')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    token = bench_user()
+    modes = {'inline': {'PASSWORD_VERIFY_WORKERS': '0'}, 'pool': {}}
+    results = {}
+    for mode, env in modes.items():
+        server = start_server(args.port, args.workers, env)
+        try:
+            idle = asyncio.run(drive('127.0.0.1', args.port, token, args.readers, 0, args.duration))
+            burst = asyncio.run(drive('127.0.0.1', args.port, token, args.readers, args.logins, args.duration))
+        finally:
+            server.terminate()
+            server.wait()
+        results[mode] = {'me_idle': idle['me'], 'me_during_logins': burst['me'], 'login': burst['login']}
+
+    print(f'{"mode":<7} {"logins/s":>9} {"login p50":>10} {"login p99":>10} {"503s":>6} '
+          f'{"me p50 idle":>12} {"me p50 burst":>13} {"me p99 burst":>13}')
+    for mode, result in results.items():
+        login = result['login']
+        print(f'{mode:<7} {login["logins_per_s"]:>9} {login["p50_ms"]!s:>10} {login["p99_ms"]!s:>10} '
+              f'{login["refused_503"]:>6} {result["me_idle"]["p50_ms"]!s:>12} '
+              f'{result["me_during_logins"]["p50_ms"]!s:>13} {result["me_during_logins"]["p99_ms"]!s:>13}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
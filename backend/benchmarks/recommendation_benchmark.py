@@ -0,0 +1,98 @@
+"""
+Ranking latency of the skill -> project inverted index.
+
+Builds a ``projects.recommendations.SkillIndex`` in memory from synthetic
+projects (no database), then times ``rank`` for random students. Skill
+popularity follows a Zipf-like curve (``--skew``), so a few skills are
+required by many projects, as in a real catalogue. Also times re-indexing single projects,
+which is what replaying the shared change log costs per change.
+
+Usage (from backend/):
+    python benchmarks/recommendation_benchmark.py
+    python benchmarks/recommendation_benchmark.py --projects 100000 --skills 300 --student-skills 12 --json bench_recommend.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+django.setup()
+
+from projects.recommendations import SkillIndex
+
+
+def percentile(latencies, fraction):
+    return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))], 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--projects', type=int, default=100_000, help='Open projects (default: 100,000)')
+    parser.add_argument('--skills', type=int, default=300, help='Skills in the catalogue (default: 300)')
+    parser.add_argument('--project-skills', type=int, default=4, help='Skills required per project (default: 4)')
+    parser.add_argument('--student-skills', type=int, default=8, help='Skills per student (default: 8)')
+    parser.add_argument('--queries', type=int, default=1000, help='Timed rankings (default: 1000)')
+    parser.add_argument('--limit', type=int, default=20, help='Top k (default: 20)')
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='Zipf exponent of skill popularity; 0 is uniform (default: 1.0)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = list(range(1, args.skills + 1))
+    popularity = [1 / rank ** args.skew for rank in skills]
+    rows = [
+        (project_id, skill_id)
+        for project_id in range(1, args.projects + 1)
+        for skill_id in set(rng.choices(skills, popularity, k=args.project_skills))
+    ]
+
+    index = SkillIndex()
+    start = time.perf_counter()
+    index.replace((), rows)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    students = [set(rng.choices(skills, popularity, k=args.student_skills)) for _ in range(args.queries)]
+    latencies = []
+    for student in students:
+        start = time.perf_counter()
+        index.rank(student, args.limit)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    updates = []
+    for _ in range(args.queries):
+        project_id = rng.randrange(1, args.projects + 1)
+        new_rows = [(project_id, skill) for skill in set(rng.choices(skills, popularity, k=args.project_skills))]
+        start = time.perf_counter()
+        index.replace([project_id], new_rows)
+        updates.append((time.perf_counter() - start) * 1000)
+
+    results = {
+        'projects': args.projects,
+        'skew': args.skew,
+        'build_ms': round(build_ms, 1),
+        'rank_p50_ms': percentile(latencies, 0.5),
+        'rank_p99_ms': percentile(latencies, 0.99),
+        'reindex_one_p50_ms': round(statistics.median(updates), 4),
+    }
+    for name, value in results.items():
+        print(f'{name:<20} {value}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
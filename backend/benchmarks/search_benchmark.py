@@ -0,0 +1,157 @@
+"""
+Full-text search latency against a scan of titles and descriptions.
+
+Seeds --rows projects, modules and workbooks (split evenly) whose titles and
+descriptions are drawn from a synthetic vocabulary with Zipf-like word
+frequencies, so some words occur in a large share of rows and most are rare.
+Then times, for rare, common and two-word queries:
+
+    indexed  search.backends.search: the tsvector/GIN index on PostgreSQL,
+             the FTS5 table on SQLite, ranked and highlighted
+    scan     title/description ``icontains`` over the same tables, unranked,
+             as a search without the index would run
+
+This writes --rows rows and leaves them in place: run it against a throwaway
+database only.
+
+Usage (from backend/):
+    python benchmarks/search_benchmark.py --yes
+    DATABASE_URL=postgres://localhost/aa_bench python benchmarks/search_benchmark.py --yes --rows 1000000 --json bench_search.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+django.setup()
+
+from django.db import connection, transaction
+
+from learning.models import Module, Workbook
+from projects.models import Project
+from search import backends
+from users.models import AdminProfile, CorporatePartnerProfile, User
+
+BATCH = 5000
+
+
+def vocabulary(rng, size):
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 9))))
+    return sorted(words)
+
+
+def seed(rows, words, skew, rng):
+    prefix = f'searchbench{int(time.time())}'
+    admin_user = User.objects.create_user(username=f'{prefix}_admin', email=f'{prefix}_admin@bench.test', role=User.ADMIN)
+    admin = AdminProfile.objects.create(user=admin_user)
+    partner_user = User.objects.create_user(
+        username=f'{prefix}_partner', email=f'{prefix}_partner@bench.test', role=User.CORPORATE_PARTNER,
+    )
+    partner = CorporatePartnerProfile.objects.create(user=partner_user, company_name=prefix)
+    cumulative = list(itertools.accumulate(1 / rank ** skew for rank in range(1, len(words) + 1)))
+    statuses = [value for value, _ in Project.STATUS_CHOICES]
+
+    def text(count):
+        return ' '.join(rng.choices(words, cum_weights=cumulative, k=count))
+
+    builders = {
+        Project: lambda: Project(
+            title=text(5), description=text(40), created_by=partner, status=rng.choice(statuses),
+        ),
+        Module: lambda: Module(
+            title=text(5), description=text(40), created_by=admin, is_published=rng.random() < 0.7,
+        ),
+        Workbook: lambda: Workbook(
+            title=text(5), description=text(40), created_by=admin, pdf_file='workbooks/bench.pdf',
+        ),
+    }
+    for number, (model, build) in enumerate(builders.items()):
+        count = rows // len(builders) + (1 if number < rows % len(builders) else 0)
+        for start in range(0, count, BATCH):
+            with transaction.atomic():
+                model.objects.bulk_create(build() for _ in range(min(BATCH, count - start)))
+
+
+def scan(query, limit):
+    return backends._search_fallback(
+        query, list(backends.KINDS), {'status': None, 'is_published': None, 'project_owner': None}, limit, 0,
+    )
+
+
+def time_queries(function, queries, limit):
+    latencies, hits = [], 0
+    for query in queries:
+        start = time.perf_counter()
+        hits += len(function(query, limit))
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        'p50_ms': round(statistics.median(latencies), 3),
+        'p99_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3),
+        'mean_hits': round(hits / len(queries), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows to seed over the three models (default: 1,000,000)')
+    parser.add_argument('--words', type=int, default=50_000, help='Vocabulary size (default: 50,000)')
+    parser.add_argument('--skew', type=float, default=1.0, help='Zipf exponent of word frequency (default: 1.0)')
+    parser.add_argument('--queries', type=int, default=200, help='Timed indexed searches per query kind (default: 200)')
+    parser.add_argument('--scan-queries', type=int, default=10, help='Timed scans per query kind (default: 10)')
+    parser.add_argument('--limit', type=int, default=20, help='Hits per search (default: 20)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    parser.add_argument('--yes', action='store_true', help='Confirm that benchmark rows may be written to the database')
+    args = parser.parse_args()
+
+    if not args.yes:
+        parser.error(f'refusing to write benchmark rows to {connection.settings_dict["NAME"]} without --yes')
+
+    rng = random.Random(args.seed)
+    words = vocabulary(rng, args.words)
+    start = time.perf_counter()
+    seed(args.rows, words, args.skew, rng)
+    seed_s = round(time.perf_counter() - start, 1)
+    common, rare = words[:50], words[len(words) // 2:]
+    kinds = {
+        'rare word': [rng.choice(rare) for _ in range(args.queries)],
+        'common word': [rng.choice(common) for _ in range(args.queries)],
+        'two words': [f'{rng.choice(common)} {rng.choice(words[:2000])}' for _ in range(args.queries)],
+    }
+    indexed = lambda query, limit: backends.search(query, limit=limit)  # noqa: E731
+    results = {}
+    for kind, queries in kinds.items():
+        indexed(queries[0], args.limit)  # warm-up
+        results[kind] = {
+            'indexed': time_queries(indexed, queries, args.limit),
+            'scan': time_queries(scan, queries[:args.scan_queries], args.limit),
+        }
+
+    print(f'{connection.vendor}, {args.rows} rows seeded in {seed_s}s, {args.words} words, limit {args.limit}')
+    print(f'{"query":<12} {"variant":<8} {"p50 ms":>10} {"p99 ms":>10} {"hits":>6}')
+    for kind, variants in results.items():
+        for variant, result in variants.items():
+            print(f'{kind:<12} {variant:<8} {result["p50_ms"]:>10} {result["p99_ms"]:>10} {result["mean_hits"]:>6}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump({'vendor': connection.vendor, 'rows': args.rows, 'seed_s': seed_s, 'results': results},
+                      handle, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+from backend.async_api import async_api_view, list_response
+from .models import Message
+from .serializers import MessageSerializer
+from .views import MessageViewSet
+
+
+@async_api_view
+async def message_list(request):
+    """
+    Async version of GET /api/community/messages/.
+    Optional ?chat=<id> narrows the list to one group chat.
+    """
+    queryset = Message.objects.all().order_by('-timestamp')
+    chat_id = request.GET.get('chat')
+    if chat_id is not None:
+        queryset = queryset.filter(chat_id=chat_id) if chat_id.isdigit() else queryset.none()
+    return await list_response(request, queryset, MessageSerializer, MessageViewSet)
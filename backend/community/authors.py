@@ -0,0 +1,55 @@
+"""
+Batched resolution of the generic ``author`` of posts and comments.
+
+``author_prefetch()`` makes a list of posts or comments load its authors
+with one query per author type (students, mentors) instead of one per row.
+Content types are looked up through ``ContentType.objects``' per-process
+cache, so neither creating nor rendering a row queries the content type table.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+
+from mentorship.models import MentorProfile
+from users.models import StudentProfile
+
+MENTOR = 'MENTOR'
+
+
+def author_prefetch(lookup='author'):
+    """Prefetch ``lookup`` together with the rows its summary reads."""
+    return GenericPrefetch(lookup, [
+        StudentProfile.objects.select_related('user'),
+        MentorProfile.objects.select_related('user'),
+    ])
+
+
+def get_author_content_type(author_type):
+    """
+    The content type named by ``'app_label.ModelName'``. Raises ``ValueError``
+    or ``ContentType.DoesNotExist`` for unknown names.
+    """
+    app_label, model_name = author_type.split('.')
+    return ContentType.objects.get_by_natural_key(app_label, model_name.lower())
+
+
+def author_summary(obj):
+    """``{type, id, name, role, avatar}`` for ``obj.author``, or None if it was deleted."""
+    author = obj.author
+    if author is None:
+        return None
+    content_type = ContentType.objects.get_for_id(obj.author_content_type_id)
+    summary = {
+        'type': f'{content_type.app_label}.{content_type.model}',
+        'id': obj.author_object_id,
+        'name': str(author),
+        'role': None,
+        'avatar': None,
+    }
+    if isinstance(author, StudentProfile):
+        summary['name'] = author.user.get_full_name() or author.user.username
+        summary['role'] = author.user.role
+    elif isinstance(author, MentorProfile):
+        summary['name'] = author.user.company_name if author.user else 'Independent mentor'
+        summary['role'] = MENTOR
+        summary['avatar'] = (author.user.logo or None) if author.user else None
+    return summary
@@ -16,6 +16,12 @@ class Post(models.Model):
 
     likes = models.ManyToManyField(User, blank=True, related_name='liked_posts')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='post_created_idx'),
+            models.Index(fields=['author_content_type', 'author_object_id'], name='post_author_idx'),
+        ]
+
     def __str__(self):
         return f"Post {self.id} by {self.author}"
 
@@ -30,6 +36,12 @@ class Comment(models.Model):
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['post', 'created_at'], name='comment_post_created_idx'),
+            models.Index(fields=['author_content_type', 'author_object_id'], name='comment_author_idx'),
+        ]
+
     def __str__(self):
         return f"Comment {self.id} on Post {self.post_id}"
 
@@ -49,5 +61,11 @@ class Message(models.Model):
     content = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['chat', 'timestamp'], name='message_chat_ts_idx'),
+            models.Index(fields=['timestamp', 'id'], name='message_ts_idx'),
+        ]
+
     def __str__(self):
         return f"Msg {self.id} in {self.chat.name}"
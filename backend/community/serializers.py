@@ -1,18 +1,22 @@
 from rest_framework import serializers
-from django.contrib.contenttypes.models import ContentType
+from .authors import author_summary, get_author_content_type
 from .models import Post, Comment, GroupChat, Message
 
 
 class GenericAuthorFieldsMixin(serializers.ModelSerializer):
     author_type = serializers.CharField(write_only=True, required=True)
     author_id = serializers.IntegerField(write_only=True, required=True)
+    # Compact summary of the author; list views prefetch authors in batches
+    author = serializers.SerializerMethodField()
+
+    def get_author(self, obj):
+        return author_summary(obj)
 
     def assign_generic_author(self, validated_data, type_field='author_type', id_field='author_id', ct_field='author_content_type', obj_id_field='author_object_id'):
         author_type_str = validated_data.pop(type_field)
         author_id = validated_data.pop(id_field)
         try:
-            app_label, model_name = author_type_str.split('.')
-            ct = ContentType.objects.get(app_label=app_label, model=model_name.lower())
+            ct = get_author_content_type(author_type_str)
         except Exception as exc:
             raise serializers.ValidationError({type_field: 'Invalid author_type. Use users.StudentProfile or mentorship.MentorProfile'}) from exc
         validated_data[ct_field] = ct
@@ -26,7 +30,7 @@ class PostSerializer(GenericAuthorFieldsMixin):
         fields = [
             'id', 'content', 'image', 'created_at',
             'likes',
-            'author_type', 'author_id', 'author_content_type', 'author_object_id'
+            'author_type', 'author_id', 'author_content_type', 'author_object_id', 'author'
         ]
         read_only_fields = ['created_at', 'author_content_type', 'author_object_id']
 
@@ -40,7 +44,7 @@ class CommentSerializer(GenericAuthorFieldsMixin):
         model = Comment
         fields = [
             'id', 'post', 'text', 'created_at',
-            'author_type', 'author_id', 'author_content_type', 'author_object_id'
+            'author_type', 'author_id', 'author_content_type', 'author_object_id', 'author'
         ]
         read_only_fields = ['created_at', 'author_content_type', 'author_object_id']
 
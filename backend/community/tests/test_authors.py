@@ -0,0 +1,90 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from community.models import Comment, Post
+from mentorship.models import MentorProfile
+from users.models import CorporatePartnerProfile, StudentProfile
+
+User = get_user_model()
+
+
+class AuthorResolutionTestCase(TestCase):
+    def setUp(self):
+        """Create a student and a corporate mentor, each with a post."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT,
+            first_name='Sam',
+            last_name='Lee'
+        )
+        self.student = StudentProfile.objects.create(user=self.user)
+        partner_user = User.objects.create_user(
+            username='partner',
+            email='partner@test.com',
+            password='partner123',
+            role=User.CORPORATE_PARTNER
+        )
+        partner = CorporatePartnerProfile.objects.create(
+            user=partner_user, company_name='Acme', logo='https://example.com/acme.png'
+        )
+        self.mentor = MentorProfile.objects.create(user=partner)
+        self.student_ct = ContentType.objects.get_for_model(StudentProfile)
+        self.mentor_ct = ContentType.objects.get_for_model(MentorProfile)
+        self.add_posts(1)
+        self.client.force_authenticate(user=self.user)
+
+    def add_posts(self, count):
+        for i in range(count):
+            Post.objects.create(author_content_type=self.student_ct, author_object_id=self.student.id, content='s')
+            Post.objects.create(author_content_type=self.mentor_ct, author_object_id=self.mentor.id, content='m')
+
+    def test_list_includes_author_summaries(self):
+        """Test that each post carries a compact author summary."""
+        response = self.client.get('/api/community/posts/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        authors = {row['content']: row['author'] for row in response.data}
+        self.assertEqual(authors['s'], {
+            'type': 'users.studentprofile', 'id': self.student.id, 'name': 'Sam Lee', 'role': User.STUDENT, 'avatar': None,
+        })
+        self.assertEqual(authors['m']['name'], 'Acme')
+        self.assertEqual(authors['m']['role'], 'MENTOR')
+        self.assertEqual(authors['m']['avatar'], 'https://example.com/acme.png')
+
+    def test_list_queries_do_not_grow_with_rows(self):
+        """Test that authors and likes are fetched in batches, not per row."""
+        with CaptureQueriesContext(connection) as few:
+            self.client.get('/api/community/posts/')
+        self.add_posts(10)
+        Comment.objects.create(
+            post=Post.objects.first(), author_content_type=self.student_ct, author_object_id=self.student.id, text='c'
+        )
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get('/api/community/posts/')
+        self.assertEqual(len(response.data), 22)
+        self.assertEqual(len(many), len(few))
+
+    def test_create_resolves_content_type_from_cache(self):
+        """Test that creating a post does not query the content type table."""
+        ContentType.objects.get_for_model(StudentProfile)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/community/comments/', {
+                'post': Post.objects.first().id, 'text': 'hello',
+                'author_type': 'users.StudentProfile', 'author_id': self.student.id,
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['author']['name'], 'Sam Lee')
+        self.assertFalse(any('django_content_type' in query['sql'] for query in queries.captured_queries))
+
+    def test_invalid_author_type(self):
+        """Test that unknown author types are rejected."""
+        response = self.client.post('/api/community/posts/', {
+            'content': 'x', 'author_type': 'nope.Nothing', 'author_id': 1,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
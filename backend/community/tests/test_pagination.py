@@ -0,0 +1,136 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import status
+from backend.pagination import KeysetPagination
+from community.models import GroupChat, Message
+from community.views import MessageViewSet
+from projects.models import Project
+from users.models import CorporatePartnerProfile
+
+User = get_user_model()
+
+
+class KeysetPaginationTestCase(TestCase):
+    def setUp(self):
+        """Create a chat with messages, some sharing a timestamp."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='member',
+            email='member@test.com',
+            password='member123',
+            role=User.STUDENT
+        )
+        self.chat = GroupChat.objects.create(name='Year 10')
+        for i in range(7):
+            Message.objects.create(chat=self.chat, sender=self.user, content=f'message {i}')
+        # Force ties on the ordering column so the id tie-breaker is exercised
+        tied = timezone.now()
+        Message.objects.filter(content__in=['message 2', 'message 3', 'message 4']).update(timestamp=tied)
+        self.expected = list(Message.objects.order_by('-timestamp', '-id').values_list('id', flat=True))
+        self.client.force_authenticate(user=self.user)
+
+    def test_unpaginated_by_default(self):
+        """Test that lists stay plain arrays unless pagination is requested."""
+        response = self.client.get('/api/community/messages/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(sorted(m['id'] for m in response.data), sorted(self.expected))
+
+    def test_walks_all_pages_forward_and_back(self):
+        """Test that following next links returns every row once, in order."""
+        seen = []
+        pages = []
+        url = '/api/community/messages/?page_size=3'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            seen.extend(m['id'] for m in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(seen, self.expected)
+        self.assertIsNone(pages[0]['previous'])
+
+        response = self.client.get(pages[-1]['previous'])
+        self.assertEqual(
+            [m['id'] for m in response.data['results']],
+            [m['id'] for m in pages[-2]['results']]
+        )
+
+    def test_new_rows_do_not_shift_later_pages(self):
+        """Test that inserts at the head do not change the next page."""
+        first = self.client.get('/api/community/messages/?page_size=3')
+        Message.objects.create(chat=self.chat, sender=self.user, content='late arrival')
+        second = self.client.get(first.data['next'])
+        self.assertEqual([m['id'] for m in second.data['results']], self.expected[3:6])
+
+    def test_page_size_is_capped(self):
+        """Test that page_size cannot exceed the viewset's max_page_size."""
+        with mock.patch.object(MessageViewSet, 'max_page_size', 4):
+            response = self.client.get('/api/community/messages/?page_size=100000')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([m['id'] for m in response.data['results']], self.expected[:4])
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor returns 404."""
+        response = self.client.get('/api/community/messages/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class NullableOrderingTestCase(TestCase):
+    def setUp(self):
+        """Create projects, some without a start date."""
+        user = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        partner = CorporatePartnerProfile.objects.create(user=user, company_name='Test Co')
+        start = datetime.date(2026, 1, 1)
+        for i, offset in enumerate([3, None, 1, None, 2, None, 1]):
+            Project.objects.create(
+                title=f'Project {i}',
+                created_by=partner,
+                start_date=start + datetime.timedelta(days=offset) if offset is not None else None,
+            )
+
+    def walk(self, ordering):
+        """Ids of every page of ``page_size=2`` forward, then of the last page's previous links back."""
+        factory = APIRequestFactory()
+        queryset = Project.objects.order_by(ordering)
+        forward, url, pages = [], '/?page_size=2', []
+        while url:
+            paginator = KeysetPagination()
+            rows = paginator.paginate_queryset(queryset, Request(factory.get(url)))
+            pages.append([row.id for row in rows])
+            forward.extend(pages[-1])
+            url = paginator.get_next_link()
+        backward, url = [], paginator.get_previous_link()
+        while url:
+            paginator = KeysetPagination()
+            rows = paginator.paginate_queryset(queryset, Request(factory.get(url)))
+            backward[:0] = [row.id for row in rows]
+            url = paginator.get_previous_link()
+        return forward, backward + pages[-1]
+
+    def test_nulls_sort_last_ascending(self):
+        """Test that paging over a nullable field ascending returns every row once, NULLs last."""
+        projects = list(Project.objects.all())
+        dated = sorted((p for p in projects if p.start_date), key=lambda p: (p.start_date, p.id))
+        undated = sorted(p.id for p in projects if p.start_date is None)
+        expected = [p.id for p in dated] + undated
+        self.assertEqual(self.walk('start_date'), (expected, expected))
+
+    def test_nulls_sort_first_descending(self):
+        """Test that paging over a nullable field descending returns every row once, NULLs first."""
+        projects = list(Project.objects.all())
+        dated = sorted((p for p in projects if p.start_date), key=lambda p: (p.start_date, p.id), reverse=True)
+        undated = sorted((p.id for p in projects if p.start_date is None), reverse=True)
+        expected = undated + [p.id for p in dated]
+        self.assertEqual(self.walk('-start_date'), (expected, expected))
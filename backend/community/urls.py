@@ -1,6 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from .views import PostViewSet, CommentViewSet, GroupChatViewSet, MessageViewSet
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'posts', PostViewSet)
@@ -9,5 +10,7 @@ router.register(r'group-chats', GroupChatViewSet)
 router.register(r'messages', MessageViewSet)
 
 urlpatterns = [
+    # Async read endpoints (served without blocking under ASGI)
+    path('async/messages/', async_views.message_list, name='async-message-list'),
     path('', include(router.urls)),
 ]
@@ -1,15 +1,18 @@
 from rest_framework import viewsets
+from .authors import author_prefetch
 from .models import Post, Comment, GroupChat, Message
 from .serializers import PostSerializer, CommentSerializer, GroupChatSerializer, MessageSerializer
 
 
 class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all().order_by('-created_at')
+    queryset = Post.objects.prefetch_related(author_prefetch(), 'likes').order_by('-created_at')
     serializer_class = PostSerializer
+    page_size = 20
+    max_page_size = 100
 
 
 class CommentViewSet(viewsets.ModelViewSet):
-    queryset = Comment.objects.all().order_by('-created_at')
+    queryset = Comment.objects.prefetch_related(author_prefetch()).order_by('-created_at')
     serializer_class = CommentSerializer
 
 
@@ -21,3 +24,5 @@ class GroupChatViewSet(viewsets.ModelViewSet):
 class MessageViewSet(viewsets.ModelViewSet):
     queryset = Message.objects.all().order_by('-timestamp')
     serializer_class = MessageSerializer
+    page_size = 100
+    max_page_size = 500
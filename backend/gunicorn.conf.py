@@ -0,0 +1,24 @@
+"""
+Gunicorn settings, loaded automatically when gunicorn starts from backend/.
+
+By default the app is served through ASGI (backend.asgi) with uvicorn
+workers, so async views and slow outbound calls do not block a worker.
+Set GUNICORN_ASGI=False to go back to WSGI with threaded sync workers.
+
+WEB_CONCURRENCY, GUNICORN_ASGI and GUNICORN_THREADS are also read by
+backend/settings.py to size the per-worker database connection pool, so keep
+them in one place. Under WSGI the pool matches GUNICORN_THREADS. Under ASGI
+every in-flight request may hold a connection, so each worker's pool gets
+DB_MAX_CONNECTIONS / WEB_CONCURRENCY; requests beyond that wait up to
+DB_POOL_TIMEOUT for a connection.
+"""
+import os
+
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+
+if os.environ.get('GUNICORN_ASGI', 'True') == 'True':
+    wsgi_app = 'backend.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'backend.wsgi:application'
+    threads = int(os.environ.get('GUNICORN_THREADS', '4'))
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class LearningConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'learning'
+
+    def ready(self):
+        from backend.caching import register_catalogue
+        register_catalogue(self.get_model('Module'))
+        register_catalogue(self.get_model('Workbook'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('learning', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workbookpurchase',
+            index=models.Index(fields=['purchaser_content_type', 'purchaser_object_id'], name='purchase_purchaser_idx'),
+        ),
+    ]
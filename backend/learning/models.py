@@ -59,5 +59,10 @@ class WorkbookPurchase(models.Model):
     transaction_id = models.CharField(max_length=100, blank=True)
     date = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['purchaser_content_type', 'purchaser_object_id'], name='purchase_purchaser_idx'),
+        ]
+
     def __str__(self):
         return f"{self.workbook.title} purchase ({self.payment_status})"
@@ -1,4 +1,5 @@
 from rest_framework import viewsets
+from backend.caching import CatalogueCacheMixin
 from .models import Module, Resource, Workbook, WorkbookPurchase
 from .serializers import (
     ModuleSerializer,
@@ -8,7 +9,7 @@ from .serializers import (
 )
 
 
-class ModuleViewSet(viewsets.ModelViewSet):
+class ModuleViewSet(CatalogueCacheMixin, viewsets.ModelViewSet):
     queryset = Module.objects.all().order_by('-created_at')
     serializer_class = ModuleSerializer
 
@@ -18,7 +19,7 @@ class ResourceViewSet(viewsets.ModelViewSet):
     serializer_class = ResourceSerializer
 
 
-class WorkbookViewSet(viewsets.ModelViewSet):
+class WorkbookViewSet(CatalogueCacheMixin, viewsets.ModelViewSet):
     queryset = Workbook.objects.all()
     serializer_class = WorkbookSerializer
 
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mentorship', '0002_remove_certificate_issued_by_and_more'),
+        ('users', '0004_delete_badge_delete_certificate_delete_skill_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentor', 'date_time'], name='session_mentor_dt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['student', 'date_time'], name='session_student_dt_idx'),
+        ),
+    ]
@@ -44,6 +44,12 @@ class Session(models.Model):
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=BOOKED)
     meeting_link = models.URLField(blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['mentor', 'date_time'], name='session_mentor_dt_idx'),
+            models.Index(fields=['student', 'date_time'], name='session_student_dt_idx'),
+        ]
+
     def __str__(self):
         return f"{self.session_type} with {self.student.user.email}"
 
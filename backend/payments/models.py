@@ -27,6 +27,12 @@ class PaymentTransaction(models.Model):
     status = models.CharField(max_length=12, choices=STATUS_CHOICES, default=PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='payment_user_created_idx'),
+            models.Index(fields=['status', 'created_at'], name='payment_status_created_idx'),
+        ]
+
     def __str__(self):
         return f"{self.provider}:{self.transaction_id} ({self.status})"
 
@@ -5,3 +5,10 @@ class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'projects'
 
+    def ready(self):
+        from backend.conditional import track_changes
+        from . import recommendations, stats
+        recommendations.connect_signals()
+        stats.connect_signals()
+        track_changes(self.get_model('Project'), 'updated_at')
+        track_changes(self.get_model('StudentProjectSubmission'), 'updated_at')
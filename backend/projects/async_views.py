@@ -0,0 +1,19 @@
+from backend.async_api import async_api_view, list_response
+from users.models import User
+from .models import Project
+from .serializers import ProjectSerializer
+from .views import ProjectViewSet
+
+
+@async_api_view
+async def project_list(request):
+    """
+    Async version of GET /api/projects/projects/.
+    Same visibility as ProjectViewSet: corporate partners see only their own
+    projects, everyone else sees all projects.
+    """
+    user = request.user
+    queryset = Project.objects.all().order_by('-created_at').prefetch_related('skills_required')
+    if not (user.is_staff or user.role == User.ADMIN) and user.role == User.CORPORATE_PARTNER:
+        queryset = queryset.filter(created_by__user=user)
+    return await list_response(request, queryset, ProjectSerializer, ProjectViewSet)
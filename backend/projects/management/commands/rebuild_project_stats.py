@@ -0,0 +1,63 @@
+"""
+Django management command to recompute ProjectStats from the submissions table.
+
+Projects are processed in batches of --batch-size, in id order. Each batch is
+one transaction: its stats rows are locked, recomputed with one grouped
+aggregate and written back with one upsert, so submissions saved meanwhile
+wait for the batch and then apply their increments on top of the fresh rows.
+Rows that changed are reported as drift.
+
+Usage:
+    python manage.py rebuild_project_stats
+    python manage.py rebuild_project_stats --batch-size 5000
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from projects import stats
+from projects.models import Project, ProjectStats
+
+
+class Command(BaseCommand):
+    help = "Recompute per-project submission statistics in batches to repair drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Projects per transaction (default: 1000)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        started = time.perf_counter()
+        total = drifted = 0
+        last_id = 0
+        while True:
+            project_ids = list(
+                Project.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not project_ids:
+                break
+            with transaction.atomic():
+                current = {
+                    row.project_id: row
+                    for row in ProjectStats.objects.select_for_update().filter(project_id__in=project_ids)
+                }
+                fresh = stats.compute(project_ids)
+                drifted += sum(
+                    1 for row in fresh
+                    if row.project_id not in current
+                    or any(getattr(row, field) != getattr(current[row.project_id], field) for field in stats.FIELDS)
+                )
+                stats.store(fresh)
+            total += len(project_ids)
+            last_id = project_ids[-1]
+            if options['verbosity'] > 1:
+                self.stdout.write(f'  {total} projects')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt stats for {total} projects ({drifted} missing or drifted) in {time.perf_counter() - started:.1f}s'
+        ))
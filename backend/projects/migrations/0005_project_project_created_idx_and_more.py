@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('achievements', '0001_initial'),
+        ('projects', '0004_alter_project_skills_required'),
+        ('users', '0004_delete_badge_delete_certificate_delete_skill_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['created_at', 'id'], name='project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'created_at'], name='project_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprojectsubmission',
+            index=models.Index(fields=['project', 'status', 'submitted_at'], name='submission_project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprojectsubmission',
+            index=models.Index(fields=['submitted_at', 'id'], name='submission_submitted_idx'),
+        ),
+    ]
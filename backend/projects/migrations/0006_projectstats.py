@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_project_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='projects.project')),
+                ('submitted_count', models.IntegerField(default=0)),
+                ('reviewed_count', models.IntegerField(default=0)),
+                ('approved_count', models.IntegerField(default=0)),
+                ('student_count', models.IntegerField(default=0)),
+                ('last_submission_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
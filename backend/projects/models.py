@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 
@@ -33,6 +33,12 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='project_created_idx'),
+            models.Index(fields=['status', 'created_at'], name='project_status_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -58,11 +64,50 @@ class StudentProjectSubmission(models.Model):
 
     class Meta:
         unique_together = ('student', 'project')
+        indexes = [
+            models.Index(fields=['project', 'status', 'submitted_at'], name='submission_project_status_idx'),
+            models.Index(fields=['submitted_at', 'id'], name='submission_submitted_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # One transaction with the ProjectStats adjustment (projects/stats.py)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.student.user.email} -> {self.project.title}"
 
 
+class ProjectStats(models.Model):
+    """
+    Submission counts per project, maintained incrementally by
+    projects/stats.py. Repair with ``manage.py rebuild_project_stats``.
+    """
+    project = models.OneToOneField(Project, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    # Plain integers: a drifted counter must not make a submission write fail
+    submitted_count = models.IntegerField(default=0)
+    reviewed_count = models.IntegerField(default=0)
+    approved_count = models.IntegerField(default=0)
+    student_count = models.IntegerField(default=0)
+    last_submission_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats({self.project_id})"
+
+
+class ProjectChange(models.Model):
+    """
+    Ids of projects whose status or skills changed, numbered by the database.
+    Read by projects/recommendations.py to keep each worker's index in step.
+    """
+    project_ids = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Change({self.id})"
+
+
 # class Module(models.Model):
     # pass  # moved to learning app
 
@@ -0,0 +1,49 @@
+"""
+Set-based project status changes for moderation.
+
+``bulk_set_status`` moves every project of a queryset to a new status in one
+transaction: the matching rows are locked and read once (id and current
+status, for the report and the recommendation index), then changed with a
+single ``UPDATE ... WHERE id IN (...)``. Projects already in the target
+status are left alone. ``update()`` skips ``auto_now``, so ``updated_at`` is
+set explicitly, and it sends no signals, so the list validators and the
+recommendation index are told about the change directly.
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from backend import conditional
+
+from . import recommendations
+from .models import Project
+
+# Keys accepted in a bulk action's ``filter`` and the lookups they map to
+FILTERS = {
+    'status': 'status',
+    'created_by': 'created_by_id',
+}
+
+
+def bulk_set_status(queryset, status, approved_by=None):
+    """
+    Move the projects in ``queryset`` to ``status``, recording
+    ``approved_by`` (an ``AdminProfile`` id) when given.
+
+    Returns ``(ids, changed)``: the ids that matched and a ``Counter`` of the
+    previous status of each project that was changed.
+    """
+    with transaction.atomic():
+        rows = list(queryset.select_for_update().order_by().values_list('id', 'status'))
+        to_change = [project_id for project_id, current in rows if current != status]
+        changed = Counter(current for _, current in rows if current != status)
+        if to_change:
+            values = {'status': status, 'updated_at': timezone.now()}
+            if approved_by is not None:
+                values['approved_by_id'] = approved_by
+            Project.objects.filter(id__in=to_change).update(**values)
+            conditional.changed(Project)
+            if status == Project.OPEN or Project.OPEN in changed:
+                recommendations.projects_changed(to_change)
+    return [project_id for project_id, _ in rows], changed
@@ -0,0 +1,242 @@
+"""
+Skill-based project recommendations from an in-memory inverted index.
+
+Each worker process indexes the skills required by OPEN projects:
+
+* ``projects``: skill id -> project ids requiring it;
+* ``postings``: the same, grouped by how many skills each project requires;
+* ``project_skills``: project id -> frozenset of its required skill ids.
+
+A skill weighs ``log(1 + N / df)`` (N indexed projects, df of them requiring
+the skill), so rare skills count for more than ubiquitous ones. A project's
+score is the weight of the student's skills it requires divided by the
+number of skills it requires: projects the student is fully qualified for
+rank above ones where they cover a single requirement among many. Ranking
+walks only the postings of the student's own skills and keeps the top k with
+a heap, so its cost follows the number of projects sharing a skill with the
+student, and whole groups of projects are skipped once none of them can
+still enter the top k (see ``SkillIndex.rank``).
+
+Keeping workers in step: when a project's status or required skills change,
+or it is deleted, its id is appended (after commit) to a change log table,
+``ProjectChange``, whose auto-increment id numbers the entries. Before
+ranking, a process reads the entries after the last one it has seen and
+replays them, re-reading just those projects with one query. If the ids read
+are not consecutive (an entry is still being committed, or was pruned) or
+there are more than ``MAX_REPLAY`` of them, the index is rebuilt from the
+database instead. Entries more than ``MAX_REPLAY`` behind the newest are
+pruned, as any process that far behind rebuilds anyway. Bulk ``update()``
+calls send no signals; call ``projects_changed(ids)`` after them.
+"""
+import heapq
+import itertools
+import math
+import threading
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .models import Project, ProjectChange
+
+MAX_REPLAY = 500
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class SkillIndex:
+    """Inverted index from skill to OPEN projects. Not thread-safe on its own."""
+
+    def __init__(self):
+        # skill id -> {project ids}
+        self.projects = {}
+        # skill id -> {number of skills the project requires: {project ids}}
+        self.postings = {}
+        self.project_skills = {}
+
+    def replace(self, project_ids, rows):
+        """Drop ``project_ids`` and index them again from ``(project_id, skill_id)`` rows."""
+        for project_id in project_ids:
+            required = self.project_skills.pop(project_id, ())
+            for skill_id in required:
+                self.projects[skill_id].discard(project_id)
+                group = self.postings[skill_id][len(required)]
+                group.discard(project_id)
+                if not group:
+                    del self.postings[skill_id][len(required)]
+                if not self.projects[skill_id]:
+                    del self.projects[skill_id], self.postings[skill_id]
+        skills = {}
+        for project_id, skill_id in rows:
+            skills.setdefault(project_id, set()).add(skill_id)
+        for project_id, skill_ids in skills.items():
+            self.project_skills[project_id] = frozenset(skill_ids)
+            for skill_id in skill_ids:
+                self.projects.setdefault(skill_id, set()).add(project_id)
+                self.postings.setdefault(skill_id, {}).setdefault(len(skill_ids), set()).add(project_id)
+
+    def weight(self, skill_id):
+        return math.log1p(len(self.project_skills) / len(self.projects[skill_id]))
+
+    def rank(self, skill_ids, limit, exclude=()):
+        """
+        Top ``limit`` ``(score, project_id, matched_skill_ids)``, best first.
+
+        Projects are met in groups, one per (student skill s, required skill
+        count n), visited in decreasing order of the group's bound: the sum
+        of the n heaviest student skills no heavier than s, divided by n. A
+        project in a group can match at most n skills and, if it also
+        required a heavier student skill, it was already met in that skill's
+        group of the same n, which has a bound at least as high. So the bound
+        holds for every unseen project in the group, and the walk stops at
+        the first group whose bound the k-th best score reaches. Projects
+        tied with the k-th best score may therefore be left out in favour of
+        ones met earlier.
+
+        Within a group, set intersections with the other student skills find
+        the projects matching more than s; every other project in the group
+        scores exactly ``weight(s) / n``, so at most ``limit`` of them are
+        looked at.
+        """
+        weights = {skill_id: self.weight(skill_id) for skill_id in set(skill_ids) if skill_id in self.projects}
+        order = sorted(weights, key=weights.get, reverse=True)
+        # suffix[i][j]: sum of the j heaviest weights from order[i] on
+        suffix = []
+        for position in range(len(order)):
+            sums = [0.0]
+            for other in order[position:]:
+                sums.append(sums[-1] + weights[other])
+            suffix.append(sums)
+        groups = sorted(
+            (
+                (suffix[position][min(size, len(order) - position)] / size, -position, size)
+                for position, skill_id in enumerate(order)
+                for size in self.postings[skill_id]
+            ),
+            reverse=True,
+        )
+
+        seen = set(exclude)
+        best = []  # min-heap of (score, -project_id), worst on top
+
+        def offer(score, project_id):
+            if len(best) < limit:
+                heapq.heappush(best, (score, -project_id))
+            elif score > best[0][0]:
+                heapq.heapreplace(best, (score, -project_id))
+
+        for bound, negated_position, size in groups:
+            if len(best) >= limit and best[0][0] >= bound:
+                break
+            skill_id = order[-negated_position]
+            group = self.postings[skill_id][size] - seen
+            seen |= group
+            extra = {}
+            if size > 1:
+                for other in order:
+                    if other != skill_id:
+                        weight = weights[other]
+                        for project_id in group & self.projects[other]:
+                            extra[project_id] = extra.get(project_id, 0.0) + weight
+            for project_id, total in extra.items():
+                offer((weights[skill_id] + total) / size, project_id)
+            single = weights[skill_id] / size
+            if len(best) < limit or single > best[0][0]:
+                for project_id in itertools.islice((p for p in group if p not in extra), limit):
+                    offer(single, project_id)
+
+        student_skills = weights.keys()
+        return [
+            (score, -negated, sorted(self.project_skills[-negated] & student_skills))
+            for score, negated in sorted(best, reverse=True)
+        ]
+
+
+_index = None
+_seen = 0
+_lock = threading.Lock()
+
+
+def _open_skill_rows(project_ids=None):
+    rows = Project.skills_required.through.objects.filter(project__status=Project.OPEN)
+    if project_ids is not None:
+        rows = rows.filter(project_id__in=project_ids)
+    return rows.values_list('project_id', 'skill_id').iterator(chunk_size=10000)
+
+
+def _sync():
+    """Bring this process's index up to date with the change log."""
+    global _index, _seen
+    if _index is None:
+        latest = ProjectChange.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        entries, replay = [(latest, None)], False
+    else:
+        entries = list(
+            ProjectChange.objects.filter(id__gt=_seen).order_by('id')
+            .values_list('id', 'project_ids')[:MAX_REPLAY + 1]
+        )
+        if not entries:
+            return
+        # A gap is an entry not yet committed or already pruned: its change
+        # is committed, so a rebuild includes it
+        replay = len(entries) <= MAX_REPLAY and entries[-1][0] - _seen == len(entries)
+    if replay:
+        changed = {project_id for _, ids in entries for project_id in ids}
+        _index.replace(changed, _open_skill_rows(changed))
+    else:
+        index = SkillIndex()
+        index.replace((), _open_skill_rows())
+        _index = index
+    _seen = entries[-1][0]
+
+
+def recommend(skill_ids, limit=DEFAULT_LIMIT, exclude=()):
+    """Rank OPEN projects for a student with ``skill_ids``; see ``SkillIndex.rank``."""
+    if not skill_ids:
+        return []
+    with _lock:
+        _sync()
+        return _index.rank(skill_ids, limit, exclude)
+
+
+def projects_changed(project_ids):
+    """Record that ``project_ids`` changed, once the current transaction commits."""
+    project_ids = sorted(set(project_ids))
+    if project_ids:
+        transaction.on_commit(lambda: _record(project_ids))
+
+
+def _record(project_ids):
+    change = ProjectChange.objects.create(project_ids=project_ids)
+    ProjectChange.objects.filter(id__lte=change.id - MAX_REPLAY).delete()
+
+
+def reset():
+    """Forget this process's index; the next ranking rebuilds it."""
+    global _index, _seen
+    with _lock:
+        _index, _seen = None, 0
+
+
+def connect_signals():
+    def on_save(sender, instance, created=False, update_fields=None, **kwargs):
+        # A new project has no skills yet; they arrive through m2m_changed
+        if not created and (update_fields is None or 'status' in update_fields):
+            projects_changed([instance.pk])
+
+    def on_delete(sender, instance, **kwargs):
+        projects_changed([instance.pk])
+
+    def on_skills(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ('post_add', 'post_remove', 'pre_clear'):
+            return
+        if not reverse:
+            projects_changed([instance.pk])
+        elif pk_set:
+            projects_changed(pk_set)
+        else:
+            projects_changed(instance.projects.values_list('id', flat=True))
+
+    uid = 'project-recommendations'
+    post_save.connect(on_save, sender=Project, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_delete, sender=Project, weak=False, dispatch_uid=uid)
+    m2m_changed.connect(on_skills, sender=Project.skills_required.through, weak=False, dispatch_uid=uid)
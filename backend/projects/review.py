@@ -0,0 +1,41 @@
+"""
+Submission review queue for corporate partners.
+
+``review_queryset`` lists the submissions to a partner's own projects, oldest
+first, with ``student__user`` and ``project`` joined in the same query so
+rendering a page costs no extra queries. ``status_counts`` returns the number
+of submissions per status from one grouped aggregate
+(``SELECT status, COUNT(*) ... GROUP BY status``), with zero for statuses
+that have none.
+"""
+from django.db.models import Count
+
+from backend.pagination import KeysetPagination
+from .models import StudentProjectSubmission
+
+ORDERING = ('submitted_at', 'id')
+
+
+class ReviewQueuePagination(KeysetPagination):
+    """Keyset pagination that is always on, whatever the query string."""
+    always = True
+
+
+def review_queryset(partner_id=None):
+    """Submissions to ``partner_id``'s projects; all of them when None (admins)."""
+    queryset = StudentProjectSubmission.objects.select_related('student__user', 'project').only(
+        'id', 'submission_link', 'feedback', 'grade', 'status', 'submitted_at', 'updated_at',
+        'project__id', 'project__title', 'project__created_by_id',
+        'student__id', 'student__user__id', 'student__user__email',
+        'student__user__first_name', 'student__user__last_name',
+    )
+    if partner_id is not None:
+        queryset = queryset.filter(project__created_by_id=partner_id)
+    return queryset.order_by(*ORDERING)
+
+
+def status_counts(queryset):
+    counts = {status: 0 for status, _ in StudentProjectSubmission.STATUS_CHOICES}
+    rows = queryset.order_by().values_list('status').annotate(total=Count('id'))
+    counts.update(dict(rows))
+    return counts
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import (
     Project,
+    ProjectStats,
     StudentProjectSubmission,
 )
 
@@ -15,6 +16,15 @@ class ProjectSerializer(serializers.ModelSerializer):
         ]
 
 
+class ProjectStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProjectStats
+        fields = [
+            'project', 'submitted_count', 'reviewed_count', 'approved_count',
+            'student_count', 'last_submission_at', 'updated_at'
+        ]
+
+
 class StudentProjectSubmissionSerializer(serializers.ModelSerializer):
     class Meta:
         model = StudentProjectSubmission
@@ -24,4 +34,24 @@ class StudentProjectSubmissionSerializer(serializers.ModelSerializer):
         ]
 
 
+class ReviewQueueSubmissionSerializer(serializers.ModelSerializer):
+    """One review queue row; reads the joins of ``projects.review.review_queryset``."""
+    project = serializers.SerializerMethodField()
+    student = serializers.SerializerMethodField()
+
+    class Meta:
+        model = StudentProjectSubmission
+        fields = [
+            'id', 'project', 'student', 'submission_link', 'feedback', 'grade',
+            'status', 'submitted_at', 'updated_at'
+        ]
+
+    def get_project(self, obj):
+        return {'id': obj.project.id, 'title': obj.project.title}
 
+    def get_student(self, obj):
+        user = obj.student.user
+        return {
+            'id': obj.student.id, 'email': user.email,
+            'first_name': user.first_name, 'last_name': user.last_name,
+        }
@@ -0,0 +1,152 @@
+"""
+Per-project submission statistics, maintained incrementally.
+
+``ProjectStats`` holds, for each project, its number of submissions in each
+status, the number of students who submitted and the time of the latest
+submission, so a dashboard reads one row instead of counting submissions.
+
+Every save or delete of a ``StudentProjectSubmission`` adjusts its project's
+row with ``F()`` expressions in the same transaction (``save()`` is wrapped
+in ``transaction.atomic``; deletes already run in one). Before an update the
+submission's previous project and status are re-read with ``SELECT ... FOR
+UPDATE``, so two concurrent changes to one submission cannot both count the
+same transition. A project without a row gets one computed from its
+submissions the first time a submission to it is saved, or when its stats
+are read. That row is inserted with ``ON CONFLICT DO NOTHING`` semantics: when
+a concurrent transaction inserted one first, the writer applies its delta to
+that row instead, and a reader keeps it, so no submission is lost or counted
+twice.
+
+``bulk_create()``, ``update()`` and raw SQL send no signals and bypass this;
+``manage.py rebuild_project_stats`` recomputes every row in batches.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateTimeField, F, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from .models import ProjectStats, StudentProjectSubmission
+
+STATUS_FIELDS = {
+    StudentProjectSubmission.SUBMITTED: 'submitted_count',
+    StudentProjectSubmission.REVIEWED: 'reviewed_count',
+    StudentProjectSubmission.APPROVED: 'approved_count',
+}
+FIELDS = [*STATUS_FIELDS.values(), 'student_count', 'last_submission_at']
+
+
+def compute(project_ids):
+    """Unsaved ``ProjectStats`` for ``project_ids`` from one grouped aggregate."""
+    rows = (
+        StudentProjectSubmission.objects.filter(project_id__in=project_ids)
+        .order_by()
+        .values('project_id')
+        .annotate(
+            **{field: Count('id', filter=Q(status=status)) for status, field in STATUS_FIELDS.items()},
+            student_count=Count('student_id', distinct=True),
+            last_submission_at=Max('submitted_at'),
+        )
+    )
+    found = {row.pop('project_id'): row for row in rows}
+    return [ProjectStats(project_id=project_id, **found.get(project_id, {})) for project_id in project_ids]
+
+
+def store(stats):
+    """Insert or overwrite the given ``ProjectStats`` rows."""
+    ProjectStats.objects.bulk_create(
+        stats, update_conflicts=True, unique_fields=['project'], update_fields=[*FIELDS, 'updated_at'],
+    )
+
+
+def get_stats(project_id):
+    """
+    The stored stats of a project. A project with no row yet gets one
+    computed and inserted, unless another transaction inserts it first.
+    """
+    stats = ProjectStats.objects.filter(project_id=project_id).first()
+    if stats is None:
+        ProjectStats.objects.bulk_create(compute([project_id]), ignore_conflicts=True)
+        stats = ProjectStats.objects.get(project_id=project_id)
+    return stats
+
+
+def _apply(project_id, deltas, create=True, **values):
+    """
+    Add ``deltas`` to the project's counters in one UPDATE. When the project
+    has no row yet and ``create``, one computed from scratch is inserted: it
+    already reflects the change, which is written before the signal fires.
+    If a concurrent transaction inserted the row first, its row cannot
+    include this uncommitted change, so the delta is applied to it instead.
+    """
+    changes = {field: F(field) + delta for field, delta in deltas.items() if field and delta}
+    changes.update(values, updated_at=timezone.now())
+    if ProjectStats.objects.filter(project_id=project_id).update(**changes) or not create:
+        return
+    [stats] = compute([project_id])
+    try:
+        with transaction.atomic():
+            stats.save(force_insert=True)
+    except IntegrityError:
+        ProjectStats.objects.filter(project_id=project_id).update(**changes)
+
+
+def _added(project_id, status, submitted_at):
+    # unique_together (student, project): every submission is another student
+    latest = Value(submitted_at, output_field=DateTimeField())
+    _apply(
+        project_id,
+        {STATUS_FIELDS.get(status): 1, 'student_count': 1},
+        last_submission_at=Greatest(Coalesce('last_submission_at', latest), latest),
+    )
+
+
+def _removed(project_id, status):
+    # No row is created here: the project itself may be being deleted.
+    latest = (
+        StudentProjectSubmission.objects.filter(project_id=OuterRef('project_id'))
+        .order_by('-submitted_at').values('submitted_at')[:1]
+    )
+    _apply(
+        project_id,
+        {STATUS_FIELDS.get(status): -1, 'student_count': -1},
+        create=False,
+        last_submission_at=Subquery(latest),
+    )
+
+
+def on_pre_save(sender, instance, raw=False, **kwargs):
+    instance._stats_previous = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    previous = sender.objects.filter(pk=instance.pk)
+    if transaction.get_connection().in_atomic_block:
+        previous = previous.select_for_update()
+    instance._stats_previous = previous.values_list('project_id', 'status').first()
+
+
+def on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_stats_previous', None)
+    if created or previous is None:
+        _added(instance.project_id, instance.status, instance.submitted_at)
+        return
+    project_id, status = previous
+    if project_id != instance.project_id:
+        _removed(project_id, status)
+        _added(instance.project_id, instance.status, instance.submitted_at)
+    elif status != instance.status:
+        _apply(project_id, {STATUS_FIELDS.get(status): -1, STATUS_FIELDS.get(instance.status): 1})
+
+
+def on_delete(sender, instance, **kwargs):
+    _removed(instance.project_id, instance.status)
+
+
+def connect_signals():
+    uid = 'project-stats'
+    sender = StudentProjectSubmission
+    pre_save.connect(on_pre_save, sender=sender, weak=False, dispatch_uid=uid)
+    post_save.connect(on_save, sender=sender, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_delete, sender=sender, weak=False, dispatch_uid=uid)
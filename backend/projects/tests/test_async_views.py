@@ -0,0 +1,71 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.models import CorporatePartnerProfile
+from projects.models import Project
+
+User = get_user_model()
+
+
+class AsyncReadEndpointsTestCase(TestCase):
+    def setUp(self):
+        """Create two corporate partners with one project each, and a student."""
+        self.client = APIClient()
+        self.partner = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        other = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password='other123',
+            role=User.CORPORATE_PARTNER
+        )
+        self.project = Project.objects.create(
+            title='Mine',
+            created_by=CorporatePartnerProfile.objects.create(user=self.partner, company_name='Mine Co')
+        )
+        Project.objects.create(
+            title='Theirs',
+            created_by=CorporatePartnerProfile.objects.create(user=other, company_name='Other Co')
+        )
+        self.student = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+
+    def authenticate(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_requires_authentication(self):
+        """Test that async endpoints reject anonymous requests."""
+        response = self.client.get('/api/projects/async/projects/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_project_list_matches_sync_visibility(self):
+        """Test that partners only see their own projects, like the sync viewset."""
+        self.authenticate(self.partner)
+        async_response = self.client.get('/api/projects/async/projects/')
+        sync_response = self.client.get('/api/projects/projects/')
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.json(), sync_response.json())
+        self.assertEqual([p['title'] for p in async_response.json()], ['Mine'])
+
+        self.authenticate(self.student)
+        response = self.client.get('/api/projects/async/projects/?page_size=1')
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertIsNotNone(response.json()['next'])
+
+    def test_me(self):
+        """Test that the async /me/ returns the token's user."""
+        self.authenticate(self.student)
+        response = self.client.get('/api/users/async/me/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['email'], self.student.email)
@@ -0,0 +1,97 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from achievements.models import Skill
+from backend.caching import VERSION_KEY
+from users.models import CorporatePartnerProfile
+from projects.models import Project
+
+User = get_user_model()
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ConditionalGetTestCase(TestCase):
+    def setUp(self):
+        """Create a corporate partner with two projects."""
+        cache.clear()
+        self.client = APIClient()
+        self.partner = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        profile = CorporatePartnerProfile.objects.create(user=self.partner, company_name='Test Co')
+        self.project = Project.objects.create(title='First', created_by=profile)
+        Project.objects.create(title='Second', created_by=profile)
+        self.client.force_authenticate(user=self.partner)
+
+    def test_list_returns_304_when_unchanged(self):
+        """Test that a matching If-None-Match on a list returns 304."""
+        response = self.client.get('/api/projects/projects/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertNotIn('Last-Modified', response)
+
+        response = self.client.get('/api/projects/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_list_etag_changes_on_update_and_delete(self):
+        """Test that updates and deletes produce a new list ETag."""
+        etag = self.client.get('/api/projects/projects/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.title = 'Renamed'
+            self.project.save()
+        response = self.client.get('/api/projects/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.filter(title='Second').delete()
+        response = self.client.get('/api/projects/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_evicted_version_does_not_match_old_etag(self):
+        """Test that an ETag from before a change is not matched again after the version key is evicted."""
+        etag = self.client.get('/api/projects/projects/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.title = 'Renamed'
+            self.project.save()
+        cache.delete(VERSION_KEY.format(label='projects.project'))
+        response = self.client.get('/api/projects/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_skill_changes_move_validators(self):
+        """Test that editing required skills changes the list ETag and the project's Last-Modified."""
+        url = f'/api/projects/projects/{self.project.id}/'
+        Project.objects.filter(id=self.project.id).update(updated_at=self.project.updated_at.replace(year=2000))
+        etag = self.client.get('/api/projects/projects/')['ETag']
+        last_modified = self.client.get(url)['Last-Modified']
+        skill = Skill.objects.create(name='Python')
+        with self.captureOnCommitCallbacks(execute=True):
+            skill.projects.add(self.project)
+        response = self.client.get('/api/projects/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_needs_no_validator_query(self):
+        """Test that a 304 on a list runs no query over the listed rows."""
+        etag = self.client.get('/api/projects/projects/')['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/projects/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse([query for query in queries.captured_queries if 'projects_project' in query['sql']])
+
+    def test_detail_if_modified_since(self):
+        """Test that detail views honour If-Modified-Since."""
+        url = f'/api/projects/projects/{self.project.id}/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,112 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import AdminProfile, CorporatePartnerProfile
+from projects.models import Project
+
+User = get_user_model()
+
+
+class BulkStatusTestCase(TestCase):
+    def setUp(self):
+        """Create an admin, two partners and projects in several statuses."""
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='admin123',
+            role=User.ADMIN
+        )
+        self.admin = AdminProfile.objects.create(user=self.admin_user)
+        self.partner_user = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        self.partner = CorporatePartnerProfile.objects.create(user=self.partner_user, company_name='Test Co')
+        other_user = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password='other123',
+            role=User.CORPORATE_PARTNER
+        )
+        self.other = CorporatePartnerProfile.objects.create(user=other_user, company_name='Other Co')
+        self.drafts = [
+            Project.objects.create(title=f'Draft {i}', created_by=self.partner, status=Project.DRAFT)
+            for i in range(3)
+        ]
+        self.open = Project.objects.create(title='Open', created_by=self.partner, status=Project.OPEN)
+        self.other_draft = Project.objects.create(title='Other draft', created_by=self.other, status=Project.DRAFT)
+
+    def bulk(self, **body):
+        return self.client.post('/api/projects/projects/bulk-status/', body, format='json')
+
+    def test_admin_approves_filtered_set_in_one_update(self):
+        """Test that a filter moves one partner's drafts with a single UPDATE and sets approved_by."""
+        self.client.force_authenticate(user=self.admin_user)
+        before = Project.objects.get(id=self.drafts[0].id).updated_at
+        with CaptureQueriesContext(connection) as queries:
+            response = self.bulk(status=Project.OPEN, filter={'status': Project.DRAFT, 'created_by': self.partner.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['matched'], 3)
+        self.assertEqual(response.data['updated'], 3)
+        self.assertEqual(response.data['previous_status'], {Project.DRAFT: 3})
+        self.assertEqual(sum(query['sql'].startswith('UPDATE') for query in queries.captured_queries), 1)
+        for project in Project.objects.filter(id__in=[p.id for p in self.drafts]):
+            self.assertEqual(project.status, Project.OPEN)
+            self.assertEqual(project.approved_by_id, self.admin.id)
+            self.assertGreater(project.updated_at, before)
+        self.assertEqual(Project.objects.get(id=self.other_draft.id).status, Project.DRAFT)
+
+    def test_ids_report_unchanged_and_not_found(self):
+        """Test that projects already in the target status are counted and unknown ids reported."""
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.bulk(status=Project.OPEN, ids=[self.drafts[0].id, self.open.id, 999999])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            (response.data['matched'], response.data['updated'], response.data['unchanged']),
+            (2, 1, 1),
+        )
+        self.assertEqual(response.data['not_found'], [999999])
+        self.assertIsNone(Project.objects.get(id=self.open.id).approved_by_id)
+
+    def test_partner_only_moves_own_projects(self):
+        """Test that corporate partners cannot touch other partners' projects and do not set approved_by."""
+        self.client.force_authenticate(user=self.partner_user)
+        response = self.bulk(status=Project.ARCHIVED, ids=[self.drafts[0].id, self.other_draft.id])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(response.data['not_found'], [self.other_draft.id])
+        self.assertEqual(Project.objects.get(id=self.other_draft.id).status, Project.DRAFT)
+        archived = Project.objects.get(id=self.drafts[0].id)
+        self.assertEqual(archived.status, Project.ARCHIVED)
+        self.assertIsNone(archived.approved_by_id)
+
+    def test_other_roles_forbidden(self):
+        """Test that students cannot run bulk actions."""
+        student = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+        self.client.force_authenticate(user=student)
+        response = self.bulk(status=Project.OPEN, ids=[self.drafts[0].id])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_rejects_bad_bodies(self):
+        """Test that bad status, missing selection, bad ids and unknown filters are a 400."""
+        self.client.force_authenticate(user=self.admin_user)
+        for body in (
+            {'status': 'LIVE', 'ids': [1]},
+            {'status': Project.OPEN},
+            {'status': Project.OPEN, 'ids': ['x']},
+            {'status': Project.OPEN, 'filter': {'title': 'Draft 1'}},
+            {'status': Project.OPEN, 'filter': {'created_by': 'abc'}},
+        ):
+            self.assertEqual(self.bulk(**body).status_code, status.HTTP_400_BAD_REQUEST, body)
+        self.assertEqual(Project.objects.filter(status=Project.OPEN).count(), 1)
@@ -0,0 +1,125 @@
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from achievements.models import Skill
+from users.models import CorporatePartnerProfile, ParentProfile, StudentProfile
+from projects.models import Project, ProjectChange, StudentProjectSubmission
+from projects import recommendations
+from projects.recommendations import SkillIndex
+
+User = get_user_model()
+
+
+class SkillIndexTestCase(SimpleTestCase):
+    def test_rank_prefers_rare_skills_and_full_coverage(self):
+        """Test that rare skills weigh more and fully covered projects rank first."""
+        index = SkillIndex()
+        # skill 1 is required everywhere, skill 2 by one project only
+        index.replace((), [(10, 1), (11, 1), (11, 2), (12, 1), (12, 3), (13, 1)])
+        ranked = index.rank([1, 2], limit=3)
+        self.assertEqual([project_id for _, project_id, _ in ranked], [11, 10, 13])
+        self.assertEqual(ranked[0][2], [1, 2])
+        self.assertGreater(ranked[0][0], ranked[1][0])
+
+    def test_replace_and_exclude(self):
+        """Test that re-indexing a project updates postings and excluded projects are skipped."""
+        index = SkillIndex()
+        index.replace((), [(1, 5), (2, 5)])
+        index.replace([1], [])
+        self.assertEqual([pid for _, pid, _ in index.rank([5], limit=10)], [2])
+        self.assertEqual(index.rank([5], limit=10, exclude={2}), [])
+        index.replace([2], [])
+        self.assertEqual(index.postings, {})
+
+
+class RecommendationTestCase(TestCase):
+    def setUp(self):
+        """Create skills, open and draft projects, and a student with two skills."""
+        recommendations.reset()
+        self.client = APIClient()
+        partner_user = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        self.partner = CorporatePartnerProfile.objects.create(user=partner_user, company_name='Test Co')
+        self.python, self.sql, self.design = (Skill.objects.create(name=name) for name in ['Python', 'SQL', 'Design'])
+        self.both = self.project('Both', self.python, self.sql)
+        self.python_only = self.project('Python', self.python)
+        self.design_only = self.project('Design', self.design)
+        self.draft = self.project('Draft', self.python, self.sql, status=Project.DRAFT)
+        student_user = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+        self.student = StudentProfile.objects.create(user=student_user)
+        self.student.skills.add(self.python, self.sql)
+        self.client.force_authenticate(user=student_user)
+
+    def project(self, title, *skills, status=Project.OPEN):
+        project = Project.objects.create(title=title, created_by=self.partner, status=status)
+        project.skills_required.add(*skills)
+        return project
+
+    def recommended(self, query=''):
+        response = self.client.get(f'/api/projects/projects/recommended/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_ranks_open_projects_by_overlap(self):
+        """Test that only open projects sharing a skill are returned, best match first."""
+        data = self.recommended()
+        self.assertEqual([item['project']['id'] for item in data], [self.both.id, self.python_only.id])
+        self.assertEqual(sorted(data[0]['matched_skills']), sorted([self.python.id, self.sql.id]))
+        self.assertEqual(data[0]['project']['title'], 'Both')
+        self.assertEqual(len(self.recommended('?limit=1')), 1)
+
+    def test_submitted_projects_are_skipped(self):
+        """Test that projects the student already submitted to are not recommended."""
+        StudentProjectSubmission.objects.create(student=self.student, project=self.both)
+        self.assertEqual([item['project']['id'] for item in self.recommended()], [self.python_only.id])
+
+    def test_status_and_skill_changes_update_the_index(self):
+        """Test that publishing a project and editing its skills reach the built index."""
+        self.recommended()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.draft.status = Project.OPEN
+            self.draft.save()
+            self.python_only.skills_required.remove(self.python)
+            self.design_only.skills_required.add(self.sql)
+        ids = [item['project']['id'] for item in self.recommended()]
+        self.assertEqual(ids[:2], sorted([self.both.id, self.draft.id]))
+        self.assertEqual(ids[2:], [self.design_only.id])
+
+    def test_gap_in_change_log_rebuilds_the_index(self):
+        """Test that a missing change log entry makes the index rebuild instead of replaying."""
+        self.recommended()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.draft.status = Project.OPEN
+            self.draft.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.python_only.skills_required.remove(self.python)
+        ProjectChange.objects.filter(project_ids=[self.draft.id]).delete()
+        ids = [item['project']['id'] for item in self.recommended()]
+        self.assertEqual(ids, sorted([self.both.id, self.draft.id]))
+
+    def test_parent_can_ask_for_linked_student_only(self):
+        """Test that parents pass ?student= and cannot see unlinked students."""
+        parent_user = User.objects.create_user(
+            username='parent',
+            email='parent@test.com',
+            password='parent123',
+            role=User.PARENT
+        )
+        parent = ParentProfile.objects.create(user=parent_user)
+        self.client.force_authenticate(user=parent_user)
+        response = self.client.get(f'/api/projects/projects/recommended/?student={self.student.id}')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        parent.students.add(self.student)
+        self.assertEqual(len(self.recommended(f'?student={self.student.id}')), 2)
+        response = self.client.get('/api/projects/projects/recommended/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
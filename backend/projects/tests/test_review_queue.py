@@ -0,0 +1,106 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import CorporatePartnerProfile, StudentProfile
+from projects.models import Project, StudentProjectSubmission
+
+User = get_user_model()
+
+
+class ReviewQueueTestCase(TestCase):
+    def setUp(self):
+        """Create two partners' projects and submissions from several students."""
+        self.client = APIClient()
+        self.partner_user = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        partner = CorporatePartnerProfile.objects.create(user=self.partner_user, company_name='Test Co')
+        other_user = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password='other123',
+            role=User.CORPORATE_PARTNER
+        )
+        other = CorporatePartnerProfile.objects.create(user=other_user, company_name='Other Co')
+        self.project = Project.objects.create(title='Robots', created_by=partner, status=Project.OPEN)
+        self.second = Project.objects.create(title='Weather', created_by=partner, status=Project.OPEN)
+        other_project = Project.objects.create(title='Theirs', created_by=other, status=Project.OPEN)
+        self.students = []
+        for i in range(4):
+            user = User.objects.create_user(
+                username=f'student{i}',
+                email=f'student{i}@test.com',
+                password='student123',
+                role=User.STUDENT
+            )
+            self.students.append(StudentProfile.objects.create(user=user))
+        statuses = [
+            StudentProjectSubmission.SUBMITTED, StudentProjectSubmission.SUBMITTED,
+            StudentProjectSubmission.REVIEWED, StudentProjectSubmission.APPROVED,
+        ]
+        self.submissions = [
+            StudentProjectSubmission.objects.create(student=student, project=self.project, status=submission_status)
+            for student, submission_status in zip(self.students, statuses)
+        ]
+        self.submissions.append(StudentProjectSubmission.objects.create(student=self.students[0], project=self.second))
+        StudentProjectSubmission.objects.create(student=self.students[1], project=other_project)
+        self.client.force_authenticate(user=self.partner_user)
+
+    def queue(self, **params):
+        response = self.client.get('/api/projects/student-submissions/review-queue/', params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_lists_own_projects_with_status_counts(self):
+        """Test that only the partner's submissions are listed, oldest first, with per-status counts."""
+        data = self.queue()
+        self.assertEqual([row['id'] for row in data['results']], [s.id for s in self.submissions])
+        self.assertEqual(data['status_counts'], {
+            StudentProjectSubmission.SUBMITTED: 3,
+            StudentProjectSubmission.REVIEWED: 1,
+            StudentProjectSubmission.APPROVED: 1,
+        })
+        first = data['results'][0]
+        self.assertEqual(first['student']['email'], 'student0@test.com')
+        self.assertEqual(first['project'], {'id': self.project.id, 'title': 'Robots'})
+
+    def test_filters_keep_counts_for_all_statuses(self):
+        """Test that ?status= filters the rows but not the counts, and ?project= filters both."""
+        data = self.queue(status=StudentProjectSubmission.SUBMITTED, project=self.project.id)
+        self.assertEqual([row['id'] for row in data['results']], [s.id for s in self.submissions[:2]])
+        self.assertEqual(data['status_counts'][StudentProjectSubmission.SUBMITTED], 2)
+        self.assertEqual(data['status_counts'][StudentProjectSubmission.APPROVED], 1)
+
+    def test_keyset_pages(self):
+        """Test that cursor pages walk the queue without gaps or repeats."""
+        seen = []
+        data = self.queue(page_size=2)
+        while True:
+            seen += [row['id'] for row in data['results']]
+            if not data['next']:
+                break
+            response = self.client.get(data['next'])
+            data = response.data
+        self.assertEqual(seen, [s.id for s in self.submissions])
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """Test that the page and the counts take a fixed number of queries."""
+        with self.assertNumQueries(3):
+            self.queue()
+        for i in range(2, 4):
+            StudentProjectSubmission.objects.create(student=self.students[i], project=self.second)
+        with self.assertNumQueries(3):
+            self.assertEqual(len(self.queue()['results']), 7)
+
+    def test_other_roles_forbidden_and_bad_filters_rejected(self):
+        """Test that students get a 403 and invalid filters a 400."""
+        for params in ({'status': 'LOST'}, {'project': 'x'}):
+            response = self.client.get('/api/projects/student-submissions/review-queue/', params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.force_authenticate(user=self.students[0].user)
+        response = self.client.get('/api/projects/student-submissions/review-queue/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
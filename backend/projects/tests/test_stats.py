@@ -0,0 +1,127 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import CorporatePartnerProfile, StudentProfile
+from projects.models import Project, ProjectStats, StudentProjectSubmission
+from projects import stats
+
+User = get_user_model()
+
+
+class ProjectStatsTestCase(TestCase):
+    def setUp(self):
+        """Create a partner with two projects and three students."""
+        self.client = APIClient()
+        self.partner_user = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        partner = CorporatePartnerProfile.objects.create(user=self.partner_user, company_name='Test Co')
+        self.project = Project.objects.create(title='Robots', created_by=partner, status=Project.OPEN)
+        self.other = Project.objects.create(title='Weather', created_by=partner, status=Project.OPEN)
+        self.students = []
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f'student{i}',
+                email=f'student{i}@test.com',
+                password='student123',
+                role=User.STUDENT
+            )
+            self.students.append(StudentProfile.objects.create(user=user))
+
+    def submit(self, student, project=None, **fields):
+        return StudentProjectSubmission.objects.create(student=student, project=project or self.project, **fields)
+
+    def assertStats(self, project, submitted, reviewed, approved):
+        row = ProjectStats.objects.get(project=project)
+        expected = stats.compute([project.id])[0]
+        self.assertEqual(
+            (row.submitted_count, row.reviewed_count, row.approved_count, row.student_count),
+            (submitted, reviewed, approved, submitted + reviewed + approved),
+        )
+        self.assertEqual(
+            [getattr(row, field) for field in stats.FIELDS],
+            [getattr(expected, field) for field in stats.FIELDS],
+        )
+
+    def test_follows_create_status_change_move_and_delete(self):
+        """Test that every submission write keeps the project's row equal to a recount."""
+        first = self.submit(self.students[0])
+        second = self.submit(self.students[1])
+        self.assertStats(self.project, 2, 0, 0)
+
+        first.status = StudentProjectSubmission.APPROVED
+        first.save()
+        self.assertStats(self.project, 1, 0, 1)
+
+        second.project = self.other
+        second.save()
+        self.assertStats(self.project, 0, 0, 1)
+        self.assertStats(self.other, 1, 0, 0)
+
+        second.delete()
+        self.assertStats(self.other, 0, 0, 0)
+        self.assertIsNone(ProjectStats.objects.get(project=self.other).last_submission_at)
+
+    def test_row_missing_is_computed_from_submissions(self):
+        """Test that a project without a row gets exact counts on its next submission."""
+        StudentProjectSubmission.objects.bulk_create([
+            StudentProjectSubmission(student=self.students[0], project=self.project),
+            StudentProjectSubmission(
+                student=self.students[1], project=self.project, status=StudentProjectSubmission.REVIEWED,
+            ),
+        ])
+        self.assertFalse(ProjectStats.objects.exists())
+        self.submit(self.students[2])
+        self.assertStats(self.project, 2, 1, 0)
+
+    def test_row_inserted_concurrently_gets_the_delta(self):
+        """Test that a row another transaction inserted first is incremented, not overwritten."""
+        compute = stats.compute
+
+        def compute_after_competitor(project_ids):
+            # A concurrent first submission, not visible here, inserts its row
+            ProjectStats.objects.create(project=self.project, submitted_count=1, student_count=1)
+            return compute(project_ids)
+
+        with mock.patch.object(stats, 'compute', compute_after_competitor):
+            self.submit(self.students[1])
+        row = ProjectStats.objects.get(project=self.project)
+        self.assertEqual((row.submitted_count, row.student_count), (2, 2))
+        self.assertIsNotNone(row.last_submission_at)
+
+    def test_deleting_project_or_student_cascades_cleanly(self):
+        """Test that cascading deletes do not leave or recreate stats rows."""
+        self.submit(self.students[0])
+        self.submit(self.students[1], project=self.other)
+        self.students[1].user.delete()
+        self.assertStats(self.other, 0, 0, 0)
+        self.project.delete()
+        self.assertFalse(ProjectStats.objects.filter(project_id=self.project.id).exists())
+
+    def test_rebuild_command_repairs_drift(self):
+        """Test that rebuild_project_stats recounts rows changed behind the signals' back."""
+        self.submit(self.students[0])
+        self.submit(self.students[1])
+        StudentProjectSubmission.objects.update(status=StudentProjectSubmission.APPROVED)
+        out = StringIO()
+        call_command('rebuild_project_stats', batch_size=1, stdout=out)
+        self.assertIn('Rebuilt stats for 2 projects (2 missing or drifted)', out.getvalue())
+        self.assertStats(self.project, 0, 0, 2)
+        self.assertStats(self.other, 0, 0, 0)
+
+    def test_stats_endpoint(self):
+        """Test that the stats action returns the project's stored counts."""
+        self.submit(self.students[0])
+        self.client.force_authenticate(user=self.partner_user)
+        response = self.client.get(f'/api/projects/projects/{self.project.id}/stats/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['submitted_count'], 1)
+        self.assertEqual(response.data['student_count'], 1)
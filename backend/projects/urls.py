@@ -4,12 +4,15 @@ from .views import (
     ProjectViewSet,
     StudentProjectSubmissionViewSet,
 )
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'projects', ProjectViewSet)
 router.register(r'student-submissions', StudentProjectSubmissionViewSet)
 
 urlpatterns = [
+    # Async read endpoints (served without blocking under ASGI)
+    path('async/projects/', async_views.project_list, name='async-project-list'),
     path('', include(router.urls)),
 ]
 
@@ -1,20 +1,28 @@
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from users.models import User
+from rest_framework.response import Response
+from backend.conditional import ConditionalGetMixin
+from users.models import StudentProfile, User
 from users.permissions import IsCorporatePartnerOrAdmin
+from users.scope import get_scope
 from .models import (
     Project,
     StudentProjectSubmission,
 )
 from .serializers import (
     ProjectSerializer,
+    ProjectStatsSerializer,
+    ReviewQueueSubmissionSerializer,
     StudentProjectSubmissionSerializer,
 )
+from . import moderation, recommendations, review, stats
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all().order_by('-created_at')
     serializer_class = ProjectSerializer
+    last_modified_field = 'updated_at'
     permission_classes = [IsAuthenticated, IsCorporatePartnerOrAdmin]
     
     def get_queryset(self):
@@ -23,29 +31,163 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Admins can see all projects.
         Students and others can see all projects (read-only via permissions).
         """
-        user = self.request.user
+        scope = get_scope(self.request)
         
         # Admins can see all projects
-        if user.is_staff or user.role == User.ADMIN:
+        if scope.is_admin:
             return Project.objects.all().order_by('-created_at')
         
         # Corporate partners can only see their own projects
-        if user.role == User.CORPORATE_PARTNER:
-            try:
-                corporate_profile = user.corporate_profile
-                return Project.objects.filter(created_by=corporate_profile).order_by('-created_at')
-            except AttributeError:
+        if scope.role == User.CORPORATE_PARTNER:
+            if scope.profile_id is None:
                 # User doesn't have a corporate partner profile
                 return Project.objects.none()
+            return Project.objects.filter(created_by_id=scope.profile_id).order_by('-created_at')
         
         # For other roles (students, parents, etc.), they can see all projects
         # but permissions will restrict what they can do (read-only)
         return Project.objects.all().order_by('-created_at')
 
+    @action(detail=False, methods=['get'])
+    def recommended(self, request):
+        """
+        OPEN projects ranked by weighted overlap between their required skills
+        and the student's skills (see projects/recommendations.py), skipping
+        projects the student has already submitted to. Students get their
+        own; parents, schools and admins pass ``?student=<profile id>``.
+        ``?limit=`` caps the result (default 20, at most 100).
+        """
+        scope = get_scope(request)
+        student_id = request.query_params.get('student')
+        if student_id is None:
+            if scope.role != User.STUDENT or scope.profile_id is None:
+                return Response({'error': 'student is required.'}, status=status.HTTP_400_BAD_REQUEST)
+            student_id = scope.profile_id
+        try:
+            student_id = int(student_id)
+            limit = int(request.query_params.get('limit', recommendations.DEFAULT_LIMIT))
+        except ValueError:
+            return Response({'error': 'student and limit must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not scope.can_see_student(student_id):
+            return Response({'error': 'Student not found.'}, status=status.HTTP_404_NOT_FOUND)
+        limit = max(1, min(limit, recommendations.MAX_LIMIT))
 
-class StudentProjectSubmissionViewSet(viewsets.ModelViewSet):
+        skill_ids = list(StudentProfile.skills.through.objects.filter(
+            studentprofile_id=student_id).values_list('skill_id', flat=True))
+        submitted = set(StudentProjectSubmission.objects.filter(
+            student_id=student_id).values_list('project_id', flat=True))
+        ranked = recommendations.recommend(skill_ids, limit, exclude=submitted)
+        projects = Project.objects.filter(status=Project.OPEN).prefetch_related('skills_required').in_bulk([pid for _, pid, _ in ranked])
+        return Response([
+            {
+                'score': round(score, 4),
+                'matched_skills': matched,
+                'project': ProjectSerializer(projects[project_id]).data,
+            }
+            for score, project_id, matched in ranked if project_id in projects
+        ])
+
+    @action(detail=True, methods=['get'], url_path='stats')
+    def project_stats(self, request, pk=None):
+        """
+        Submission counts by status, distinct students and the latest
+        submission time, read from the incrementally maintained
+        ``ProjectStats`` row (see projects/stats.py). A project that has
+        no row yet, e.g. one created before the table existed, gets it
+        computed and stored by this request, so the first GET writes.
+        """
+        project = self.get_object()
+        return Response(ProjectStatsSerializer(stats.get_stats(project.pk)).data)
+
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """
+        Move many projects to one ``status`` in a single UPDATE (see
+        projects/moderation.py). The body selects projects by ``ids``, by a
+        ``filter`` such as ``{"status": "DRAFT", "created_by": <partner
+        profile id>}``, or both. Only projects the caller may manage are
+        touched: admins any, recorded as ``approved_by``; corporate partners
+        their own. Requested ids outside that set are listed in ``not_found``.
+        """
+        target = request.data.get('status')
+        if target not in dict(Project.STATUS_CHOICES):
+            return Response({'error': 'status must be one of: ' + ', '.join(dict(Project.STATUS_CHOICES))},
+                            status=status.HTTP_400_BAD_REQUEST)
+        ids, filters = request.data.get('ids'), request.data.get('filter')
+        if ids is None and not filters:
+            return Response({'error': 'ids or filter is required.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = self.get_queryset()
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+                return Response({'error': 'ids must be a list of integers.'}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(id__in=ids)
+        if filters:
+            unknown = set(filters) - moderation.FILTERS.keys() if isinstance(filters, dict) else {'filter'}
+            if unknown:
+                return Response({'error': f'filter accepts only: {", ".join(moderation.FILTERS)}.'},
+                                status=status.HTTP_400_BAD_REQUEST)
+            try:
+                queryset = queryset.filter(**{moderation.FILTERS[key]: value for key, value in filters.items()})
+            except (TypeError, ValueError):
+                return Response({'error': 'Invalid filter value.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        scope = get_scope(request)
+        approver = scope.profile_id if scope.role == User.ADMIN else None
+        matched, changed = moderation.bulk_set_status(queryset, target, approved_by=approver)
+        updated = sum(changed.values())
+        return Response({
+            'status': target,
+            'matched': len(matched),
+            'updated': updated,
+            'unchanged': len(matched) - updated,
+            'previous_status': dict(changed),
+            'not_found': sorted(set(ids) - set(matched)) if ids is not None else [],
+        })
+
+
+class StudentProjectSubmissionViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = StudentProjectSubmission.objects.all().order_by('-submitted_at')
     serializer_class = StudentProjectSubmissionSerializer
+    last_modified_field = 'updated_at'
 
+    @action(detail=False, methods=['get'], url_path='review-queue', pagination_class=review.ReviewQueuePagination)
+    def review_queue(self, request):
+        """
+        Submissions to the corporate partner's own projects (admins see all),
+        oldest first and always paginated by cursor, with the student's user
+        and the project joined in. ``?status=`` and ``?project=`` filter the
+        page. ``status_counts`` covers the queue with ``?project=`` applied
+        but not ``?status=``, so every status tab can show its count.
+        """
+        scope = get_scope(request)
+        if scope.is_admin:
+            queryset = review.review_queryset()
+        elif scope.role == User.CORPORATE_PARTNER:
+            if scope.profile_id is None:
+                queryset = review.review_queryset().none()
+            else:
+                queryset = review.review_queryset(scope.profile_id)
+        else:
+            self.permission_denied(request)
 
+        params = request.query_params
+        status_filter = params.get('status')
+        if status_filter and status_filter not in dict(StudentProjectSubmission.STATUS_CHOICES):
+            return Response(
+                {'error': 'status must be one of: ' + ', '.join(dict(StudentProjectSubmission.STATUS_CHOICES))},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if params.get('project'):
+            try:
+                queryset = queryset.filter(project_id=int(params['project']))
+            except ValueError:
+                return Response({'error': 'project must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        counts = review.status_counts(queryset)
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(ReviewQueueSubmissionSerializer(page, many=True).data)
+        response.data = {'status_counts': counts, **response.data}
+        return response
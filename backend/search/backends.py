@@ -0,0 +1,217 @@
+"""
+Full-text search over projects, learning modules and workbooks.
+
+PostgreSQL: each table has a generated ``search_vector`` column (title
+weighted A, description B) with a GIN index, added by migration 0001 and
+recomputed by the database on every write. The query is parsed with
+``websearch_to_tsquery`` (quoted phrases, ``or``, ``-word``), the three
+tables are matched with ``@@`` in one ``UNION ALL`` ranked by ``ts_rank_cd``,
+and ``ts_headline`` runs only on the rows of the requested page.
+
+SQLite (development): one FTS5 table, ``search_document``, with the porter
+stemmer, kept in step with the three tables by triggers. Every word of the
+query must match. A first query ranks the matches with ``bm25`` (title
+weighted 10x the description) and a second highlights just the requested
+page with ``highlight``/``snippet``.
+
+Other backends fall back to ``icontains`` without ranking.
+
+Highlights are HTML: the text is escaped and matches are wrapped in
+``<mark>``.
+"""
+import html
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from learning.models import Module, Workbook
+from projects.models import Project
+
+# In the order numbered by the SQLite rowids of search/migrations/0001
+KINDS = {'project': Project, 'module': Module, 'workbook': Workbook}
+ROWID_STRIDE = 4
+
+# Highlight delimiters, swapped for <mark> tags after the text is escaped
+START, STOP = '\x02', '\x03'
+
+TITLE_HEADLINE = f'StartSel={START}, StopSel={STOP}, HighlightAll=true'
+DESCRIPTION_HEADLINE = (
+    f'StartSel={START}, StopSel={STOP}, MaxFragments=2, MaxWords=24, MinWords=8, FragmentDelimiter=" … "'
+)
+
+
+def search(query, kinds=None, status=None, is_published=None, project_owner=None, limit=20, offset=0):
+    """
+    Return up to ``limit`` hits for ``query``, best first, as dicts with
+    ``type``, ``id``, ``title``, ``score``, ``highlights`` and the
+    ``status`` (projects) or ``is_published`` (modules) of the object.
+
+    ``kinds`` restricts the models searched. ``status`` filters projects and
+    ``is_published`` filters modules; neither affects the other kinds.
+    ``project_owner`` limits projects to one corporate partner profile.
+    """
+    kinds = [kind for kind in KINDS if kinds is None or kind in kinds]
+    if not kinds or not query.strip():
+        return []
+    filters = {'status': status, 'is_published': is_published, 'project_owner': project_owner}
+    if connection.vendor == 'postgresql':
+        rows = _search_postgres(query, kinds, filters, limit, offset)
+    elif connection.vendor == 'sqlite':
+        rows = _search_sqlite(query, kinds, filters, limit, offset)
+    else:
+        rows = _search_fallback(query, kinds, filters, limit, offset)
+    return [_hit(*row) for row in rows]
+
+
+def _hit(kind, object_id, title, state, score, title_highlight, description_highlight):
+    hit = {
+        'type': kind,
+        'id': object_id,
+        'title': title,
+        'score': round(float(score or 0), 6),
+        'highlights': {
+            'title': _to_html(title_highlight),
+            'description': _to_html(description_highlight),
+        },
+    }
+    if kind == 'project':
+        hit['status'] = state
+    elif kind == 'module':
+        hit['is_published'] = bool(state)
+    return hit
+
+
+def _to_html(text):
+    return html.escape(text or '').replace(START, '<mark>').replace(STOP, '</mark>')
+
+
+def _source_conditions(kind, filters, column):
+    """SQL conditions and params restricting ``kind`` by the request filters."""
+    conditions, params = [], []
+    if kind == 'project':
+        if filters['status']:
+            conditions.append(f'{column("status")} = %s')
+            params.append(filters['status'])
+        if filters['project_owner'] is not None:
+            conditions.append(f'{column("created_by_id")} = %s')
+            params.append(filters['project_owner'])
+    elif kind == 'module' and filters['is_published'] is not None:
+        conditions.append(f'{column("is_published")} = %s')
+        params.append(filters['is_published'])
+    return conditions, params
+
+
+def _search_postgres(query, kinds, filters, limit, offset):
+    qn = connection.ops.quote_name
+    branches, params = [], [query]
+    for kind in kinds:
+        table = qn(KINDS[kind]._meta.db_table)
+        state = {'project': 't.status', 'module': 't.is_published::text'}.get(kind, 'NULL')
+        conditions, condition_params = _source_conditions(kind, filters, lambda name: f't.{qn(name)}')
+        branches.append(
+            f"SELECT '{kind}' AS kind, t.id, t.title, t.description, {state} AS state, "
+            f"ts_rank_cd(t.search_vector, q.query) AS score "
+            f"FROM {table} t, q WHERE t.search_vector @@ q.query"
+            + ''.join(f' AND {condition}' for condition in conditions)
+        )
+        params.extend(condition_params)
+    sql = (
+        "WITH q AS (SELECT websearch_to_tsquery('english', %s) AS query), "
+        f"hits AS (SELECT * FROM ({' UNION ALL '.join(branches)}) found "
+        "ORDER BY score DESC, kind, id LIMIT %s OFFSET %s) "
+        "SELECT hits.kind, hits.id, hits.title, hits.state, hits.score, "
+        "ts_headline('english', hits.title, q.query, %s), "
+        "ts_headline('english', hits.description, q.query, %s) "
+        "FROM hits, q ORDER BY hits.score DESC, hits.kind, hits.id"
+    )
+    params += [limit, offset, TITLE_HEADLINE, DESCRIPTION_HEADLINE]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        (kind, object_id, title, (state == 'true') if kind == 'module' else state, score, title_hl, description_hl)
+        for kind, object_id, title, state, score, title_hl, description_hl in rows
+    ]
+
+
+def fts5_query(query):
+    """Every word of ``query`` as a quoted FTS5 term, so user input cannot form FTS5 syntax."""
+    return ' '.join(f'"{word}"' for word in re.findall(r'\w+', query))
+
+
+def _search_sqlite(query, kinds, filters, limit, offset):
+    match = fts5_query(query)
+    if not match:
+        return []
+    qn = connection.ops.quote_name
+    numbers = {kind: number for number, kind in enumerate(KINDS)}
+    joins = {
+        'project': f'LEFT JOIN {qn(Project._meta.db_table)} p ON search_document.rowid %% {ROWID_STRIDE} = '
+                   f'{numbers["project"]} AND p.id = search_document.rowid / {ROWID_STRIDE}',
+        'module': f'LEFT JOIN {qn(Module._meta.db_table)} m ON search_document.rowid %% {ROWID_STRIDE} = '
+                  f'{numbers["module"]} AND m.id = search_document.rowid / {ROWID_STRIDE}',
+    }
+    # Rank on the rowid alone: reading the stored columns, joining or
+    # highlighting every match costs several times more than bm25 itself.
+    used_joins, conditions, params = [], [], [match]
+    if len(kinds) < len(KINDS):
+        conditions.append(
+            f'search_document.rowid %% {ROWID_STRIDE} IN ({", ".join(str(numbers[kind]) for kind in kinds)})'
+        )
+    for kind, alias in (('project', 'p'), ('module', 'm')):
+        kind_conditions, kind_params = _source_conditions(kind, filters, lambda name: f'{alias}.{qn(name)}')
+        if kind_conditions and kind in kinds:
+            used_joins.append(joins[kind])
+            conditions.append(
+                f'(search_document.rowid %% {ROWID_STRIDE} != {numbers[kind]} OR ({" AND ".join(kind_conditions)}))'
+            )
+            params.extend(kind_params)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT search_document.rowid, -bm25(search_document, 0, 0, 10.0, 1.0) AS score "
+            f"FROM search_document {' '.join(used_joins)} WHERE search_document MATCH %s "
+            + ''.join(f'AND {condition} ' for condition in conditions)
+            + "ORDER BY score DESC, search_document.rowid LIMIT %s OFFSET %s",
+            params + [limit, offset],
+        )
+        scores = dict(cursor.fetchall())
+        if not scores:
+            return []
+        # Then highlight just the page
+        cursor.execute(
+            "SELECT search_document.rowid, search_document.kind, search_document.object_id, search_document.title, "
+            "CASE search_document.kind WHEN 'project' THEN p.status WHEN 'module' THEN m.is_published END, "
+            "highlight(search_document, 2, %s, %s), snippet(search_document, 3, %s, %s, ' … ', 24) "
+            f"FROM search_document {joins['project']} {joins['module']} "
+            f"WHERE search_document MATCH %s AND search_document.rowid IN ({', '.join(['%s'] * len(scores))})",
+            [START, STOP, START, STOP, match, *scores],
+        )
+        rows = {row[0]: row[1:] for row in cursor.fetchall()}
+    return [
+        (kind, object_id, title, state, scores[rowid], title_hl, description_hl)
+        for rowid in scores
+        for kind, object_id, title, state, title_hl, description_hl in [rows[rowid]]
+    ]
+
+
+def _search_fallback(query, kinds, filters, limit, offset):
+    hits = []
+    for kind in kinds:
+        queryset = KINDS[kind].objects.filter(Q(title__icontains=query) | Q(description__icontains=query))
+        if kind == 'project':
+            if filters['status']:
+                queryset = queryset.filter(status=filters['status'])
+            if filters['project_owner'] is not None:
+                queryset = queryset.filter(created_by_id=filters['project_owner'])
+            state = 'status'
+        elif kind == 'module':
+            if filters['is_published'] is not None:
+                queryset = queryset.filter(is_published=filters['is_published'])
+            state = 'is_published'
+        else:
+            state = None
+        fields = ['id', 'title', 'description'] + ([state] if state else [])
+        for row in queryset.order_by('id').values_list(*fields)[:offset + limit]:
+            hits.append((kind, row[0], row[1], row[3] if state else None, 0, row[1], row[2][:200]))
+    return hits[offset:offset + limit]
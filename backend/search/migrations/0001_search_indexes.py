@@ -0,0 +1,96 @@
+from django.db import migrations
+
+# (kind, table) of every searchable model; see search/backends.py
+SOURCES = [
+    ('project', 'projects_project'),
+    ('module', 'learning_module'),
+    ('workbook', 'learning_workbook'),
+]
+
+ROWID_STRIDE = 4
+
+POSTGRES_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def create_postgres(schema_editor):
+    # Generated columns are recomputed by PostgreSQL on every write,
+    # including bulk updates and raw SQL.
+    for kind, table in SOURCES:
+        schema_editor.execute(
+            f'ALTER TABLE {table} ADD COLUMN search_vector tsvector '
+            f'GENERATED ALWAYS AS ({POSTGRES_VECTOR}) STORED'
+        )
+        schema_editor.execute(f'CREATE INDEX {table}_search_idx ON {table} USING gin (search_vector)')
+
+
+def drop_postgres(schema_editor):
+    for kind, table in SOURCES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_search_idx')
+        schema_editor.execute(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector')
+
+
+def create_sqlite(schema_editor):
+    # FTS5 cannot index its UNINDEXED columns, so each document's rowid
+    # encodes (object id, source) to let the triggers find it directly.
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE search_document USING fts5("
+        "kind UNINDEXED, object_id UNINDEXED, title, description, tokenize = 'porter unicode61')"
+    )
+    for number, (kind, table) in enumerate(SOURCES):
+        insert = (
+            "INSERT INTO search_document (rowid, kind, object_id, title, description) "
+            f"VALUES (new.id * {ROWID_STRIDE} + {number}, '{kind}', new.id, new.title, new.description)"
+        )
+        delete = f"DELETE FROM search_document WHERE rowid = old.id * {ROWID_STRIDE} + {number}"
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table} BEGIN {insert}; END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_update AFTER UPDATE OF title, description ON {table} "
+            f"BEGIN {delete}; {insert}; END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table} BEGIN {delete}; END"
+        )
+        schema_editor.execute(
+            "INSERT INTO search_document (rowid, kind, object_id, title, description) "
+            f"SELECT id * {ROWID_STRIDE} + {number}, '{kind}', id, title, description FROM {table}"
+        )
+
+
+def drop_sqlite(schema_editor):
+    for kind, table in SOURCES:
+        for event in ('insert', 'update', 'delete'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_search_{event}')
+    schema_editor.execute('DROP TABLE IF EXISTS search_document')
+
+
+def create(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        create_postgres(schema_editor)
+    elif vendor == 'sqlite':
+        create_sqlite(schema_editor)
+
+
+def drop(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        drop_postgres(schema_editor)
+    elif vendor == 'sqlite':
+        drop_sqlite(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_project_created_idx_and_more'),
+        ('learning', '0002_workbookpurchase_purchase_purchaser_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create, drop),
+    ]
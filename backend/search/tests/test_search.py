@@ -0,0 +1,126 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import AdminProfile, CorporatePartnerProfile
+from projects.models import Project
+from learning.models import Module, Workbook
+from search.backends import fts5_query
+
+User = get_user_model()
+
+
+class SearchTestCase(TestCase):
+    def setUp(self):
+        """Create two partners' projects, modules and a workbook, and an admin client."""
+        self.client = APIClient()
+        admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='admin123',
+            role=User.ADMIN
+        )
+        admin = AdminProfile.objects.create(user=admin_user)
+        partner_user = User.objects.create_user(
+            username='corporate',
+            email='corporate@test.com',
+            password='corporate123',
+            role=User.CORPORATE_PARTNER
+        )
+        self.partner = CorporatePartnerProfile.objects.create(user=partner_user, company_name='Test Co')
+        other_user = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password='other123',
+            role=User.CORPORATE_PARTNER
+        )
+        other = CorporatePartnerProfile.objects.create(user=other_user, company_name='Other Co')
+        self.title_match = Project.objects.create(
+            title='Gardening robots', description='Build a machine for the school garden.',
+            created_by=self.partner, status=Project.OPEN,
+        )
+        self.description_match = Project.objects.create(
+            title='Weather station', description='Log data for <robot> gardening experiments.',
+            created_by=other, status=Project.DRAFT,
+        )
+        self.module = Module.objects.create(
+            title='Robots 101', description='An introduction to gardening with robots.',
+            created_by=admin, is_published=True,
+        )
+        self.draft_module = Module.objects.create(
+            title='Robot ethics', description='Gardening is not covered here.', created_by=admin,
+        )
+        self.workbook = Workbook.objects.create(
+            title='Robot gardening workbook', description='Exercises.', created_by=admin, pdf_file='workbooks/r.pdf',
+        )
+        self.partner_user = partner_user
+        self.client.force_authenticate(user=admin_user)
+
+    def search(self, **params):
+        response = self.client.get('/api/search/', params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['results']
+
+    def test_ranks_title_matches_first_with_stemming(self):
+        """Test that stemmed words match and title matches outrank description matches."""
+        results = self.search(q='robot gardens')
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[-1], {
+            'type': 'project',
+            'id': self.description_match.id,
+            'title': 'Weather station',
+            'score': results[-1]['score'],
+            'highlights': {
+                'title': 'Weather station',
+                'description': 'Log data for &lt;<mark>robot</mark>&gt; <mark>gardening</mark> experiments.',
+            },
+            'status': Project.DRAFT,
+        })
+        self.assertGreater(results[0]['score'], results[-1]['score'])
+        self.assertIn('<mark>', results[0]['highlights']['title'])
+
+    def test_filters(self):
+        """Test that type, status and is_published filters restrict their own kind."""
+        results = self.search(q='robots', type='project,module', status=Project.OPEN, is_published='true')
+        self.assertEqual(
+            {(hit['type'], hit['id']) for hit in results},
+            {('project', self.title_match.id), ('module', self.module.id)},
+        )
+        self.assertTrue(all(hit['is_published'] for hit in results if hit['type'] == 'module'))
+
+    def test_index_follows_updates_and_deletes(self):
+        """Test that edited and deleted rows are reflected in the results."""
+        self.workbook.title = 'Spreadsheet drills'
+        self.workbook.description = 'Formulas.'
+        self.workbook.save()
+        self.module.delete()
+        found = {(hit['type'], hit['id']) for hit in self.search(q='robots')}
+        self.assertNotIn(('workbook', self.workbook.id), found)
+        self.assertNotIn(('module', self.module.id), found)
+        self.assertEqual(self.search(q='spreadsheet')[0]['id'], self.workbook.id)
+
+    def test_paging(self):
+        """Test that limit and offset page through the hits with a next link."""
+        response = self.client.get('/api/search/', {'q': 'robot', 'limit': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIn('offset=2', response.data['next'])
+        last = self.client.get('/api/search/', {'q': 'robot', 'limit': 2, 'offset': 4})
+        self.assertEqual(len(last.data['results']), 1)
+        self.assertIsNone(last.data['next'])
+
+    def test_partner_only_finds_own_projects(self):
+        """Test that corporate partners do not find other partners' projects."""
+        self.client.force_authenticate(user=self.partner_user)
+        projects = [hit['id'] for hit in self.search(q='gardening', type='project')]
+        self.assertEqual(projects, [self.title_match.id])
+
+    def test_rejects_bad_parameters(self):
+        """Test that a missing query, unknown type or bad flag is a 400."""
+        for params in ({}, {'q': 'robot', 'type': 'video'}, {'q': 'robot', 'is_published': 'maybe'}):
+            response = self.client.get('/api/search/', params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_syntax_is_not_interpreted(self):
+        """Test that FTS5 operators in user input are matched as plain words."""
+        self.assertEqual(fts5_query('robot" OR (NEAR* -x'), '"robot" "OR" "NEAR" "x"')
+        self.assertEqual(self.search(q='"*'), [])
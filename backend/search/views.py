@@ -0,0 +1,71 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from users.models import User
+from users.scope import get_scope
+
+from . import backends
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+
+@api_view(['GET'])
+def search(request):
+    """
+    Ranked full-text search over project, module and workbook titles and
+    descriptions (see search/backends.py).
+
+    ``?q=`` is required. ``?type=project,module`` restricts the kinds
+    searched, ``?status=`` filters projects and ``?is_published=true|false``
+    filters modules. ``?limit=`` (default 20, at most 50) and ``?offset=``
+    page through the hits; ``next`` links to the following page. Corporate
+    partners only find their own projects.
+    """
+    params = request.query_params
+    query = params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q is required.'}, status=status.HTTP_400_BAD_REQUEST)
+    kinds = None
+    if params.get('type'):
+        kinds = {kind.strip() for kind in params['type'].split(',') if kind.strip()}
+        unknown = kinds - backends.KINDS.keys()
+        if unknown:
+            return Response(
+                {'error': f'Unknown type: {", ".join(sorted(unknown))}. Choose from {", ".join(backends.KINDS)}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+    is_published = params.get('is_published')
+    if is_published is not None:
+        if is_published.lower() not in ('true', 'false'):
+            return Response({'error': 'is_published must be true or false.'}, status=status.HTTP_400_BAD_REQUEST)
+        is_published = is_published.lower() == 'true'
+    try:
+        limit = int(params.get('limit', DEFAULT_LIMIT))
+        offset = int(params.get('offset', 0))
+    except ValueError:
+        return Response({'error': 'limit and offset must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+    limit = max(1, min(limit, MAX_LIMIT))
+    offset = max(0, offset)
+
+    scope = get_scope(request)
+    project_owner = None
+    if not scope.is_admin and scope.role == User.CORPORATE_PARTNER:
+        project_owner = scope.profile_id or 0
+
+    hits = backends.search(
+        query,
+        kinds=kinds,
+        status=params.get('status') or None,
+        is_published=is_published,
+        project_owner=project_owner,
+        limit=limit + 1,
+        offset=offset,
+    )
+    next_url = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_url = replace_query_param(request.build_absolute_uri(), 'offset', offset + limit)
+    return Response({'next': next_url, 'results': hits})
@@ -5,3 +5,9 @@ class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
 
+    def ready(self):
+        from .user_cache import connect_signals
+        connect_signals(self.get_model('User'), self.get_model('ClaimsUser'))
+
+        from . import dashboard
+        dashboard.connect_signals()
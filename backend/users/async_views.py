@@ -0,0 +1,10 @@
+from backend.async_api import async_api_view, render
+from .serializers import UserSerializer
+
+
+@async_api_view
+async def me(request):
+    """
+    Async version of GET /api/users/users/me/.
+    """
+    return render(UserSerializer(request.user).data)
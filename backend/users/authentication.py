@@ -0,0 +1,42 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import ClaimsUser
+from .user_cache import get_user
+
+# User fields loaded up front; the rest are deferred until read
+USER_FIELDS = ('role', 'is_staff', 'is_active')
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that does not load the user row on every request.
+
+    The user is a ``ClaimsUser`` built from the token's id, so permission
+    checks and ``filter(user=request.user)`` need no query. Its role and
+    flags are taken from the per-process user cache rather than the token,
+    and inactive or deleted users are refused. Other fields load from the
+    same cache when first read.
+
+    Role, staff and active changes apply at once in the worker that saved
+    the user and within ``USER_CACHE['TTL']`` in the others.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        user = get_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        values = {api_settings.USER_ID_FIELD: user_id}
+        values.update((field, getattr(user, field)) for field in USER_FIELDS)
+        fields = [f.attname for f in ClaimsUser._meta.concrete_fields if f.attname in values]
+        return ClaimsUser.from_db(None, fields, [values[name] for name in fields])
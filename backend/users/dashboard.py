@@ -0,0 +1,167 @@
+"""
+Parent dashboard: every linked child's upcoming sessions, recent
+submissions, progress and new certificates in one response.
+
+``dashboard_students(parent)`` loads the children with one query and each
+section with one batched prefetch, so the dashboard costs the same handful of
+queries however many children the parent has. The per-child limits are
+applied inside the prefetch (``ROW_NUMBER()`` over the student), not by
+slicing in Python.
+
+The rendered dashboard is cached per parent in the shared cache for
+``PARENT_DASHBOARD['CACHE_TIMEOUT']`` seconds, under a per-parent version
+number kept with the helpers of ``backend/caching.py``. Saving or deleting a
+child's session, submission, progress tracker or certificate, or
+linking/unlinking a child, bumps the version of each of the child's parents
+once the transaction commits, so the next request rebuilds from committed
+rows. Bulk ``update()``/``delete()`` calls send no signals; the short timeout
+bounds how long they can go unnoticed.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Avg, OuterRef, Prefetch, Subquery
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+
+from achievements.models import Certificate
+from backend.caching import increment_version, read_version
+from analytics.models import ProgressTracker
+from mentorship.models import Session
+from projects.models import StudentProjectSubmission
+
+from .models import ParentProfile, StudentProfile
+
+VERSION_KEY = 'parent-dashboard:version:{parent_id}'
+ENTRY_KEY = 'parent-dashboard:{parent_id}:v{version}'
+
+
+DEFAULTS = {
+    # Seconds a rendered dashboard stays cached
+    'CACHE_TIMEOUT': 60,
+    'UPCOMING_SESSIONS': 5,
+    'RECENT_SUBMISSIONS': 5,
+    'RECENT_PROGRESS': 10,
+    'NEW_CERTIFICATE_DAYS': 30,
+}
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'PARENT_DASHBOARD', {})}
+
+
+def get_cache():
+    return caches['default']
+
+
+def dashboard_students(parent):
+    """The parent's children with every dashboard section prefetched."""
+    config = get_config()
+    now = timezone.now()
+    return (
+        StudentProfile.objects.filter(parents=parent)
+        .select_related('user', 'school')
+        .annotate(average_progress=Subquery(
+            ProgressTracker.objects.filter(student=OuterRef('pk')).order_by().values('student')
+            .annotate(value=Avg('progress_percent')).values('value')
+        ))
+        .prefetch_related(
+            Prefetch(
+                'mentorship_sessions',
+                queryset=Session.objects.filter(status=Session.BOOKED, date_time__gte=now)
+                .order_by('date_time')[:config['UPCOMING_SESSIONS']],
+                to_attr='upcoming_sessions',
+            ),
+            Prefetch(
+                'submissions',
+                queryset=StudentProjectSubmission.objects.order_by('-submitted_at')[:config['RECENT_SUBMISSIONS']],
+                to_attr='recent_submissions',
+            ),
+            Prefetch(
+                'progress_trackers',
+                queryset=ProgressTracker.objects.order_by('-last_updated')[:config['RECENT_PROGRESS']],
+                to_attr='recent_progress',
+            ),
+            Prefetch(
+                'certificates_issued',
+                queryset=Certificate.objects.filter(
+                    issue_date__gte=now.date() - timedelta(days=config['NEW_CERTIFICATE_DAYS']),
+                ).order_by('-issue_date'),
+                to_attr='new_certificates',
+            ),
+        )
+        .order_by('user__first_name', 'id')
+    )
+
+
+def get_dashboard(parent, build):
+    """
+    Return ``(data, hit)``: the cached dashboard of ``parent``, or
+    ``build(parent)`` stored under the parent's current version.
+    """
+    cache = get_cache()
+    version = read_version(VERSION_KEY.format(parent_id=parent.pk), cache)
+    key = ENTRY_KEY.format(parent_id=parent.pk, version=version)
+    data = cache.get(key)
+    if data is not None:
+        return data, True
+    data = build(parent)
+    cache.set(key, data, get_config()['CACHE_TIMEOUT'])
+    return data, False
+
+
+def invalidate_parents(parent_ids):
+    """Bump the dashboard version of ``parent_ids`` once the current transaction commits."""
+    parent_ids = list(parent_ids)
+    if parent_ids:
+        transaction.on_commit(lambda: _bump(parent_ids))
+
+
+def _bump(parent_ids):
+    cache = get_cache()
+    for parent_id in parent_ids:
+        increment_version(VERSION_KEY.format(parent_id=parent_id), cache)
+
+
+def invalidate_students(student_ids):
+    """Invalidate the dashboards of every parent linked to ``student_ids``."""
+    student_ids = [student_id for student_id in student_ids if student_id is not None]
+    if student_ids:
+        invalidate_parents(set(
+            ParentProfile.students.through.objects
+            .filter(studentprofile_id__in=student_ids)
+            .values_list('parentprofile_id', flat=True)
+        ))
+
+
+def connect_signals():
+    # Model -> attribute holding the student it belongs to
+    sources = {
+        Session: 'student_id',
+        StudentProjectSubmission: 'student_id',
+        ProgressTracker: 'student_id',
+        Certificate: 'issued_to_id',
+    }
+    for model, attribute in sources.items():
+        def on_change(sender, instance, attribute=attribute, **kwargs):
+            invalidate_students([getattr(instance, attribute)])
+
+        uid = f'parent-dashboard:{model._meta.label_lower}'
+        post_save.connect(on_change, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(on_change, sender=model, weak=False, dispatch_uid=uid)
+
+    def on_link(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ('post_add', 'post_remove', 'pre_clear'):
+            return
+        if not reverse:
+            invalidate_parents([instance.pk])
+        elif pk_set:
+            invalidate_parents(pk_set)
+        else:
+            invalidate_students([instance.pk])
+
+    m2m_changed.connect(
+        on_link, sender=ParentProfile.students.through, weak=False, dispatch_uid='parent-dashboard:links',
+    )
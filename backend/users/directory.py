@@ -0,0 +1,52 @@
+"""
+Filters for the admin user directory (``GET /api/users/users/directory/``).
+
+``?role=``, ``?is_verified=`` and ``?is_active=`` narrow the list. ``?q=`` is a
+case-insensitive prefix search over email, username, first and last name; a
+query with a space, e.g. ``ada love``, matches first and last name prefixes
+together. Listings are served newest first from the ``(date_joined, id)``
+and ``(role, date_joined, id)`` indexes, and on PostgreSQL the prefix search
+uses the trigram indexes from migration 0006.
+"""
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from .models import User
+
+BOOLEAN_VALUES = {'true': True, '1': True, 'false': False, '0': False}
+MAX_QUERY_LENGTH = 100
+
+
+def filter_directory(queryset, params):
+    """Apply the directory query parameters to a ``User`` queryset."""
+    errors = {}
+
+    role = params.get('role')
+    if role:
+        if role not in dict(User.ROLE_CHOICES):
+            errors['role'] = [f'Must be one of {", ".join(dict(User.ROLE_CHOICES))}.']
+        else:
+            queryset = queryset.filter(role=role)
+
+    for field in ('is_verified', 'is_active'):
+        value = params.get(field)
+        if value:
+            if value.lower() not in BOOLEAN_VALUES:
+                errors[field] = ['Must be true or false.']
+            else:
+                queryset = queryset.filter(**{field: BOOLEAN_VALUES[value.lower()]})
+
+    query = ' '.join(params.get('q', '').split())[:MAX_QUERY_LENGTH]
+    if query:
+        first, _, last = query.partition(' ')
+        condition = (
+            Q(email__istartswith=query) | Q(username__istartswith=query)
+            | Q(first_name__istartswith=query) | Q(last_name__istartswith=query)
+        )
+        if last:
+            condition |= Q(first_name__istartswith=first, last_name__istartswith=last)
+        queryset = queryset.filter(condition)
+
+    if errors:
+        raise ValidationError(errors)
+    return queryset
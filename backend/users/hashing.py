@@ -0,0 +1,166 @@
+"""
+Password hashing off the request thread.
+
+Bulk hashing (onboarding many students) is spread over a pool of worker
+processes, created on first use and shared by every request in the gunicorn
+worker, so concurrent uploads queue for the same bounded set of processes
+instead of each starting its own. Login verification runs on a small per-process thread pool:
+hashlib's PBKDF2 releases the GIL, so threads hash in parallel without the
+cost of extra processes, and bounding the pool keeps a burst of logins from
+taking every CPU away from other requests.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.contrib.auth.hashers import check_password, make_password
+
+# Below this many passwords, starting worker processes costs more than it saves
+PARALLEL_MIN_PASSWORDS = 16
+
+
+def _init_worker(settings_module):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+class PasswordHashPool:
+    """
+    Worker processes for bulk ``make_password``. With fewer than two
+    ``workers`` the hashing runs in the calling process.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._pool = None
+        if workers > 1:
+            # spawn rather than fork: forking a threaded gunicorn worker is unsafe
+            settings_module = os.environ.get('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(settings_module,),
+            )
+
+    def hash(self, passwords):
+        if self._pool is None:
+            return [make_password(password) for password in passwords]
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        return list(self._pool.map(make_password, passwords, chunksize=chunksize))
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+
+def get_hash_pool():
+    """This process's ``PasswordHashPool``, sized from ``PASSWORD_HASH_POOL``."""
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = PasswordHashPool(getattr(settings, 'PASSWORD_HASH_POOL', {}).get('WORKERS', 2))
+    return _hash_pool
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Return ``make_password`` of each password, in order.
+
+    By default the work goes to the shared pool from ``get_hash_pool()``.
+    ``workers`` instead hashes on a pool of that many processes started for
+    this call, for one-off runs such as the ``onboard_students`` command;
+    1 hashes in this process.
+    """
+    passwords = list(passwords)
+    if len(passwords) < PARALLEL_MIN_PASSWORDS or workers == 1:
+        return [make_password(password) for password in passwords]
+    if workers is None:
+        return get_hash_pool().hash(passwords)
+    pool = PasswordHashPool(min(workers, len(passwords)))
+    try:
+        return pool.hash(passwords)
+    finally:
+        pool.shutdown()
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2-SHA256 hasher with the work factor read from
+    ``PASSWORD_HASH_ITERATIONS``. Hashes made with another iteration count
+    are rehashed on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', hashers.PBKDF2PasswordHasher.iterations)
+
+
+class LoginQueueFull(Exception):
+    """More logins are waiting for password verification than the queue allows."""
+
+
+def _verify(password, encoded):
+    """``(valid, new_encoded)``; ``new_encoded`` is set when the hash needs upgrading."""
+    rehashed = []
+    valid = check_password(password, encoded, setter=lambda raw: rehashed.append(make_password(raw)))
+    return valid, rehashed[0] if rehashed else None
+
+
+class PasswordVerifier:
+    """
+    Bounded pool for login password checks.
+
+    At most ``workers`` hashes run at once and ``queue_size`` more wait for a
+    thread; further logins are refused with ``LoginQueueFull`` straight away
+    rather than piling up until the server times them out. With ``workers=0``
+    hashes run inline on Django's sync thread, as the DRF view used to.
+    """
+
+    def __init__(self, workers, queue_size):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(workers + queue_size) if workers else None
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-verify') if workers else None
+
+    def submit(self, password, encoded):
+        """Return a future of ``(valid, new_encoded)``."""
+        if not self._slots.acquire(blocking=False):
+            raise LoginQueueFull
+        try:
+            future = self._pool.submit(_verify, password, encoded)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def averify(self, password, encoded):
+        if self._pool is None:
+            return await sync_to_async(_verify)(password, encoded)
+        return await asyncio.wrap_future(self.submit(password, encoded))
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_verifier():
+    """This process's ``PasswordVerifier``, sized from ``PASSWORD_VERIFY``."""
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                config = getattr(settings, 'PASSWORD_VERIFY', {})
+                _verifier = PasswordVerifier(config.get('WORKERS', 2), config.get('QUEUE_SIZE', 64))
+    return _verifier
@@ -0,0 +1,58 @@
+"""
+Django management command to onboard a school's students from a CSV or JSON file.
+
+CSV files need a header line with at least email and password columns;
+username, first_name and last_name are optional. Nothing is created if any
+row is invalid.
+
+Usage:
+    python manage.py onboard_students --school 3 year7.csv
+    python manage.py onboard_students --school 3 year7.json --workers 8
+"""
+
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.models import SchoolProfile
+from users.onboarding import onboard_students, parse_rows
+
+
+class Command(BaseCommand):
+    help = "Bulk-create student accounts and profiles in a school from a CSV or JSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSON file of students')
+        parser.add_argument('--school', type=int, required=True, help='SchoolProfile id to add the students to')
+        parser.add_argument('--format', choices=['csv', 'json'], help='File format (default: from the extension)')
+        parser.add_argument('--workers', type=int, help='Password hashing processes (default: one per CPU)')
+
+    def handle(self, *args, **options):
+        try:
+            school = SchoolProfile.objects.get(pk=options['school'])
+        except SchoolProfile.DoesNotExist:
+            raise CommandError(f'School profile {options["school"]} does not exist')
+
+        path = options['path']
+        fmt = options['format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        try:
+            with open(path, 'rb') as handle:
+                rows = parse_rows(handle.read(), fmt)
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        started = time.perf_counter()
+        created, errors = onboard_students(school, rows, workers=options['workers'] or os.cpu_count() or 1)
+        if errors:
+            for error in errors:
+                where = f'row {error["row"]}' if error['row'] else 'upload'
+                for field, messages in error['errors'].items():
+                    self.stderr.write(f'{where}: {field}: {" ".join(messages)}')
+            raise CommandError(f'{len(errors)} invalid row(s); no students were created')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(created)} students in {school.name} in {time.perf_counter() - started:.1f}s'
+        ))
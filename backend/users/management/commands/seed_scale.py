@@ -0,0 +1,383 @@
+"""
+Django management command to generate a large, reproducible dataset across all apps.
+
+Rows are written with batched bulk_create and a single precomputed password
+hash, so 100k students with millions of messages and engagement logs take
+minutes. The same --seed always produces the same data.
+
+Usage:
+    python manage.py seed_scale
+    python manage.py seed_scale --students 100000 --messages 2000000 --logs 2000000 --seed 42
+    python manage.py seed_scale --students 2000 --reset
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from achievements.models import Badge, Certificate, Skill
+from analytics.models import EngagementLog, ProgressTracker
+from community.models import Comment, GroupChat, Message, Post
+from learning.models import Module, Workbook, WorkbookPurchase
+from mentorship.models import MentorProfile, Session
+from payments.models import PaymentTransaction
+from projects.models import Project, StudentProjectSubmission
+from users.models import (
+    AdminProfile, CorporatePartnerProfile, ParentProfile, SchoolProfile, StudentProfile, User,
+)
+
+PASSWORD = 'scalepass123'
+ACTIONS = ['login', 'view_project', 'view_module', 'submit_project', 'send_message', 'view_badge', 'logout']
+SKILL_CATEGORIES = ['Technology', 'Business', 'Creative', 'Science', 'Communication']
+WORDS = (
+    'project team design data research build present review learn mentor community skills '
+    'career code plan idea feedback report prototype launch market'
+).split()
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create keep the timestamps we generate instead of now()."""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False) or getattr(field, 'auto_now', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = 'Generate a large deterministic dataset (users, projects, chat, analytics...) for benchmarking'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=100000, help='Student accounts (default: 100000)')
+        parser.add_argument('--messages', type=int, help='Chat messages (default: 20 per student)')
+        parser.add_argument('--logs', type=int, help='Engagement logs (default: 20 per student)')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+        parser.add_argument('--prefix', default='scale', help='Username/name prefix of generated rows (default: scale)')
+        parser.add_argument('--anchor', default='2025-01-01',
+                            help='Date the generated timeline ends at, for reproducible timestamps (default: 2025-01-01)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT (default: 5000)')
+        parser.add_argument('--reset', action='store_true', help='Delete rows from a previous run with the same prefix')
+
+    def handle(self, *args, **options):
+        self.seed = options['seed']
+        self.prefix = options['prefix']
+        self.batch_size = options['batch_size']
+        self.anchor = datetime.fromisoformat(options['anchor']).replace(tzinfo=dt_timezone.utc)
+        students = options['students']
+        if students < 1:
+            raise CommandError('--students must be at least 1')
+
+        existing = User.objects.filter(username__startswith=f'{self.prefix}_')
+        if existing.exists():
+            if not options['reset']:
+                raise CommandError(f'Rows with prefix "{self.prefix}" already exist; pass --reset or another --prefix.')
+            self.reset()
+
+        self.volumes = {
+            'students': students,
+            'schools': max(1, students // 500),
+            'parents': max(1, students * 4 // 5),
+            'partners': max(1, students // 200),
+            'admins': max(1, students // 20000),
+            'skills': 200,
+            'projects_per_partner': 10,
+            'submissions_per_student': 2,
+            'sessions': students,
+            'posts': max(1, students // 2),
+            'likes_per_post': 5,
+            'comments': students,
+            'chats': max(1, students // 50),
+            'messages': options['messages'] if options['messages'] is not None else students * 20,
+            'logs': options['logs'] if options['logs'] is not None else students * 20,
+            'payments': max(1, students // 10),
+        }
+
+        started = time.perf_counter()
+        # One hash shared by every account: hashing per user would dominate the run
+        self.password = make_password(PASSWORD)
+        with explicit_timestamps(
+            Project, StudentProjectSubmission, Post, Comment, GroupChat, Message, EngagementLog,
+            ProgressTracker, PaymentTransaction, WorkbookPurchase, Module,
+        ):
+            self.seed_users()
+            self.seed_catalogue()
+            self.seed_projects()
+            self.seed_mentorship()
+            self.seed_community()
+            self.seed_analytics()
+            self.seed_payments()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Seeded in {time.perf_counter() - started:.0f}s. Every account uses password: {PASSWORD}'
+        ))
+
+    # Helpers
+
+    def rng(self, name):
+        """Independent stream per table, so changing one volume leaves the others identical."""
+        return random.Random(f'{self.seed}:{name}')
+
+    def moment(self, rng, days=365):
+        return self.anchor - timedelta(seconds=rng.randrange(days * 24 * 3600))
+
+    def text(self, rng, words=12):
+        return ' '.join(rng.choices(WORDS, k=words))
+
+    def bulk(self, model, objects, **kwargs):
+        """Insert ``objects`` in batches, each table in one transaction."""
+        started = time.perf_counter()
+        count = 0
+        batch = []
+        with transaction.atomic():
+            for obj in objects:
+                batch.append(obj)
+                if len(batch) >= self.batch_size:
+                    model.objects.bulk_create(batch, batch_size=self.batch_size, **kwargs)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                model.objects.bulk_create(batch, batch_size=self.batch_size, **kwargs)
+                count += len(batch)
+        self.stdout.write(f'  {model._meta.label:<40} {count:>10,} rows  {time.perf_counter() - started:6.1f}s')
+
+    def ids(self, queryset):
+        return list(queryset.order_by('id').values_list('id', flat=True))
+
+    def reset(self):
+        self.stdout.write(self.style.WARNING(f'Deleting previous "{self.prefix}" rows...'))
+        students = StudentProfile.objects.filter(user__username__startswith=f'{self.prefix}_')
+        student_ct = ContentType.objects.get_for_model(StudentProfile)
+        # Generic relations do not cascade
+        Comment.objects.filter(author_content_type=student_ct, author_object_id__in=students.values('id')).delete()
+        Post.objects.filter(author_content_type=student_ct, author_object_id__in=students.values('id')).delete()
+        GroupChat.objects.filter(name__startswith=self.prefix).delete()
+        Badge.objects.filter(name__startswith=self.prefix).delete()
+        Skill.objects.filter(name__startswith=self.prefix).delete()
+        User.objects.filter(username__startswith=f'{self.prefix}_').delete()
+
+    # Seeders
+
+    def seed_users(self):
+        self.stdout.write(self.style.SUCCESS('Users and profiles'))
+        v = self.volumes
+        rng = self.rng('users')
+        roles = [
+            (User.STUDENT, v['students']), (User.PARENT, v['parents']), (User.SCHOOL, v['schools']),
+            (User.CORPORATE_PARTNER, v['partners']), (User.ADMIN, v['admins']),
+        ]
+        self.bulk(User, (
+            User(
+                username=f'{self.prefix}_{role.lower()}_{i}', email=f'{self.prefix}_{role.lower()}_{i}@scale.test',
+                password=self.password, role=role, is_verified=True, is_staff=(role == User.ADMIN),
+                first_name=role.title(), last_name=str(i), date_joined=self.moment(rng, days=730),
+            )
+            for role, count in roles for i in range(count)
+        ))
+        users = {
+            role: self.ids(User.objects.filter(username__startswith=f'{self.prefix}_{role.lower()}_'))
+            for role, _ in roles
+        }
+        self.user_ids = users[User.STUDENT] + users[User.PARENT] + users[User.CORPORATE_PARTNER]
+
+        self.bulk(AdminProfile, (AdminProfile(user_id=user_id) for user_id in users[User.ADMIN]))
+        self.admins = self.ids(AdminProfile.objects.filter(user_id__in=users[User.ADMIN]))
+        self.bulk(SchoolProfile, (
+            SchoolProfile(user_id=user_id, name=f'{self.prefix.title()} School {i}', address=f'{i} High Street')
+            for i, user_id in enumerate(users[User.SCHOOL])
+        ))
+        schools = self.ids(SchoolProfile.objects.filter(user_id__in=users[User.SCHOOL]))
+        self.bulk(StudentProfile, (
+            StudentProfile(user_id=user_id, school_id=rng.choice(schools), bio=self.text(rng))
+            for user_id in users[User.STUDENT]
+        ))
+        self.student_user_ids = users[User.STUDENT]
+        self.students = self.ids(StudentProfile.objects.filter(user_id__in=users[User.STUDENT]))
+        self.bulk(CorporatePartnerProfile, (
+            CorporatePartnerProfile(user_id=user_id, company_name=f'{self.prefix.title()} Partner {i}',
+                                    industry=rng.choice(SKILL_CATEGORIES))
+            for i, user_id in enumerate(users[User.CORPORATE_PARTNER])
+        ))
+        self.partners = self.ids(CorporatePartnerProfile.objects.filter(user_id__in=users[User.CORPORATE_PARTNER]))
+        self.bulk(ParentProfile, (ParentProfile(user_id=user_id) for user_id in users[User.PARENT]))
+        self.parents = self.ids(ParentProfile.objects.filter(user_id__in=users[User.PARENT]))
+
+        Links = ParentProfile.students.through
+        self.bulk(Links, (
+            Links(parentprofile_id=parent_id, studentprofile_id=student_id)
+            for parent_id in self.parents
+            for student_id in set(rng.choice(self.students) for _ in range(rng.randint(1, 2)))
+        ))
+
+    def seed_catalogue(self):
+        self.stdout.write(self.style.SUCCESS('Skills, badges, modules and workbooks'))
+        rng = self.rng('catalogue')
+        self.bulk(Skill, (
+            Skill(name=f'{self.prefix} skill {i}', category=rng.choice(SKILL_CATEGORIES), description=self.text(rng))
+            for i in range(self.volumes['skills'])
+        ))
+        self.skills = self.ids(Skill.objects.filter(name__startswith=f'{self.prefix} skill'))
+        self.bulk(Badge, (
+            Badge(name=f'{self.prefix} badge {i}', skill_id=skill_id, criteria=self.text(rng, 6))
+            for i, skill_id in enumerate(self.skills)
+        ))
+        badges = self.ids(Badge.objects.filter(name__startswith=f'{self.prefix} badge'))
+        self.bulk(Module, (
+            Module(title=f'{self.prefix.title()} module {i}', description=self.text(rng), created_by_id=rng.choice(self.admins),
+                   is_published=rng.random() < 0.8, created_at=self.moment(rng))
+            for i in range(100)
+        ))
+        self.modules = self.ids(Module.objects.filter(title__startswith=f'{self.prefix.title()} module'))
+        self.bulk(Workbook, (
+            Workbook(title=f'{self.prefix.title()} workbook {i}', price=rng.choice(['4.99', '9.99', '19.99']),
+                     pdf_file='workbooks/scale.pdf', created_by_id=rng.choice(self.admins))
+            for i in range(20)
+        ))
+        self.workbooks = self.ids(Workbook.objects.filter(title__startswith=f'{self.prefix.title()} workbook'))
+
+        StudentSkills = StudentProfile.skills.through
+        self.bulk(StudentSkills, (
+            StudentSkills(studentprofile_id=student_id, skill_id=skill_id)
+            for student_id in self.students for skill_id in rng.sample(self.skills, 3)
+        ))
+        StudentBadges = StudentProfile.badges.through
+        self.bulk(StudentBadges, (
+            StudentBadges(studentprofile_id=student_id, badge_id=badge_id)
+            for student_id in self.students for badge_id in rng.sample(badges, rng.randint(0, 2))
+        ))
+        self.bulk(Certificate, (
+            Certificate(title=f'{self.prefix.title()} certificate', issued_to_id=student_id,
+                        issued_by_id=rng.choice(self.admins), issue_date=self.moment(rng).date())
+            for student_id in self.students if rng.random() < 0.3
+        ))
+
+    def seed_projects(self):
+        self.stdout.write(self.style.SUCCESS('Projects and submissions'))
+        rng = self.rng('projects')
+        statuses = [Project.OPEN] * 3 + [Project.DRAFT, Project.CLOSED, Project.ARCHIVED]
+        self.bulk(Project, (
+            Project(title=f'{self.prefix.title()} project {partner_id}-{i}', description=self.text(rng, 40),
+                    created_by_id=partner_id, status=rng.choice(statuses), approved_by_id=rng.choice(self.admins),
+                    start_date=self.anchor.date(), end_date=self.anchor.date() + timedelta(days=90),
+                    created_at=(created := self.moment(rng)), updated_at=created)
+            for partner_id in self.partners for i in range(self.volumes['projects_per_partner'])
+        ))
+        self.projects = self.ids(Project.objects.filter(created_by_id__in=self.partners))
+        ProjectSkills = Project.skills_required.through
+        self.bulk(ProjectSkills, (
+            ProjectSkills(project_id=project_id, skill_id=skill_id)
+            for project_id in self.projects for skill_id in rng.sample(self.skills, rng.randint(2, 5))
+        ))
+        submission_statuses = [choice for choice, _ in StudentProjectSubmission.STATUS_CHOICES]
+        per_student = min(self.volumes['submissions_per_student'], len(self.projects))
+        self.bulk(StudentProjectSubmission, (
+            StudentProjectSubmission(student_id=student_id, project_id=project_id,
+                                     submission_link='https://example.com/work', status=rng.choice(submission_statuses),
+                                     submitted_at=(submitted := self.moment(rng)), updated_at=submitted)
+            for student_id in self.students for project_id in rng.sample(self.projects, per_student)
+        ))
+
+    def seed_mentorship(self):
+        self.stdout.write(self.style.SUCCESS('Mentors and sessions'))
+        rng = self.rng('mentorship')
+        self.bulk(MentorProfile, (
+            MentorProfile(user_id=partner_id, bio=f'{self.prefix} mentor', skills=', '.join(rng.sample(WORDS, 3)))
+            for partner_id in self.partners for _ in range(2)
+        ))
+        mentors = self.ids(MentorProfile.objects.filter(user_id__in=self.partners))
+        statuses = [choice for choice, _ in Session.STATUS_CHOICES]
+        types = [choice for choice, _ in Session.SESSION_TYPES]
+        self.bulk(Session, (
+            Session(mentor_id=rng.choice(mentors), student_id=rng.choice(self.students), session_type=rng.choice(types),
+                    date_time=self.moment(rng, days=180) + timedelta(days=90), duration=rng.choice([30, 45, 60]),
+                    status=rng.choice(statuses))
+            for _ in range(self.volumes['sessions'])
+        ))
+
+    def seed_community(self):
+        self.stdout.write(self.style.SUCCESS('Posts, likes, comments and chat'))
+        rng = self.rng('community')
+        student_ct = ContentType.objects.get_for_model(StudentProfile)
+        last_post = Post.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        self.bulk(Post, (
+            Post(author_content_type=student_ct, author_object_id=rng.choice(self.students),
+                 content=self.text(rng, 30), created_at=self.moment(rng))
+            for _ in range(self.volumes['posts'])
+        ))
+        posts = self.ids(Post.objects.filter(id__gt=last_post))
+        Likes = Post.likes.through
+        max_likes = min(2 * self.volumes['likes_per_post'], len(self.user_ids))
+        self.bulk(Likes, (
+            Likes(post_id=post_id, user_id=user_id)
+            for post_id in posts for user_id in rng.sample(self.user_ids, rng.randint(0, max_likes))
+        ))
+        self.bulk(Comment, (
+            Comment(post_id=rng.choice(posts), author_content_type=student_ct,
+                    author_object_id=rng.choice(self.students), text=self.text(rng), created_at=self.moment(rng))
+            for _ in range(self.volumes['comments'])
+        ))
+
+        self.bulk(GroupChat, (
+            GroupChat(name=f'{self.prefix} chat {i}', created_at=self.moment(rng, days=730))
+            for i in range(self.volumes['chats'])
+        ))
+        chats = self.ids(GroupChat.objects.filter(name__startswith=f'{self.prefix} chat'))
+        Members = GroupChat.members.through
+        self.bulk(Members, (
+            Members(groupchat_id=chats[i % len(chats)], user_id=user_id)
+            for i, user_id in enumerate(self.student_user_ids)
+        ))
+        # Senders are drawn from each chat's members, as the API enforces
+        members = {}
+        for i, user_id in enumerate(self.student_user_ids):
+            members.setdefault(chats[i % len(chats)], []).append(user_id)
+        self.bulk(Message, (
+            Message(chat_id=(chat_id := rng.choice(chats)), sender_id=rng.choice(members[chat_id]),
+                    content=self.text(rng, 8), timestamp=self.moment(rng))
+            for _ in range(self.volumes['messages'])
+        ))
+
+    def seed_analytics(self):
+        self.stdout.write(self.style.SUCCESS('Progress and engagement logs'))
+        rng = self.rng('analytics')
+        self.bulk(ProgressTracker, (
+            ProgressTracker(student_id=student_id, module_id=rng.choice(self.modules),
+                            progress_percent=rng.randint(0, 100), last_updated=self.moment(rng))
+            for student_id in self.students
+        ))
+        self.bulk(EngagementLog, (
+            EngagementLog(user_id=rng.choice(self.user_ids), action_type=rng.choice(ACTIONS), timestamp=self.moment(rng))
+            for _ in range(self.volumes['logs'])
+        ))
+
+    def seed_payments(self):
+        self.stdout.write(self.style.SUCCESS('Payments and purchases'))
+        rng = self.rng('payments')
+        statuses = [choice for choice, _ in PaymentTransaction.STATUS_CHOICES]
+        self.bulk(PaymentTransaction, (
+            PaymentTransaction(user_id=rng.choice(self.user_ids), amount=rng.choice(['4.99', '9.99', '19.99']),
+                               provider=rng.choice([PaymentTransaction.STRIPE, PaymentTransaction.PAYPAL]),
+                               transaction_id=f'{self.prefix}_{self.seed}_{i}', status=rng.choice(statuses),
+                               created_at=self.moment(rng))
+            for i in range(self.volumes['payments'])
+        ))
+        parent_ct = ContentType.objects.get_for_model(ParentProfile)
+        self.bulk(WorkbookPurchase, (
+            WorkbookPurchase(workbook_id=rng.choice(self.workbooks), purchaser_content_type=parent_ct,
+                             purchaser_object_id=rng.choice(self.parents), payment_status=WorkbookPurchase.PAID,
+                             date=self.moment(rng))
+            for _ in range(self.volumes['payments'] // 2)
+        ))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-16 22:45
+
+from django.db import migrations, models
+
+# Prefix search in the admin user directory runs UPPER(col) LIKE UPPER('q%'),
+# which these trigram expression indexes serve. PostgreSQL only; other
+# backends skip them.
+SEARCH_COLUMNS = ['email', 'username', 'first_name', 'last_name']
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('users', 'User')._meta.db_table)
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS user_{column}_trgm_idx ON {table} '
+            f'USING gin (UPPER({schema_editor.quote_name(column)}::text) gin_trgm_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS user_{column}_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0005_claimsuser'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['date_joined', 'id'], name='user_joined_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'date_joined', 'id'], name='user_role_joined_idx'),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
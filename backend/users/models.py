@@ -21,9 +21,61 @@ class User(AbstractUser):
     role = models.CharField(max_length=32, choices=ROLE_CHOICES, default=STUDENT)
     is_verified = models.BooleanField(default=False)
 
+    # Reverse one-to-one accessor of each role's profile
+    PROFILE_RELATIONS = {
+        STUDENT: 'student_profile',
+        PARENT: 'parent_profile',
+        SCHOOL: 'school_profile',
+        CORPORATE_PARTNER: 'corporate_profile',
+        ADMIN: 'admin_profile',
+    }
+
+    class Meta(AbstractUser.Meta):
+        # Admin directory listings (newest first, optionally by role). The
+        # prefix-search indexes are PostgreSQL trigram indexes created in
+        # migration 0006.
+        indexes = [
+            models.Index(fields=['date_joined', 'id'], name='user_joined_idx'),
+            models.Index(fields=['role', 'date_joined', 'id'], name='user_role_joined_idx'),
+        ]
+
     def __str__(self):
         return self.email or self.username
 
+    @property
+    def profile(self):
+        """
+        The profile matching this user's role, or None if it does not exist.
+        Load users with ``select_related(*User.PROFILE_RELATIONS.values())``
+        to avoid a query here.
+        """
+        relation = self.PROFILE_RELATIONS.get(self.role)
+        return getattr(self, relation, None) if relation else None
+
+
+class ClaimsUser(User):
+    """
+    A ``User`` built from a verified JWT's user id without a query.
+
+    Only the id, role and flags are loaded. The first read of any other field
+    fills every missing field from the per-process user cache.
+    """
+
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is None or from_queryset is not None or not deferred.issuperset(fields):
+            return super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+        from .user_cache import get_user
+        user = get_user(self.pk)
+        if user is None:
+            raise User.DoesNotExist('User matching token claims does not exist.')
+        for name in deferred:
+            setattr(self, name, getattr(user, name))
+
 
 class SchoolProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='school_profile')
@@ -0,0 +1,170 @@
+"""
+Bulk onboarding of a school's students from CSV or JSON.
+
+Rows are validated together: uniqueness is checked against the upload itself
+and against the database with one ``__in`` query per field. If any row is
+invalid nothing is created and every problem is reported by row number, so a
+corrected file can be uploaded again as is. Passwords are hashed in a process
+pool before the transaction opens; users and their ``StudentProfile`` rows are
+then inserted with ``bulk_create`` in a single transaction.
+"""
+import csv
+import io
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from .hashing import hash_passwords
+from .models import StudentProfile, User
+
+MAX_ROWS = 5000
+BATCH_SIZE = 1000
+
+
+def parse_rows(content, fmt):
+    """
+    Parse an upload into a list of row dicts. ``fmt`` is ``'csv'`` (with a
+    header line) or ``'json'`` (a list, or an object with a ``students`` list).
+    Raises ``ValueError`` for unreadable input.
+    """
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+    if fmt == 'csv':
+        reader = csv.DictReader(io.StringIO(content))
+        if not reader.fieldnames or 'email' not in [name.strip().lower() for name in reader.fieldnames]:
+            raise ValueError('CSV must have a header line including an "email" column.')
+        return [
+            {(key or '').strip().lower(): (value or '').strip() for key, value in row.items()}
+            for row in reader
+        ]
+    if fmt == 'json':
+        try:
+            data = json.loads(content)
+        except ValueError as exc:
+            raise ValueError(f'Invalid JSON: {exc}')
+        if isinstance(data, dict):
+            data = data.get('students')
+        if not isinstance(data, list):
+            raise ValueError('JSON must be a list of students or an object with a "students" list.')
+        return data
+    raise ValueError(f'Unsupported format "{fmt}"; use csv or json.')
+
+
+def validate_rows(rows):
+    """
+    Return ``(clean_rows, errors)``. ``errors`` is a list of
+    ``{'row': n, 'errors': {field: [messages]}}`` with 1-based row numbers.
+    """
+    clean, errors = [], {}
+    seen_emails, seen_usernames = {}, {}
+    username_field = User._meta.get_field('username')
+    name_length = User._meta.get_field('first_name').max_length
+
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors[number] = {'non_field_errors': ['Expected an object.']}
+            continue
+        row_errors = {}
+        email = User.objects.normalize_email(str(row.get('email') or '').strip())
+        password = str(row.get('password') or '')
+        username = str(row.get('username') or '').strip() or email.split('@')[0]
+        first_name = str(row.get('first_name') or '').strip()
+        last_name = str(row.get('last_name') or '').strip()
+
+        if not email:
+            row_errors.setdefault('email', []).append('This field is required.')
+        else:
+            try:
+                validate_email(email)
+            except ValidationError as exc:
+                row_errors.setdefault('email', []).extend(exc.messages)
+        if not password:
+            row_errors.setdefault('password', []).append('This field is required.')
+        if username:
+            try:
+                username_field.clean(username, None)
+            except ValidationError as exc:
+                row_errors.setdefault('username', []).extend(exc.messages)
+        for field, value in (('first_name', first_name), ('last_name', last_name)):
+            if len(value) > name_length:
+                row_errors.setdefault(field, []).append(f'Ensure this field has no more than {name_length} characters.')
+
+        if email in seen_emails:
+            row_errors.setdefault('email', []).append(f'Duplicate of row {seen_emails[email]}.')
+        elif email:
+            seen_emails[email] = number
+        if username in seen_usernames:
+            row_errors.setdefault('username', []).append(f'Duplicate of row {seen_usernames[username]}.')
+        elif username:
+            seen_usernames[username] = number
+
+        if row_errors:
+            errors[number] = row_errors
+        else:
+            clean.append({
+                'row': number, 'email': email, 'password': password, 'username': username,
+                'first_name': first_name, 'last_name': last_name,
+            })
+
+    taken_emails = set(User.objects.filter(email__in=seen_emails).values_list('email', flat=True))
+    taken_usernames = set(User.objects.filter(username__in=seen_usernames).values_list('username', flat=True))
+    for email in taken_emails:
+        errors.setdefault(seen_emails[email], {}).setdefault('email', []).append('User with this email already exists.')
+    for username in taken_usernames:
+        errors.setdefault(seen_usernames[username], {}).setdefault('username', []).append('Username already taken.')
+
+    return clean, [{'row': number, 'errors': errors[number]} for number in sorted(errors)]
+
+
+def onboard_students(school, rows, workers=None):
+    """
+    Create a student user and ``StudentProfile`` in ``school`` for every row.
+
+    Returns ``(created, errors)``. When ``errors`` is non-empty nothing was
+    created. ``workers`` is passed on to ``hash_passwords``.
+    """
+    if len(rows) > MAX_ROWS:
+        return [], [{'row': None, 'errors': {'non_field_errors': [f'At most {MAX_ROWS} students per upload.']}}]
+    clean, errors = validate_rows(rows)
+    if errors:
+        return [], errors
+    if not clean:
+        return [], []
+
+    hashes = hash_passwords([row['password'] for row in clean], workers=workers)
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create([
+                User(
+                    username=row['username'], email=row['email'], password=password,
+                    first_name=row['first_name'], last_name=row['last_name'], role=User.STUDENT,
+                )
+                for row, password in zip(clean, hashes)
+            ], batch_size=BATCH_SIZE)
+            # Re-read ids: not every backend returns them from a bulk INSERT
+            user_ids = dict(User.objects.filter(email__in=[row['email'] for row in clean]).values_list('email', 'id'))
+            StudentProfile.objects.bulk_create([
+                StudentProfile(user_id=user_ids[row['email']], school=school) for row in clean
+            ], batch_size=BATCH_SIZE)
+            profile_ids = dict(
+                StudentProfile.objects.filter(user_id__in=user_ids.values()).values_list('user_id', 'id')
+            )
+    except IntegrityError:
+        # Another request registered one of these emails or usernames meanwhile
+        return [], [{'row': None, 'errors': {'non_field_errors': [
+            'Some emails or usernames were registered while this upload was processed; please retry.'
+        ]}}]
+
+    created = [
+        {
+            'row': row['row'],
+            'id': user_ids[row['email']],
+            'email': row['email'],
+            'username': row['username'],
+            'profile_id': profile_ids[user_ids[row['email']]],
+        }
+        for row in clean
+    ]
+    return created, []
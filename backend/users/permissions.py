@@ -1,5 +1,6 @@
 from rest_framework import permissions
 from .models import User
+from .scope import get_scope
 
 
 class IsAdminOrReadOnly(permissions.BasePermission):
@@ -9,9 +10,7 @@ class IsAdminOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user and request.user.is_authenticated and (
-            request.user.is_staff or request.user.role == User.ADMIN
-        )
+        return request.user and request.user.is_authenticated and get_scope(request).is_admin
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -24,17 +23,19 @@ class IsOwnerOrAdmin(permissions.BasePermission):
         return request.user and request.user.is_authenticated
     
     def has_object_permission(self, request, view, obj):
+        scope = get_scope(request)
+
         # Admin can do anything
-        if request.user.is_staff or request.user.role == User.ADMIN:
+        if scope.is_admin:
             return True
         
-        # Check if object has user attribute
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        # Check if object has user attribute (compare ids, no need to load the user)
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == scope.user_id
         
         # For User model itself
         if hasattr(obj, 'id'):
-            return obj.id == request.user.id
+            return obj.id == scope.user_id
         
         return False
 
@@ -50,33 +51,14 @@ class IsStudentOwner(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
-        user_role = request.user.role
+        scope = get_scope(request)
         allowed_roles = [User.STUDENT, User.PARENT, User.SCHOOL, User.ADMIN]
-        return user_role in allowed_roles or request.user.is_staff
+        return scope.role in allowed_roles or scope.is_admin
     
     def has_object_permission(self, request, view, obj):
-        if request.user.is_staff or request.user.role == User.ADMIN:
-            return True
-        
-        # Students can access their own profile
-        if request.user.role == User.STUDENT:
-            return obj.user == request.user
-        
-        # Parents can access their linked students
-        if request.user.role == User.PARENT:
-            parent_profile = getattr(request.user, 'parent_profile', None)
-            if parent_profile:
-                return obj in parent_profile.students.all()
-            return False
-        
-        # Schools can access their students
-        if request.user.role == User.SCHOOL:
-            school_profile = getattr(request.user, 'school_profile', None)
-            if school_profile:
-                return obj.school == school_profile
-            return False
-        
-        return False
+        # Admins see every student; students their own profile, parents their
+        # linked students and schools their students (see AccessScope.student_ids)
+        return get_scope(request).can_see_student(obj.id)
 
 
 class IsCorporatePartnerOrAdmin(permissions.BasePermission):
@@ -95,28 +77,25 @@ class IsCorporatePartnerOrAdmin(permissions.BasePermission):
             return True
         
         # Write operations: only corporate partners and admins
-        return (
-            request.user.is_staff or 
-            request.user.role == User.ADMIN or 
-            request.user.role == User.CORPORATE_PARTNER
-        )
+        scope = get_scope(request)
+        return scope.is_admin or scope.role == User.CORPORATE_PARTNER
     
     def has_object_permission(self, request, view, obj):
         # Read operations: all authenticated users can read
         if request.method in permissions.SAFE_METHODS:
             return True
         
+        scope = get_scope(request)
+
         # Admin can do anything
-        if request.user.is_staff or request.user.role == User.ADMIN:
+        if scope.is_admin:
             return True
         
         # Corporate partners can only manage their own projects
-        if request.user.role == User.CORPORATE_PARTNER:
-            if hasattr(obj, 'created_by'):
-                # created_by is a ForeignKey to CorporatePartnerProfile
-                # Check if the corporate partner profile's user matches the request user
-                if obj.created_by and hasattr(obj.created_by, 'user'):
-                    return obj.created_by.user == request.user
+        if scope.role == User.CORPORATE_PARTNER:
+            # created_by is a ForeignKey to CorporatePartnerProfile
+            created_by_id = getattr(obj, 'created_by_id', None)
+            return created_by_id is not None and created_by_id == scope.profile_id
         
         return False
 
@@ -131,12 +110,14 @@ class RoleBasedPermission(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
+        scope = get_scope(request)
+
         # Admin/Staff can do anything
-        if request.user.is_staff or request.user.role == 'ADMIN':
+        if scope.is_admin:
             return True
         
         # Check if user's role is in allowed roles
-        return request.user.role in self.allowed_roles
+        return scope.role in self.allowed_roles
 
 
 class IsStudentRole(RoleBasedPermission):
@@ -170,24 +151,28 @@ class IsOwnerOrRoleOrAdmin(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
+        scope = get_scope(request)
+
         # Admins can always access
-        if request.user.is_staff or request.user.role == 'ADMIN':
+        if scope.is_admin:
             return True
         
         # Check if user has the required role
         if self.required_role:
-            return request.user.role == self.required_role
+            return scope.role == self.required_role
         
         return True
     
     def has_object_permission(self, request, view, obj):
+        scope = get_scope(request)
+
         # Admin can do anything
-        if request.user.is_staff or request.user.role == User.ADMIN:
+        if scope.is_admin:
             return True
         
         # Check if object has user attribute and user owns it
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == scope.user_id
         
         return False
 
@@ -217,8 +202,10 @@ class IsAuthorOrAdmin(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         
+        scope = get_scope(request)
+
         # Admin can do anything
-        if request.user.is_staff or request.user.role == User.ADMIN:
+        if scope.is_admin:
             return True
         
         # Check if object has author GenericForeignKey
@@ -231,13 +218,13 @@ class IsAuthorOrAdmin(permissions.BasePermission):
         
         # Check if author is a StudentProfile matching the current user
         student_ct = ContentType.objects.get_for_model(StudentProfile)
-        if obj.author_content_type == student_ct:
-            if hasattr(request.user, 'student_profile'):
-                return obj.author_object_id == request.user.student_profile.id
+        if obj.author_content_type_id == student_ct.id:
+            if scope.role == User.STUDENT and scope.profile_id is not None:
+                return obj.author_object_id == scope.profile_id
         
         # Check if author is a MentorProfile (if mentor is linked to corporate partner)
         mentor_ct = ContentType.objects.get_for_model(MentorProfile)
-        if obj.author_content_type == mentor_ct:
+        if obj.author_content_type_id == mentor_ct.id:
             # For mentors, we'd need to check if they're linked to the user
             # This is simplified - full implementation would require checking mentor relationships
             pass
@@ -0,0 +1,71 @@
+"""
+Per-student summary for a school's roster, computed in one query.
+
+Submission counts per status and the latest submission come from a grouped
+``COUNT``/``MAX`` over the one joined table (``submissions``). Everything else
+is a correlated subquery, so joining a second to-many table cannot multiply
+the rows being counted or averaged:
+
+* ``average_progress``: ``AVG(progress_percent)`` over the student's trackers;
+* ``certificate_count``: certificates issued to the student (``issued_to``);
+* ``last_progress`` / ``last_engagement``: the newest tracker update and
+  engagement log entry, each read from its ``(student|user, timestamp)``
+  ordering.
+
+``last_activity`` is the newest of the three timestamps. The queryset is
+ordered by last name, first name and id so it can be keyset-paginated.
+"""
+from django.db.models import Avg, Count, IntegerField, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from achievements.models import Certificate
+from analytics.models import EngagementLog, ProgressTracker
+from projects.models import StudentProjectSubmission
+
+from .models import StudentProfile
+
+
+def _per_student(queryset, aggregate, outer='pk', field='student'):
+    """Correlated ``SELECT <aggregate> ... WHERE <field> = outer GROUP BY <field>``."""
+    return Subquery(
+        queryset.filter(**{field: OuterRef(outer)}).order_by().values(field)
+        .annotate(value=aggregate).values('value')
+    )
+
+
+def roster_queryset(school):
+    """The students of ``school`` annotated with their roster summary."""
+    status_counts = {
+        f'submissions_{status.lower()}': Count('submissions', filter=Q(submissions__status=status))
+        for status, _ in StudentProjectSubmission.STATUS_CHOICES
+    }
+    return (
+        StudentProfile.objects.filter(school=school)
+        .select_related('user')
+        .only('id', 'school_id', 'user__id', 'user__username', 'user__email', 'user__first_name', 'user__last_name')
+        .annotate(
+            submissions_total=Count('submissions'),
+            last_submission=Max('submissions__updated_at'),
+            **status_counts,
+            average_progress=_per_student(ProgressTracker.objects.all(), Avg('progress_percent')),
+            certificate_count=Coalesce(
+                _per_student(Certificate.objects.all(), Count('id'), field='issued_to'),
+                Value(0), output_field=IntegerField(),
+            ),
+            last_progress=Subquery(
+                ProgressTracker.objects.filter(student=OuterRef('pk'))
+                .order_by('-last_updated').values('last_updated')[:1]
+            ),
+            last_engagement=Subquery(
+                EngagementLog.objects.filter(user=OuterRef('user_id'))
+                .order_by('-timestamp').values('timestamp')[:1]
+            ),
+        )
+        .order_by('user__last_name', 'user__first_name', 'id')
+    )
+
+
+def last_activity(student):
+    moments = [student.last_submission, student.last_progress, student.last_engagement]
+    moments = [moment for moment in moments if moment is not None]
+    return max(moments) if moments else None
@@ -0,0 +1,80 @@
+"""
+Per-request access scope shared by permission classes and querysets.
+
+``get_scope(request)`` resolves the caller's role, admin flag and own profile
+id once and memoizes the result on the request, so every permission check and
+``get_queryset`` in the request reads the same values instead of looking up
+``request.user.<role>_profile`` again. The profile id comes from the JWT's
+``profile_id`` claim when present, so usually no query is needed at all. The
+set of student profiles the caller may see is loaded on first use with a
+single ``values_list`` query, and membership checks against it are O(1).
+"""
+from django.utils.functional import cached_property
+
+from .models import ParentProfile, StudentProfile, User
+
+
+class AccessScope:
+    """What the authenticated ``user`` may see."""
+
+    def __init__(self, user, token=None):
+        self.user_id = user.pk
+        self.role = user.role
+        self.is_admin = user.is_staff or user.role == User.ADMIN
+        claim = token.get('profile_id') if token is not None and hasattr(token, 'get') else None
+        if claim is not None and token.get('role') == user.role:
+            self.profile_id = claim
+
+    @cached_property
+    def profile_id(self):
+        """Id of the profile matching the user's role, or None."""
+        relation = User.PROFILE_RELATIONS.get(self.role)
+        if relation is None:
+            return None
+        model = User._meta.get_field(relation).related_model
+        return model.objects.filter(user_id=self.user_id).values_list('id', flat=True).first()
+
+    @cached_property
+    def student_ids(self):
+        """Ids of the student profiles the user may see; None means all of them."""
+        if self.is_admin:
+            return None
+        if self.role == User.STUDENT:
+            return frozenset([self.profile_id] if self.profile_id else [])
+        if self.role == User.PARENT:
+            return frozenset(
+                ParentProfile.students.through.objects
+                .filter(parentprofile__user_id=self.user_id)
+                .values_list('studentprofile_id', flat=True)
+            )
+        if self.role == User.SCHOOL:
+            return frozenset(
+                StudentProfile.objects.filter(school__user_id=self.user_id).values_list('id', flat=True)
+            )
+        return frozenset()
+
+    def can_see_student(self, student_id):
+        return self.student_ids is None or student_id in self.student_ids
+
+    def filter_students(self, queryset):
+        """Restrict a ``StudentProfile`` queryset to the profiles the user may see."""
+        if self.is_admin:
+            return queryset
+        if self.profile_id is None:
+            return queryset.none()
+        if self.role == User.STUDENT:
+            return queryset.filter(id=self.profile_id)
+        if self.role == User.PARENT:
+            return queryset.filter(parents=self.profile_id)
+        if self.role == User.SCHOOL:
+            return queryset.filter(school_id=self.profile_id)
+        return queryset.none()
+
+
+def get_scope(request):
+    """The ``AccessScope`` of ``request.user``, computed once per request."""
+    scope = getattr(request, '_access_scope', None)
+    if scope is None or scope.user_id != request.user.pk:
+        scope = AccessScope(request.user, getattr(request, 'auth', None))
+        request._access_scope = scope
+    return scope
@@ -8,6 +8,13 @@ from .models import (
     AdminProfile,
 )
 from achievements.models import Badge, Certificate, Skill
+from achievements.serializers import BadgeSerializer, CertificateSerializer, SkillSerializer
+from backend.expansion import ExpandableFieldsMixin
+from analytics.serializers import ProgressTrackerSerializer
+from mentorship.serializers import SessionSerializer
+from projects.models import StudentProjectSubmission
+from projects.serializers import StudentProjectSubmissionSerializer
+from .roster import last_activity
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -45,7 +52,68 @@ class SchoolProfileSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'name', 'address']
 
 
-class StudentProfileSerializer(serializers.ModelSerializer):
+class SchoolRosterSerializer(serializers.ModelSerializer):
+    """One roster row; reads the annotations of ``users.roster.roster_queryset``."""
+    user = serializers.SerializerMethodField()
+    submissions = serializers.SerializerMethodField()
+    average_progress = serializers.DecimalField(max_digits=5, decimal_places=2, read_only=True)
+    certificate_count = serializers.IntegerField(read_only=True)
+    last_activity = serializers.SerializerMethodField()
+
+    class Meta:
+        model = StudentProfile
+        fields = ['id', 'user', 'submissions', 'average_progress', 'certificate_count', 'last_activity']
+
+    def get_user(self, obj):
+        user = obj.user
+        return {
+            'id': user.id, 'username': user.username, 'email': user.email,
+            'first_name': user.first_name, 'last_name': user.last_name,
+        }
+
+    def get_submissions(self, obj):
+        counts = {
+            status: getattr(obj, f'submissions_{status.lower()}')
+            for status, _ in StudentProjectSubmission.STATUS_CHOICES
+        }
+        counts['total'] = obj.submissions_total
+        return counts
+
+    def get_last_activity(self, obj):
+        moment = last_activity(obj)
+        return serializers.DateTimeField().to_representation(moment) if moment else None
+
+
+class ParentDashboardStudentSerializer(serializers.ModelSerializer):
+    """One child on the parent dashboard; reads ``users.dashboard.dashboard_students``."""
+    user = serializers.SerializerMethodField()
+    school = serializers.SerializerMethodField()
+    average_progress = serializers.DecimalField(max_digits=5, decimal_places=2, read_only=True)
+    upcoming_sessions = SessionSerializer(many=True, read_only=True)
+    recent_submissions = StudentProjectSubmissionSerializer(many=True, read_only=True)
+    progress = ProgressTrackerSerializer(source='recent_progress', many=True, read_only=True)
+    new_certificates = CertificateSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = StudentProfile
+        fields = [
+            'id', 'user', 'school', 'average_progress', 'upcoming_sessions',
+            'recent_submissions', 'progress', 'new_certificates',
+        ]
+
+    def get_user(self, obj):
+        return {'id': obj.user.id, 'first_name': obj.user.first_name, 'last_name': obj.user.last_name}
+
+    def get_school(self, obj):
+        return {'id': obj.school.id, 'name': obj.school.name} if obj.school else None
+
+
+class StudentProfileSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'badges': BadgeSerializer,
+        'certificates': CertificateSerializer,
+        'skills': SkillSerializer,
+    }
     badges = serializers.PrimaryKeyRelatedField(queryset=Badge.objects.all(), many=True, required=False)
     certificates = serializers.PrimaryKeyRelatedField(queryset=Certificate.objects.all(), many=True, required=False)
     skills = serializers.PrimaryKeyRelatedField(queryset=Skill.objects.all(), many=True, required=False)
@@ -0,0 +1,103 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from users import hashing
+from users.models import StudentProfile, SchoolProfile
+
+User = get_user_model()
+
+
+class LoginTestCase(TestCase):
+    def setUp(self):
+        """Create a student with a profile and a parent without one."""
+        self.client = APIClient()
+        self.student = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+        self.profile = StudentProfile.objects.create(user=self.student)
+        self.parent = User.objects.create_user(
+            username='parent',
+            email='parent@test.com',
+            password='parent123',
+            role=User.PARENT
+        )
+
+    def login(self, email, password):
+        return self.client.post('/api/users/auth/login/', {'email': email, 'password': password}, format='json')
+
+    def test_login_resolves_profile_in_one_query(self):
+        """Test that the user and the role's profile are loaded together."""
+        with self.assertNumQueries(1):
+            response = self.login('student@test.com', 'student123')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['user']['profile_id'], self.profile.id)
+
+    def test_tokens_carry_profile_claims(self):
+        """Test that access tokens, including refreshed ones, embed role, profile and staff claims."""
+        response = self.login('student@test.com', 'student123')
+        access = AccessToken(response.json()['access'])
+        self.assertEqual(access['role'], User.STUDENT)
+        self.assertEqual(access['profile_id'], self.profile.id)
+        self.assertFalse(access['is_staff'])
+
+        refreshed = RefreshToken(response.json()['refresh']).access_token
+        self.assertEqual(refreshed['profile_id'], self.profile.id)
+
+    def test_missing_profile_gives_null_profile_id(self):
+        """Test that a user without a profile still logs in."""
+        response = self.login('parent@test.com', 'parent123')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.json()['user']['profile_id'])
+        self.assertIsNone(AccessToken(response.json()['access'])['profile_id'])
+
+    def test_school_profile_is_resolved(self):
+        """Test that school users get their school profile id."""
+        school = User.objects.create_user(
+            username='school',
+            email='school@test.com',
+            password='school123',
+            role=User.SCHOOL
+        )
+        profile = SchoolProfile.objects.create(user=school, name='Test School')
+        response = self.login('school@test.com', 'school123')
+        self.assertEqual(response.json()['user']['profile_id'], profile.id)
+
+    def test_invalid_credentials(self):
+        """Test that unknown emails and wrong passwords are rejected alike."""
+        self.assertEqual(self.login('nobody@test.com', 'x').status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.login('student@test.com', 'wrong').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=1000)
+    def test_rehashes_to_configured_cost(self):
+        """Test that a successful login upgrades the hash to PASSWORD_HASH_ITERATIONS."""
+        self.assertNotIn('$1000$', self.student.password)
+        response = self.login('student@test.com', 'student123')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.student.refresh_from_db()
+        self.assertTrue(self.student.password.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(self.student.check_password('student123'))
+
+    def test_full_queue_returns_503(self):
+        """Test that logins beyond the verifier queue are refused with Retry-After."""
+        verifier = hashing.PasswordVerifier(workers=1, queue_size=0)
+        verifier._slots.acquire()
+        with mock.patch.object(hashing, '_verifier', verifier):
+            response = self.login('student@test.com', 'student123')
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '1')
+
+        verifier._slots.release()
+        with mock.patch.object(hashing, '_verifier', verifier):
+            self.assertEqual(self.login('student@test.com', 'student123').status_code, status.HTTP_200_OK)
+
+    def test_form_encoded_login(self):
+        """Test that form-encoded logins are still accepted."""
+        response = self.client.post('/api/users/auth/login/', {'email': 'student@test.com', 'password': 'student123'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
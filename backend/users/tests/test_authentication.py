@@ -0,0 +1,155 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from users import user_cache
+from users.authentication import StatelessJWTAuthentication
+from users.models import AdminProfile, ClaimsUser, StudentProfile
+from users.tokens import ProfileRefreshToken
+
+User = get_user_model()
+
+
+class StatelessJWTAuthenticationTestCase(TestCase):
+    def setUp(self):
+        """Create a student and clear the per-process user cache."""
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+        self.student = User.objects.create_user(
+            username='student',
+            email='student@test.com',
+            password='student123',
+            role=User.STUDENT
+        )
+        self.profile = StudentProfile.objects.create(user=self.student)
+        self.factory = APIRequestFactory()
+
+    def authenticate(self, token):
+        request = self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return StatelessJWTAuthentication().authenticate(request)[0]
+
+    def access_token(self, user):
+        return ProfileRefreshToken.for_user(user, profile_id=self.profile.id).access_token
+
+    def test_user_is_built_from_claims(self):
+        """Test that authentication needs no query once the user is cached."""
+        token = self.access_token(self.student)
+        self.authenticate(token)
+        with self.assertNumQueries(0):
+            user = self.authenticate(token)
+            self.assertIsInstance(user, ClaimsUser)
+            self.assertEqual(user, self.student)
+            self.assertEqual(user.role, User.STUDENT)
+            self.assertFalse(user.is_staff)
+        with self.assertNumQueries(1):
+            self.assertEqual(list(StudentProfile.objects.filter(user=user)), [self.profile])
+
+    def test_other_fields_load_once_from_cache(self):
+        """Test that non-claim fields are filled from the user cache."""
+        token = self.access_token(self.student)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate(token).email, 'student@test.com')
+        with self.assertNumQueries(0):
+            user = self.authenticate(token)
+            self.assertEqual(user.email, 'student@test.com')
+            self.assertEqual(user.username, 'student')
+
+    def test_save_invalidates_cache(self):
+        """Test that saving a user drops its cached row."""
+        token = self.access_token(self.student)
+        self.authenticate(token).email
+        self.student.first_name = 'Updated'
+        self.student.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate(token).first_name, 'Updated')
+
+    def test_tokens_without_claims_use_cache(self):
+        """Test that tokens issued before the claims existed still authenticate."""
+        token = RefreshToken.for_user(self.student).access_token
+        self.assertEqual(self.authenticate(token).email, 'student@test.com')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(token).email, 'student@test.com')
+
+        self.student.is_active = False
+        self.student.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+    def test_flags_come_from_user_not_token(self):
+        """Test that role, staff and active changes apply before the token expires."""
+        self.student.is_staff = True
+        self.student.save()
+        token = self.access_token(self.student)
+        self.assertTrue(self.authenticate(token).is_staff)
+
+        self.student.is_staff = False
+        self.student.role = User.PARENT
+        self.student.save()
+        user = self.authenticate(token)
+        self.assertFalse(user.is_staff)
+        self.assertEqual(user.role, User.PARENT)
+
+        self.student.is_active = False
+        self.student.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+        self.student.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+    def test_me_endpoint(self):
+        """Test that the me endpoint serializes the full user."""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token(self.student)}')
+        response = client.get('/api/users/users/me/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['email'], 'student@test.com')
+        self.assertEqual(response.data['date_joined'][:10], self.student.date_joined.isoformat()[:10])
+
+
+class TokenRefreshTestCase(TestCase):
+    def setUp(self):
+        """Create a staff admin with a refresh token."""
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='admin123',
+            role=User.ADMIN,
+            is_staff=True
+        )
+        self.profile = AdminProfile.objects.create(user=self.admin)
+        self.refresh = str(ProfileRefreshToken.for_user(self.admin, profile_id=self.profile.id))
+
+    def refresh_access(self):
+        return self.client.post('/api/users/auth/refresh/', {'refresh': self.refresh}, format='json')
+
+    def test_refresh_reissues_claims_from_user(self):
+        """Test that a refreshed access token carries the user's current role and flags."""
+        self.admin.is_staff = False
+        self.admin.role = User.STUDENT
+        self.admin.save()
+        student_profile = StudentProfile.objects.create(user=self.admin)
+        response = self.refresh_access()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        access = AccessToken(response.data['access'])
+        self.assertEqual(access['role'], User.STUDENT)
+        self.assertFalse(access['is_staff'])
+        self.assertTrue(access['is_active'])
+        self.assertEqual(access['profile_id'], student_profile.id)
+
+    def test_refresh_refused_for_inactive_user(self):
+        """Test that a deactivated user cannot refresh."""
+        self.admin.is_active = False
+        self.admin.save()
+        self.assertEqual(self.refresh_access().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_refused_for_deleted_user(self):
+        """Test that a deleted user cannot refresh."""
+        self.admin.delete()
+        self.assertEqual(self.refresh_access().status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,137 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from achievements.models import Certificate
+from analytics.models import ProgressTracker
+from mentorship.models import MentorProfile, Session
+from projects.models import Project, StudentProjectSubmission
+from users.models import CorporatePartnerProfile, ParentProfile, StudentProfile
+from users.dashboard import VERSION_KEY
+
+User = get_user_model()
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ParentDashboardTestCase(TestCase):
+    def setUp(self):
+        """Create a parent, a mentor and a partner project."""
+        cache.clear()
+        self.client = APIClient()
+        self.parent_user = User.objects.create_user(
+            username='parent',
+            email='parent@test.com',
+            password='parent123',
+            role=User.PARENT
+        )
+        self.parent = ParentProfile.objects.create(user=self.parent_user)
+        partner_user = User.objects.create_user(
+            username='partner',
+            email='partner@test.com',
+            password='partner123',
+            role=User.CORPORATE_PARTNER
+        )
+        partner = CorporatePartnerProfile.objects.create(user=partner_user, company_name='Test Co')
+        self.mentor = MentorProfile.objects.create(user=partner)
+        self.projects = [Project.objects.create(title=f'Project {i}', created_by=partner) for i in range(7)]
+        self.client.force_authenticate(user=self.parent_user)
+
+    def add_child(self):
+        index = StudentProfile.objects.count()
+        user = User.objects.create_user(
+            username=f'child{index}',
+            email=f'child{index}@test.com',
+            password='child123',
+            first_name=f'Child {index}',
+            role=User.STUDENT
+        )
+        child = StudentProfile.objects.create(user=user)
+        self.parent.students.add(child)
+        now = timezone.now()
+        Session.objects.create(mentor=self.mentor, student=child, date_time=now - datetime.timedelta(days=1), duration=30)
+        for days in range(1, 8):
+            Session.objects.create(mentor=self.mentor, student=child, date_time=now + datetime.timedelta(days=days), duration=30)
+        for project in self.projects:
+            StudentProjectSubmission.objects.create(student=child, project=project)
+        ProgressTracker.objects.create(student=child, project=self.projects[0], progress_percent=20)
+        ProgressTracker.objects.create(student=child, project=self.projects[1], progress_percent=60)
+        Certificate.objects.create(title='New', issued_to=child, issue_date=now.date())
+        Certificate.objects.create(title='Old', issued_to=child, issue_date=now.date() - datetime.timedelta(days=400))
+        return child
+
+    def dashboard(self):
+        response = self.client.get(f'/api/users/parents/{self.parent.id}/dashboard/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_dashboard_sections(self):
+        """Test that each child gets bounded, filtered sections."""
+        child = self.add_child()
+        data = self.dashboard().data
+        self.assertEqual(data['parent'], self.parent.id)
+        [entry] = data['students']
+        self.assertEqual(entry['id'], child.id)
+        self.assertEqual(len(entry['upcoming_sessions']), 5)
+        now = timezone.now().isoformat()
+        self.assertTrue(all(session['date_time'] >= now[:10] for session in entry['upcoming_sessions']))
+        self.assertEqual(len(entry['recent_submissions']), 5)
+        self.assertEqual(len(entry['progress']), 2)
+        self.assertEqual(entry['average_progress'], '40.00')
+        self.assertEqual([c['title'] for c in entry['new_certificates']], ['New'])
+
+    def test_query_count_does_not_grow_with_children(self):
+        """Test that one and four children cost the same number of queries."""
+        self.add_child()
+        with CaptureQueriesContext(connection) as one:
+            self.dashboard()
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                self.add_child()
+        with CaptureQueriesContext(connection) as four:
+            response = self.dashboard()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data['students']), 4)
+        self.assertEqual(len(one), len(four))
+
+    def test_cached_until_child_data_changes(self):
+        """Test that a repeat is a cache hit and a child's new submission invalidates it."""
+        child = self.add_child()
+        self.dashboard()
+        self.assertEqual(self.dashboard()['X-Cache'], 'HIT')
+        with self.captureOnCommitCallbacks(execute=True):
+            StudentProjectSubmission.objects.filter(student=child).first().delete()
+        response = self.dashboard()
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+    def test_evicted_version_does_not_revive_old_dashboard(self):
+        """Test that a version key dropped by the cache does not serve the dashboard from before a change."""
+        child = self.add_child()
+        self.dashboard()
+        with self.captureOnCommitCallbacks(execute=True):
+            StudentProjectSubmission.objects.filter(student=child).first().delete()
+        cache.delete(VERSION_KEY.format(parent_id=self.parent.id))
+        self.assertEqual(self.dashboard()['X-Cache'], 'MISS')
+
+    def test_linking_a_child_invalidates(self):
+        """Test that linking another child rebuilds the dashboard."""
+        self.add_child()
+        self.dashboard()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_child()
+        response = self.dashboard()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data['students']), 2)
+
+    def test_other_parents_cannot_read_dashboard(self):
+        """Test that a parent cannot read another parent's dashboard."""
+        other = User.objects.create_user(username='other', email='other@test.com', password='x', role=User.PARENT)
+        ParentProfile.objects.create(user=other)
+        self.client.force_authenticate(user=other)
+        response = self.client.get(f'/api/users/parents/{self.parent.id}/dashboard/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,94 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from backend.counting import estimated_count
+
+User = get_user_model()
+
+
+class UserDirectoryTestCase(TestCase):
+    def setUp(self):
+        """Create an admin and users of several roles and states."""
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='admin123',
+            role=User.ADMIN,
+            is_staff=True
+        )
+        self.ada = User.objects.create_user(
+            username='ada',
+            email='ada@school.test',
+            password='x',
+            first_name='Ada',
+            last_name='Lovelace',
+            role=User.STUDENT,
+            is_verified=True
+        )
+        self.alan = User.objects.create_user(
+            username='alan',
+            email='turing@school.test',
+            password='x',
+            first_name='Alan',
+            last_name='Turing',
+            role=User.STUDENT
+        )
+        self.grace = User.objects.create_user(
+            username='grace',
+            email='grace@parents.test',
+            password='x',
+            first_name='Grace',
+            last_name='Hopper',
+            role=User.PARENT,
+            is_active=False
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def directory(self, query=''):
+        response = self.client.get(f'/api/users/users/directory/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_directory_is_paginated_with_count(self):
+        """Test that the directory is always paginated and reports the total."""
+        data = self.directory('?page_size=2')
+        self.assertEqual(data['count'], 4)
+        self.assertFalse(data['count_is_estimate'])
+        self.assertEqual([user['username'] for user in data['results']], ['grace', 'alan'])
+        next_page = self.client.get(data['next']).data
+        self.assertEqual([user['username'] for user in next_page['results']], ['ada', 'admin'])
+        self.assertIsNone(next_page['next'])
+
+    def test_filters(self):
+        """Test the role, is_verified and is_active filters."""
+        self.assertEqual(self.directory('?role=STUDENT')['count'], 2)
+        self.assertEqual([u['id'] for u in self.directory('?is_verified=true')['results']], [self.ada.id])
+        self.assertEqual([u['id'] for u in self.directory('?is_active=false')['results']], [self.grace.id])
+
+    def test_prefix_search(self):
+        """Test that q matches prefixes of email, username and names, case-insensitively."""
+        self.assertEqual([u['id'] for u in self.directory('?q=TUR')['results']], [self.alan.id])
+        self.assertEqual([u['id'] for u in self.directory('?q=hop')['results']], [self.grace.id])
+        self.assertEqual([u['id'] for u in self.directory('?q=ada+love')['results']], [self.ada.id])
+        self.assertEqual(self.directory('?q=ring')['count'], 0)
+
+    def test_invalid_filters_are_rejected(self):
+        """Test that unknown roles and non-boolean flags return 400."""
+        response = self.client.get('/api/users/users/directory/?role=WIZARD&is_active=maybe')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('role', response.data)
+        self.assertIn('is_active', response.data)
+
+    def test_directory_is_admin_only(self):
+        """Test that non-admin users cannot use the directory."""
+        self.client.force_authenticate(user=self.ada)
+        response = self.client.get('/api/users/users/directory/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_estimated_count_is_exact_off_postgres(self):
+        """Test that estimated_count counts exactly on other backends and short-circuits empty querysets."""
+        self.assertEqual(estimated_count(User.objects.filter(role=User.STUDENT)), (2, False))
+        with self.assertNumQueries(0):
+            self.assertEqual(estimated_count(User.objects.none()), (0, False))
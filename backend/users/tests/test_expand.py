@@ -0,0 +1,94 @@
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from achievements.models import Badge, Certificate, Skill
+from users.models import SchoolProfile, StudentProfile
+
+User = get_user_model()
+
+
+class StudentExpandTestCase(TestCase):
+    def setUp(self):
+        """Create a school whose students each hold a badge, a skill and a certificate."""
+        self.client = APIClient()
+        self.school_user = User.objects.create_user(
+            username='school',
+            email='school@test.com',
+            password='school123',
+            role=User.SCHOOL
+        )
+        self.school = SchoolProfile.objects.create(user=self.school_user, name='Test School')
+        self.skill = Skill.objects.create(name='Python', category='Programming')
+        self.badge = Badge.objects.create(name='First Project', skill=self.skill)
+        self.client.force_authenticate(user=self.school_user)
+
+    def add_students(self, count):
+        for _ in range(count):
+            index = StudentProfile.objects.count()
+            user = User.objects.create_user(
+                username=f'student{index}',
+                email=f'student{index}@test.com',
+                password='student123',
+                role=User.STUDENT
+            )
+            student = StudentProfile.objects.create(user=user, school=self.school)
+            student.badges.add(self.badge)
+            student.skills.add(self.skill)
+            student.certificates.add(Certificate.objects.create(
+                title=f'Certificate {index}', issued_to=student, issue_date=datetime.date(2024, 1, 1),
+            ))
+
+    def list_students(self, query=''):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/users/students/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data, len(queries)
+
+    def test_query_count_does_not_grow_with_students(self):
+        """Test that listing students costs the same number of queries for 2 and 10 rows."""
+        for query in ('', '?expand=badges,skills,certificates'):
+            self.add_students(2)
+            _, few = self.list_students(query)
+            self.add_students(8)
+            results, many = self.list_students(query)
+            self.assertEqual(len(results), StudentProfile.objects.count())
+            self.assertEqual(few, many, query)
+
+    def test_ids_without_expand(self):
+        """Test that relations are primary keys unless expanded."""
+        self.add_students(1)
+        results, _ = self.list_students()
+        self.assertEqual(results[0]['badges'], [self.badge.id])
+        self.assertEqual(results[0]['skills'], [self.skill.id])
+
+    def test_expand_nests_requested_relations(self):
+        """Test that only the relations named in expand are nested."""
+        self.add_students(1)
+        results, _ = self.list_students('?expand=badges,skills')
+        self.assertEqual(results[0]['badges'][0]['name'], 'First Project')
+        self.assertEqual(results[0]['badges'][0]['skill'], self.skill.id)
+        self.assertEqual(results[0]['skills'][0]['category'], 'Programming')
+        self.assertIsInstance(results[0]['certificates'][0], int)
+
+    def test_unknown_expand_is_rejected(self):
+        """Test that expanding an unknown relation returns 400."""
+        response = self.client.get('/api/users/students/?expand=parents')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('expand', response.data)
+
+    def test_writes_accept_ids_with_expand(self):
+        """Test that expand does not change what an update accepts."""
+        self.add_students(1)
+        student = StudentProfile.objects.get()
+        self.client.force_authenticate(user=student.user)
+        response = self.client.patch(
+            f'/api/users/students/{student.id}/?expand=badges', {'skills': []}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['skills'], [])
+        self.assertEqual(response.data['badges'], [self.badge.id])
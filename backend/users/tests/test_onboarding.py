@@ -0,0 +1,129 @@
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth.hashers import check_password
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.hashing import PARALLEL_MIN_PASSWORDS, get_hash_pool, hash_passwords
+from users.models import SchoolProfile, StudentProfile
+
+User = get_user_model()
+
+
+class BulkOnboardingTestCase(TestCase):
+    def setUp(self):
+        """Create two schools and an existing student."""
+        self.client = APIClient()
+        self.school_user = User.objects.create_user(
+            username='school',
+            email='school@test.com',
+            password='school123',
+            role=User.SCHOOL
+        )
+        self.school = SchoolProfile.objects.create(user=self.school_user, name='Test School')
+        other_user = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password='other123',
+            role=User.SCHOOL
+        )
+        self.other_school = SchoolProfile.objects.create(user=other_user, name='Other School')
+        User.objects.create_user(
+            username='existing',
+            email='existing@test.com',
+            password='existing123',
+            role=User.STUDENT
+        )
+        self.url = f'/api/users/schools/{self.school.id}/students/bulk/'
+
+    def test_json_onboarding(self):
+        """Test that students and profiles are created in the school."""
+        self.client.force_authenticate(user=self.school_user)
+        response = self.client.post(self.url, [
+            {'email': 'a@test.com', 'password': 'pass-a', 'first_name': 'Ada'},
+            {'email': 'b@test.com', 'password': 'pass-b', 'username': 'bee'},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([row['row'] for row in response.data['created']], [1, 2])
+
+        ada = User.objects.get(email='a@test.com')
+        self.assertEqual((ada.username, ada.first_name, ada.role), ('a', 'Ada', User.STUDENT))
+        self.assertTrue(ada.check_password('pass-a'))
+        self.assertEqual(StudentProfile.objects.get(user=ada).school, self.school)
+        self.assertEqual(response.data['created'][0]['profile_id'], ada.student_profile.id)
+        self.assertTrue(User.objects.filter(username='bee').exists())
+
+    def test_csv_upload(self):
+        """Test that an uploaded CSV file is onboarded."""
+        self.client.force_authenticate(user=self.school_user)
+        content = 'Email,Password,First_Name\nc@test.com,pass-c,Cy\nd@test.com,pass-d,Di\n'
+        upload = SimpleUploadedFile('year7.csv', content.encode(), content_type='text/csv')
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.school.students.count(), 2)
+
+    def test_invalid_rows_create_nothing(self):
+        """Test that every invalid row is reported and no student is created."""
+        self.client.force_authenticate(user=self.school_user)
+        response = self.client.post(self.url, {'students': [
+            {'email': 'ok@test.com', 'password': 'pass'},
+            {'email': 'existing@test.com', 'password': 'pass'},
+            {'email': 'ok@test.com', 'password': 'pass', 'username': 'ok2'},
+            {'email': 'not-an-email', 'password': ''},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {error['row']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(sorted(errors), [2, 3, 4])
+        self.assertIn('already exists', errors[2]['email'][0])
+        self.assertIn('already taken', errors[2]['username'][0])
+        self.assertIn('Duplicate of row 1', errors[3]['email'][0])
+        self.assertIn('password', errors[4])
+        self.assertFalse(User.objects.filter(email='ok@test.com').exists())
+
+    def test_other_school_forbidden(self):
+        """Test that a school cannot onboard students into another school."""
+        self.client.force_authenticate(user=self.school_user)
+        response = self.client.post(
+            f'/api/users/schools/{self.other_school.id}/students/bulk/',
+            [{'email': 'x@test.com', 'password': 'pass'}], format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(User.objects.filter(email='x@test.com').exists())
+
+    def test_management_command(self):
+        """Test that the command onboards a JSON file and rejects invalid ones."""
+        path = self.make_file('students.json', json.dumps([{'email': 'e@test.com', 'password': 'pass-e'}]))
+        call_command('onboard_students', path, school=self.school.id, stdout=io.StringIO())
+        self.assertTrue(self.school.students.filter(user__email='e@test.com').exists())
+
+        with self.assertRaises(CommandError):
+            call_command('onboard_students', path, school=self.school.id, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def test_parallel_hashing(self):
+        """Test that hashes from the process pool verify in this process."""
+        passwords = [f'password-{i}' for i in range(PARALLEL_MIN_PASSWORDS)]
+        hashes = hash_passwords(passwords, workers=2)
+        self.assertEqual(len(hashes), len(passwords))
+        self.assertTrue(check_password(passwords[0], hashes[0]))
+        self.assertTrue(check_password(passwords[-1], hashes[-1]))
+
+    def test_shared_hashing_pool(self):
+        """Test that uploads without a worker count share one process pool."""
+        self.assertIs(get_hash_pool(), get_hash_pool())
+        passwords = [f'password-{i}' for i in range(PARALLEL_MIN_PASSWORDS)]
+        hashes = hash_passwords(passwords)
+        self.assertTrue(check_password(passwords[0], hashes[0]))
+
+    def make_file(self, name, content):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, name)
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        return path
@@ -0,0 +1,73 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from backend.profiling import registry
+from users.models import ParentProfile, SchoolProfile, StudentProfile
+
+User = get_user_model()
+
+
+@override_settings(PERF_PROFILER={'ENABLED': True, 'N_PLUS_ONE_THRESHOLD': 3})
+class QueryProfilerTestCase(TestCase):
+    def setUp(self):
+        """Create an admin, a school with several students and several parents."""
+        self.client = APIClient()
+        registry.reset()
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='admin123',
+            role=User.ADMIN,
+            is_staff=True
+        )
+        school_user = User.objects.create_user(
+            username='school',
+            email='school@test.com',
+            password='school123',
+            role=User.SCHOOL
+        )
+        school = SchoolProfile.objects.create(user=school_user, name='Test School')
+        for i in range(4):
+            user = User.objects.create_user(
+                username=f'student{i}',
+                email=f'student{i}@test.com',
+                password='student123',
+                role=User.STUDENT
+            )
+            StudentProfile.objects.create(user=user, school=school)
+            parent = User.objects.create_user(
+                username=f'parent{i}',
+                email=f'parent{i}@test.com',
+                password='parent123',
+                role=User.PARENT
+            )
+            ParentProfile.objects.create(user=parent)
+
+    def test_records_endpoint_and_flags_repeated_queries(self):
+        """Test that per-parent M2M lookups are reported as repeated query shapes."""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get('/api/users/parents/')
+        response = self.client.get('/api/_perf/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.data['endpoints']['users.ParentProfileViewSet.list']
+        self.assertEqual(stats['requests'], 1)
+        self.assertGreater(stats['avg_queries'], 0)
+        self.assertEqual(stats['n_plus_one_requests'], 1)
+        self.assertGreaterEqual(stats['last_repeated_queries'][0]['count'], 4)
+        self.assertNotIn('backend._perf', response.data['endpoints'])
+
+    def test_prefetched_list_is_not_flagged(self):
+        """Test that the prefetched student list is not reported as N+1."""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get('/api/users/students/')
+        response = self.client.get('/api/_perf/')
+        stats = response.data['endpoints']['users.StudentProfileViewSet.list']
+        self.assertEqual(stats['n_plus_one_requests'], 0)
+
+    def test_stats_are_admin_only(self):
+        """Test that non-admin users cannot read profiler stats."""
+        student = User.objects.get(username='student0')
+        self.client.force_authenticate(user=student)
+        response = self.client.get('/api/_perf/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
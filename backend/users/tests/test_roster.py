@@ -0,0 +1,114 @@
+import datetime
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from achievements.models import Certificate
+from analytics.models import EngagementLog, ProgressTracker
+from projects.models import Project, StudentProjectSubmission
+from users.models import CorporatePartnerProfile, SchoolProfile, StudentProfile
+
+User = get_user_model()
+
+
+class SchoolRosterTestCase(TestCase):
+    def setUp(self):
+        """Create a school, a partner with three projects and a helper to add students."""
+        self.client = APIClient()
+        self.school_user = User.objects.create_user(
+            username='school',
+            email='school@test.com',
+            password='school123',
+            role=User.SCHOOL
+        )
+        self.school = SchoolProfile.objects.create(user=self.school_user, name='Test School')
+        partner_user = User.objects.create_user(
+            username='partner',
+            email='partner@test.com',
+            password='partner123',
+            role=User.CORPORATE_PARTNER
+        )
+        partner = CorporatePartnerProfile.objects.create(user=partner_user, company_name='Test Co')
+        self.projects = [Project.objects.create(title=f'Project {i}', created_by=partner) for i in range(3)]
+        self.client.force_authenticate(user=self.school_user)
+
+    def add_student(self, last_name, school=None):
+        index = StudentProfile.objects.count()
+        user = User.objects.create_user(
+            username=f'student{index}',
+            email=f'student{index}@test.com',
+            password='student123',
+            first_name='Student',
+            last_name=last_name,
+            role=User.STUDENT
+        )
+        return StudentProfile.objects.create(user=user, school=school or self.school)
+
+    def roster(self, query=''):
+        response = self.client.get(f'/api/users/schools/{self.school.id}/roster/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_roster_summary(self):
+        """Test the per-student counts, average progress, certificates and last activity."""
+        busy = self.add_student('Busy')
+        idle = self.add_student('Idle')
+        for project, state in zip(self.projects, ['SUBMITTED', 'APPROVED', 'APPROVED']):
+            StudentProjectSubmission.objects.create(student=busy, project=project, status=state)
+        ProgressTracker.objects.create(student=busy, project=self.projects[0], progress_percent=40)
+        ProgressTracker.objects.create(student=busy, project=self.projects[1], progress_percent=90)
+        for i in range(2):
+            Certificate.objects.create(title=f'Cert {i}', issued_to=busy, issue_date=datetime.date(2024, 1, 1))
+        log = EngagementLog.objects.create(user=busy.user, action_type='login')
+
+        rows = {row['id']: row for row in self.roster()}
+        self.assertEqual(rows[busy.id]['submissions'], {'SUBMITTED': 1, 'REVIEWED': 0, 'APPROVED': 2, 'total': 3})
+        self.assertEqual(Decimal(rows[busy.id]['average_progress']), Decimal('65.00'))
+        self.assertEqual(rows[busy.id]['certificate_count'], 2)
+        self.assertEqual(rows[busy.id]['last_activity'][:19], log.timestamp.isoformat()[:19])
+        self.assertEqual(rows[busy.id]['user']['last_name'], 'Busy')
+        self.assertEqual(rows[idle.id]['submissions']['total'], 0)
+        self.assertIsNone(rows[idle.id]['average_progress'])
+        self.assertEqual(rows[idle.id]['certificate_count'], 0)
+        self.assertIsNone(rows[idle.id]['last_activity'])
+
+    def test_query_count_does_not_grow_with_students(self):
+        """Test that the roster costs the same number of queries for 2 and 10 students."""
+        def measure():
+            with CaptureQueriesContext(connection) as queries:
+                self.roster()
+            return len(queries)
+
+        for _ in range(2):
+            student = self.add_student('Early')
+            StudentProjectSubmission.objects.create(student=student, project=self.projects[0])
+        few = measure()
+        for _ in range(8):
+            student = self.add_student('Late')
+            ProgressTracker.objects.create(student=student, progress_percent=10)
+        self.assertEqual(measure(), few)
+
+    def test_roster_keyset_pagination(self):
+        """Test that the roster pages through students in name order."""
+        for name in ['Cole', 'Adams', 'Baker', 'Diaz']:
+            self.add_student(name)
+        self.add_student('Other', school=SchoolProfile.objects.create(
+            user=User.objects.create_user(username='other', email='other@test.com', password='x', role=User.SCHOOL),
+            name='Other School',
+        ))
+        first = self.roster('?page_size=3')
+        self.assertEqual([row['user']['last_name'] for row in first['results']], ['Adams', 'Baker', 'Cole'])
+        second = self.client.get(first['next']).data
+        self.assertEqual([row['user']['last_name'] for row in second['results']], ['Diaz'])
+
+    def test_other_schools_cannot_read_roster(self):
+        """Test that a school cannot read another school's roster."""
+        other = User.objects.create_user(username='other', email='other@test.com', password='x', role=User.SCHOOL)
+        SchoolProfile.objects.create(user=other, name='Other School')
+        self.client.force_authenticate(user=other)
+        response = self.client.get(f'/api/users/schools/{self.school.id}/roster/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
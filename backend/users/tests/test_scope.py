@@ -0,0 +1,87 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import status
+from users.models import ParentProfile, SchoolProfile, StudentProfile
+from users.scope import AccessScope, get_scope
+from users.tokens import ProfileRefreshToken
+
+User = get_user_model()
+
+
+class AccessScopeTestCase(TestCase):
+    def setUp(self):
+        """Create a school with three students, two of them linked to a parent."""
+        self.client = APIClient()
+        school_user = User.objects.create_user(
+            username='school',
+            email='school@test.com',
+            password='school123',
+            role=User.SCHOOL
+        )
+        self.school_user = school_user
+        self.school = SchoolProfile.objects.create(user=school_user, name='Test School')
+        self.students = []
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f'student{i}',
+                email=f'student{i}@test.com',
+                password='student123',
+                role=User.STUDENT
+            )
+            self.students.append(StudentProfile.objects.create(user=user, school=self.school if i < 2 else None))
+        self.parent_user = User.objects.create_user(
+            username='parent',
+            email='parent@test.com',
+            password='parent123',
+            role=User.PARENT
+        )
+        self.parent = ParentProfile.objects.create(user=self.parent_user)
+        self.parent.students.add(self.students[0], self.students[2])
+
+    def test_student_ids_per_role(self):
+        """Test the visible student set of each role."""
+        self.assertEqual(AccessScope(self.parent_user).student_ids, {self.students[0].id, self.students[2].id})
+        self.assertEqual(AccessScope(self.school_user).student_ids, {self.students[0].id, self.students[1].id})
+        self.assertEqual(AccessScope(self.students[1].user).student_ids, {self.students[1].id})
+        admin = User.objects.create_user(username='admin', email='admin@test.com', password='x', role=User.ADMIN)
+        self.assertIsNone(AccessScope(admin).student_ids)
+
+    def test_scope_is_memoized_and_uses_token_claims(self):
+        """Test that the scope is built once per request and takes profile_id from the token."""
+        token = ProfileRefreshToken.for_user(self.parent_user, profile_id=self.parent.id).access_token
+        request = APIRequestFactory().get('/')
+        request.user, request.auth = self.parent_user, token
+        with self.assertNumQueries(0):
+            scope = get_scope(request)
+            self.assertIs(get_scope(request), scope)
+            self.assertEqual(scope.profile_id, self.parent.id)
+
+    def test_parent_detail_queries_do_not_grow_with_linked_students(self):
+        """Test that a parent's detail request does not load every linked student."""
+        self.client.force_authenticate(user=self.parent_user)
+        url = f'/api/users/students/{self.students[0].id}/'
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.client.get(f'/api/users/students/{self.students[1].id}/').status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for i in range(5):
+            user = User.objects.create_user(username=f'extra{i}', email=f'extra{i}@test.com', password='x')
+            self.parent.students.add(StudentProfile.objects.create(user=user))
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(url)
+        self.assertEqual(len(many), len(few))
+
+    def test_school_sees_only_its_students(self):
+        """Test that list and detail for a school follow the scope."""
+        self.client.force_authenticate(user=self.school_user)
+        response = self.client.get('/api/users/students/')
+        self.assertEqual(sorted(row['id'] for row in response.json()), [self.students[0].id, self.students[1].id])
+        response = self.client.get(f'/api/users/students/{self.students[2].id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,64 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .scope import AccessScope
+from .user_cache import get_user
+
+
+def set_user_claims(token, user, profile_id=None):
+    """Write the user's role, profile id and status flags into ``token``."""
+    token['role'] = user.role
+    token['profile_id'] = profile_id
+    token['is_staff'] = user.is_staff
+    token['is_active'] = user.is_active
+
+
+class ProfileRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the user's role, profile id and status flags.
+
+    The claims are copied into the access tokens derived from it. At
+    ``auth/refresh/`` they are first re-read from the user (see
+    ``ProfileTokenRefreshSerializer``), so a refresh never carries stale flags.
+    """
+
+    @classmethod
+    def for_user(cls, user, profile_id=None):
+        token = super().for_user(user)
+        set_user_claims(token, user, profile_id)
+        return token
+
+
+class ProfileTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    ``auth/refresh/`` serializer that re-issues the claims from the user.
+
+    The user is loaded through the user cache and refused when it no longer
+    exists or is inactive; otherwise role, flags and profile id are set from
+    its current values before the access token is derived.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user = get_user(refresh[api_settings.USER_ID_CLAIM])
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        set_user_claims(refresh, user, AccessScope(user).profile_id)
+
+        data = {'access': str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    pass
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
@@ -10,6 +10,8 @@ from .views import (
     AdminProfileViewSet,
 )
 from .auth_views import login, register
+from .tokens import ProfileTokenRefreshSerializer
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'users', UserViewSet)
@@ -23,8 +25,10 @@ urlpatterns = [
     # Authentication endpoints (at /api/users/auth/...)
     path('auth/login/', login, name='login'),
     path('auth/register/', register, name='register'),
-    path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('auth/refresh/', TokenRefreshView.as_view(serializer_class=ProfileTokenRefreshSerializer), name='token_refresh'),
     path('auth/verify/', TokenVerifyView.as_view(), name='token_verify'),
+    # Async read endpoints (served without blocking under ASGI)
+    path('async/me/', async_views.me, name='async-me'),
     # App routes
     path('', include(router.urls)),
 ]
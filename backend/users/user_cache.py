@@ -0,0 +1,81 @@
+"""
+Per-process TTL/LRU cache of full ``User`` rows.
+
+Requests authenticated from JWT claims (see ``users.authentication``) take
+the user's role and flags from this cache and load any other field through it
+when read, instead of querying on every request.
+
+Entries are dropped on ``User`` save/delete in this process. Other gunicorn
+workers keep their copy until ``USER_CACHE['TTL']`` expires, so the TTL
+bounds how stale a cached row can get.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+# Bumped by every invalidation so a fetch racing with a save is not cached
+_generation = 0
+
+
+def _config():
+    config = getattr(settings, 'USER_CACHE', {})
+    return config.get('TTL', 300), config.get('MAX_SIZE', 10000)
+
+
+def get_user(user_id):
+    """
+    The ``User`` with ``user_id``, or None if it does not exist. Returns a
+    copy, so callers may modify it without affecting other requests.
+    """
+    from .models import User
+
+    ttl, max_size = _config()
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            _entries.move_to_end(user_id)
+            return copy.copy(entry[1])
+        generation = _generation
+
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or ttl <= 0:
+        return user
+    with _lock:
+        if generation == _generation:
+            _entries[user_id] = (now + ttl, user)
+            _entries.move_to_end(user_id)
+            while len(_entries) > max_size:
+                _entries.popitem(last=False)
+    return copy.copy(user)
+
+
+def invalidate(user_id):
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.pop(user_id, None)
+
+
+def clear():
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
+
+
+def _on_change(sender, instance, **kwargs):
+    invalidate(instance.pk)
+
+
+def connect_signals(*models):
+    for model in models:
+        uid = f'user-cache:{model._meta.label_lower}'
+        post_save.connect(_on_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_change, sender=model, dispatch_uid=uid)
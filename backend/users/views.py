@@ -1,4 +1,6 @@
-from rest_framework import viewsets
+import os
+
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
@@ -14,7 +16,9 @@ from .serializers import (
     UserSerializer,
     StudentProfileSerializer,
     ParentProfileSerializer,
+    ParentDashboardStudentSerializer,
     SchoolProfileSerializer,
+    SchoolRosterSerializer,
     CorporatePartnerProfileSerializer,
     AdminProfileSerializer,
 )
@@ -25,6 +29,14 @@ from .permissions import (
     IsCorporatePartnerProfileOwner,
     IsSchoolProfileOwner,
 )
+from .scope import get_scope
+from .directory import filter_directory
+from .roster import roster_queryset
+from .dashboard import dashboard_students, get_dashboard
+from achievements.models import Badge, Certificate, Skill
+from backend.expansion import ExpandMixin
+from backend.pagination import CountedKeysetPagination
+from .onboarding import onboard_students, parse_rows
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -36,9 +48,10 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         Users can only see their own user object, admins can see all.
         """
-        if self.request.user.is_staff or self.request.user.role == User.ADMIN:
+        scope = get_scope(self.request)
+        if scope.is_admin:
             return User.objects.all().order_by('-date_joined')
-        return User.objects.filter(id=self.request.user.id)
+        return User.objects.filter(id=scope.user_id)
 
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -48,11 +61,31 @@ class UserViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(request.user)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], pagination_class=CountedKeysetPagination)
+    def directory(self, request):
+        """
+        Admin user directory, newest first and always paginated, with
+        ``?role=``, ``?is_verified=``, ``?is_active=`` filters and ``?q=``
+        prefix search (see users/directory.py). ``count`` is a planner
+        estimate on large PostgreSQL tables.
+        """
+        if not get_scope(request).is_admin:
+            self.permission_denied(request)
+        queryset = filter_directory(User.objects.order_by('-date_joined'), request.query_params)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
 
-class StudentProfileViewSet(viewsets.ModelViewSet):
+class StudentProfileViewSet(ExpandMixin, viewsets.ModelViewSet):
     queryset = StudentProfile.objects.all()
     serializer_class = StudentProfileSerializer
     permission_classes = [IsStudentOwner]
+    expandable_prefetches = {
+        'badges': Badge.objects.all(),
+        'certificates': Certificate.objects.all(),
+        'skills': Skill.objects.all(),
+    }
 
     def get_queryset(self):
         """
@@ -61,32 +94,11 @@ class StudentProfileViewSet(viewsets.ModelViewSet):
         Admins can see all students.
         Schools can see their students.
         """
-        user = self.request.user
-        
-        # Admins can see all
-        if user.is_staff or user.role == User.ADMIN:
-            return StudentProfile.objects.all()
-        
-        # Students can only see their own profile
-        if user.role == User.STUDENT:
-            return StudentProfile.objects.filter(user=user)
-        
-        # Parents can see their linked students
-        if user.role == User.PARENT:
-            parent_profile = getattr(user, 'parent_profile', None)
-            if parent_profile:
-                return parent_profile.students.all()
-            return StudentProfile.objects.none()
-        
-        # Schools can see their students
-        if user.role == User.SCHOOL:
-            school_profile = getattr(user, 'school_profile', None)
-            if school_profile:
-                return school_profile.students.all()
-            return StudentProfile.objects.none()
-        
-        # Corporate partners and others cannot access student profiles
-        return StudentProfile.objects.none()
+        # Filtered by the caller's profile id from the request's access scope,
+        # so no profile lookup is needed here. Corporate partners and others
+        # get no student profiles. Badges, certificates and skills are
+        # prefetched (ids only unless ?expand= names them).
+        return self.prefetch_expandable(get_scope(self.request).filter_students(StudentProfile.objects.all()))
 
 
 class ParentProfileViewSet(viewsets.ModelViewSet):
@@ -99,19 +111,38 @@ class ParentProfileViewSet(viewsets.ModelViewSet):
         Parents can only see their own profile.
         Admins can see all parent profiles.
         """
-        user = self.request.user
+        scope = get_scope(self.request)
         
         # Admins can see all
-        if user.is_staff or user.role == User.ADMIN:
+        if scope.is_admin:
             return ParentProfile.objects.all()
         
         # Parents can only see their own profile
-        if user.role == User.PARENT:
-            return ParentProfile.objects.filter(user=user)
+        if scope.role == User.PARENT:
+            return ParentProfile.objects.filter(user_id=scope.user_id)
         
         # Others cannot access parent profiles
         return ParentProfile.objects.none()
 
+    @action(detail=True, methods=['get'])
+    def dashboard(self, request, pk=None):
+        """
+        Every linked child's upcoming sessions, recent submissions, progress
+        and new certificates in one response, built in a fixed number of
+        queries and cached per parent (see users/dashboard.py).
+        """
+        data, hit = get_dashboard(self.get_object(), self._build_dashboard)
+        response = Response(data)
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+
+    def _build_dashboard(self, parent):
+        students = dashboard_students(parent)
+        return {
+            'parent': parent.id,
+            'students': ParentDashboardStudentSerializer(students, many=True).data,
+        }
+
 
 class SchoolProfileViewSet(viewsets.ModelViewSet):
     queryset = SchoolProfile.objects.all()
@@ -123,19 +154,64 @@ class SchoolProfileViewSet(viewsets.ModelViewSet):
         Schools can only see their own profile.
         Admins can see all school profiles.
         """
-        user = self.request.user
+        scope = get_scope(self.request)
         
         # Admins can see all
-        if user.is_staff or user.role == User.ADMIN:
+        if scope.is_admin:
             return SchoolProfile.objects.all()
         
         # Schools can only see their own profile
-        if user.role == User.SCHOOL:
-            return SchoolProfile.objects.filter(user=user)
+        if scope.role == User.SCHOOL:
+            return SchoolProfile.objects.filter(user_id=scope.user_id)
         
         # Others cannot access school profiles
         return SchoolProfile.objects.none()
 
+    @action(detail=True, methods=['post'], url_path='students/bulk')
+    def bulk_students(self, request, pk=None):
+        """
+        Onboard many students into this school at once.
+
+        Accepts a JSON list of students (or ``{"students": [...]}``), or an
+        uploaded ``file`` in CSV or JSON. Each student has ``email`` and
+        ``password``, and optionally ``username``, ``first_name`` and
+        ``last_name``. If any row is invalid nothing is created and the
+        errors are returned per row.
+        """
+        school = self.get_object()
+        upload = request.FILES.get('file')
+        try:
+            if upload is not None:
+                fmt = os.path.splitext(upload.name)[1].lstrip('.').lower() or 'csv'
+                rows = parse_rows(upload.read(), fmt)
+            elif isinstance(request.data, list):
+                rows = request.data
+            else:
+                rows = request.data.get('students')
+                if not isinstance(rows, list):
+                    raise ValueError('Send a list of students or upload a CSV/JSON file as "file".')
+        except ValueError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        created, errors = onboard_students(school, rows)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'created': created}, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'])
+    def roster(self, request, pk=None):
+        """
+        The school's students with submission counts per status, average
+        progress, certificate count and last activity, ordered by name.
+        Computed in a single query (see users/roster.py); paginate with
+        ``?page_size=`` / ``?cursor=``.
+        """
+        queryset = roster_queryset(self.get_object())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(SchoolRosterSerializer(page, many=True).data)
+        return Response(SchoolRosterSerializer(queryset, many=True).data)
+
 
 class CorporatePartnerProfileViewSet(viewsets.ModelViewSet):
     queryset = CorporatePartnerProfile.objects.all()
@@ -147,15 +223,15 @@ class CorporatePartnerProfileViewSet(viewsets.ModelViewSet):
         Corporate partners can only see their own profile.
         Admins can see all corporate partner profiles.
         """
-        user = self.request.user
+        scope = get_scope(self.request)
         
         # Admins can see all
-        if user.is_staff or user.role == User.ADMIN:
+        if scope.is_admin:
             return CorporatePartnerProfile.objects.all()
         
         # Corporate partners can only see their own profile
-        if user.role == User.CORPORATE_PARTNER:
-            return CorporatePartnerProfile.objects.filter(user=user)
+        if scope.role == User.CORPORATE_PARTNER:
+            return CorporatePartnerProfile.objects.filter(user_id=scope.user_id)
         
         # Others cannot access corporate partner profiles
         return CorporatePartnerProfile.objects.none()
@@ -170,10 +246,8 @@ class AdminProfileViewSet(viewsets.ModelViewSet):
         """
         Only admins can access admin profiles.
         """
-        user = self.request.user
-        
         # Only admins can see admin profiles
-        if user.is_staff or user.role == User.ADMIN:
+        if get_scope(self.request).is_admin:
             return AdminProfile.objects.all()
         
         # Others cannot access admin profiles